@@ -0,0 +1,82 @@
+"""
+Benchmark for Batch.as_done(). Measures the delay between an outcome's future resolving and
+Batch.as_done() yielding that outcome.
+
+The futures are resolved by a background thread at random times spread over --spread seconds,
+so the numbers reflect only the client-side cost of noticing a result, not the RPC server.
+With --legacy the same batch is also consumed with the previous re-scan and sleep(2) loop.
+
+usage: python bench_as_done.py [--tasks N] [--spread SECONDS] [--legacy]
+"""
+import argparse
+import random
+import threading
+from concurrent.futures import Future
+from time import monotonic, sleep
+
+from automanpy.core.batchjob import Batch
+from automanpy.core.outcomes import EstimateOutcome
+from automanpy.core.automanlib_rpc_pb2 import TaskResponse, AutomanOutcome
+from automanpy.core.grpc_classes.automanlib_classes_pb2 import EstimateOutcome as EstimateOutcomeMsg, ValueOutcome, CONFIDENT
+
+RESPONSE = TaskResponse(return_code = TaskResponse.VALID,
+						outcome = AutomanOutcome(estimate_outcome = EstimateOutcomeMsg(answer = ValueOutcome(est = 1.0, low = 0.0, high = 2.0, cost = 1.0, conf = 0.95),
+																						outcome_type = CONFIDENT)))
+
+def make_batch(n_tasks):
+	futures = [Future() for _ in range(n_tasks)]
+	return futures, Batch([EstimateOutcome(future_tr = f) for f in futures])
+
+def resolve_later(futures, spread, resolved_at):
+	schedule = sorted((random.uniform(0, spread), i) for i in range(len(futures)))
+	start = monotonic()
+	for at, i in schedule:
+		delay = start + at - monotonic()
+		if delay > 0:
+			sleep(delay)
+		resolved_at[i] = monotonic()
+		futures[i].set_result(RESPONSE)
+
+def legacy_as_done(batch):
+	outcomes_ = batch.outcomes.copy()
+	while outcomes_:
+		for i, outcome in enumerate(outcomes_):
+			if outcome.isDone():
+				outcome.done()
+				yield outcomes_.pop(i)
+		sleep(2)
+
+def run(n_tasks, spread, consume):
+	futures, batch = make_batch(n_tasks)
+	index = dict((id(o), i) for i, o in enumerate(batch.outcomes))
+	resolved_at = [None] * n_tasks
+	resolver = threading.Thread(target = resolve_later, args = (futures, spread, resolved_at))
+	start = monotonic()
+	resolver.start()
+	delays = []
+	for outcome in consume(batch):
+		delays.append(monotonic() - resolved_at[index[id(outcome)]])
+	wall = monotonic() - start
+	resolver.join()
+	delays.sort()
+	return {
+		'tasks': n_tasks,
+		'wall_s': wall,
+		'p50_ms': 1000 * delays[len(delays) // 2],
+		'p99_ms': 1000 * delays[min(len(delays) - 1, int(len(delays) * 0.99))],
+		'max_ms': 1000 * delays[-1],
+	}
+
+def report(name, r):
+	print("%-10s tasks=%-7d wall=%7.2fs  p50=%9.3fms  p99=%9.3fms  max=%9.3fms" % (name, r['tasks'], r['wall_s'], r['p50_ms'], r['p99_ms'], r['max_ms']))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 10000)
+	parser.add_argument('--spread', type = float, default = 5.0)
+	parser.add_argument('--legacy', action = 'store_true', help = 'also run the previous polling implementation')
+	args = parser.parse_args()
+
+	report('as_done', run(args.tasks, args.spread, lambda b: b.as_done()))
+	if args.legacy:
+		report('legacy', run(args.tasks, args.spread, legacy_as_done))
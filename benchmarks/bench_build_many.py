@@ -0,0 +1,55 @@
+"""
+Benchmark for building many tasks. Builds --tasks estimate tasks that differ in their text and image_url,
+and share every other argument, in two ways:
+
+	per_task 	one call to the builder of estimate() per task, checking every argument of every task
+	columns 	the builder of estimate_many(), checking each argument once, and copying a prototype task
+				once per task
+
+and reports the time each takes per task, the best of --repeat runs. Only the tasks are built: nothing
+is submitted, and the stand-in server is only started for the Automan object's constructor.
+
+usage: python bench_build_many.py [--tasks N] [--repeat R] [--port PORT]
+"""
+import argparse
+from time import perf_counter
+
+from automanpy.automan import Automan
+
+from standin_server import start_process
+
+SHARED = {"budget" : 1.50, "title" : "Car Counting", "confidence" : 0.9, "wage" : 11.0}
+
+def per_task(a, texts, urls):
+	return [a._make_estimate_task(text = text, image_url = url, **SHARED) for text, url in zip(texts, urls)]
+
+def columns(a, texts, urls):
+	shared = dict(SHARED)
+	return a._build_many('estimate', dict(text = texts, budget = shared.pop('budget'), image_url = urls, title = shared.pop('title')), shared)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 50000)
+	parser.add_argument('--repeat', type = int, default = 5)
+	parser.add_argument('--port', type = int, default = 50075)
+	args = parser.parse_args()
+
+	texts = ["task-%d: how many cars are in this parking lot?" % i for i in range(args.tasks)]
+	urls = ["https://example.com/lots/%d.jpg" % i for i in range(args.tasks)]
+	proc = start_process(args.port)
+	try:
+		a = Automan({"type" : "mock"}, port = args.port, testmode = True)
+		results = {}
+		for build in [per_task, columns]:
+			best = None
+			for _ in range(args.repeat):
+				start = perf_counter()
+				built = build(a, texts, urls)
+				elapsed = perf_counter() - start
+				best = elapsed if best is None else min(best, elapsed)
+				del built
+			results[build.__name__] = best / args.tasks * 1e6
+			print("%-9s tasks=%-7d %7.2f us/task" % (build.__name__, args.tasks, results[build.__name__]))
+		print("speedup   %.1fx" % (results['per_task'] / results['columns']))
+	finally:
+		proc.kill()
@@ -0,0 +1,68 @@
+"""
+Benchmark for Automan(channels=N). Submits tasks from many threads at once, and compares the
+throughput of posting them over one gRPC channel with spreading them over a pool of channels,
+each with its own connection, against the stand-in server running in a separate process.
+
+For each number of channels and of submitting threads it reports the rate tasks were posted at,
+until every thread had submitted its tasks, and the rate they were resolved at.
+
+usage: python bench_channels.py [--tasks N] [--threads 1,8,32] [--channels 1,2,4,8]
+			[--policy round_robin|least_loaded] [--port PORT]
+"""
+import argparse
+import threading
+from time import monotonic
+
+from automanpy.automan import Automan
+from automanpy.core.batchjob import Batch
+
+from standin_server import start_process
+
+ADAPTER = {"type" : "mock", "seed" : 1, "answers_per_task" : 5}
+
+def run(a, n_tasks, n_threads):
+	"""
+	Submits n_tasks estimate tasks, split over n_threads threads started together, and returns the
+	time until every task was posted and the time until every outcome resolved
+	"""
+	outcomes = [None] * n_tasks
+	start_line = threading.Barrier(n_threads + 1)
+
+	def submit(first):
+		start_line.wait()
+		for i in range(first, n_tasks, n_threads):
+			outcomes[i] = a.estimate(text = "task-%d: how many cars are in this parking lot?" % i, budget = 1.50)
+
+	threads = [threading.Thread(target = submit, args = (i,)) for i in range(n_threads)]
+	for thread in threads:
+		thread.start()
+	start_line.wait()
+	start = monotonic()
+	for thread in threads:
+		thread.join()
+	posted = monotonic() - start
+	Batch(outcomes).wait_all_done()
+	return posted, monotonic() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 20000)
+	parser.add_argument('--threads', default = '1,8,32')
+	parser.add_argument('--channels', default = '1,2,4,8')
+	parser.add_argument('--policy', default = 'round_robin', choices = Automan.ChannelPolicyVals)
+	parser.add_argument('--port', type = int, default = 50073)
+	args = parser.parse_args()
+
+	proc = start_process(args.port)
+	try:
+		for n_channels in [int(n) for n in args.channels.split(',')]:
+			a = Automan(dict(ADAPTER), port = args.port, testmode = True, channels = n_channels, channel_policy = args.policy)
+			# warm up the connections and the WatchOutcomes stream
+			run(a, 100, len(a.channel_pool))
+			for n_threads in [int(n) for n in args.threads.split(',')]:
+				posted, resolved = run(a, args.tasks, n_threads)
+				print("channels=%-3d threads=%-4d tasks=%-7d posted %9.0f tasks/s  resolved %9.0f tasks/s" % (
+						n_channels, n_threads, args.tasks, args.tasks / posted, args.tasks / resolved))
+			a.channel_pool.close()
+	finally:
+		proc.kill()
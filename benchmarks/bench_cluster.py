@@ -0,0 +1,58 @@
+"""
+Scaling benchmark for AutomanCluster. Spreads the same tasks over 1 to K stand-in servers, each
+running in a process of its own, as each RPC server would, and reports how fast the tasks resolve.
+
+For each number of servers it submits --tasks tasks with submit_many, and reports the time until
+every server acknowledged its share, and the rate the tasks resolved at. Each stand-in launches its
+tasks one at a time, taking --launch-ms each, as an RPC server with a single AutoMan worker does, so
+the rate grows with the number of servers until the client itself is the bottleneck.
+
+usage: python bench_cluster.py [--tasks N] [--servers 1,2,4] [--routing least_outstanding|hash]
+			[--launch-ms MS] [--latency SECONDS] [--port PORT]
+"""
+import argparse
+from time import monotonic
+
+from automanpy.cluster import AutomanCluster
+
+from standin_server import start_process
+
+ADAPTER = {"type" : "mock", "seed" : 1, "answers_per_task" : 5}
+
+def run(cluster, n_tasks):
+	"""
+	Submits n_tasks estimate tasks, and returns the time until every one was acknowledged and the time
+	until every outcome resolved
+	"""
+	start = monotonic()
+	batch = cluster.submit_many([{"text" : "task-%d: how many cars are in this parking lot?" % i, "budget" : 1.50} for i in range(n_tasks)])
+	acknowledged = monotonic() - start
+	batch.wait_all_done()
+	return acknowledged, monotonic() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 20000)
+	parser.add_argument('--servers', default = '1,2,4')
+	parser.add_argument('--routing', default = 'least_outstanding', choices = AutomanCluster.RoutingVals)
+	parser.add_argument('--launch-ms', type = float, default = 1.0, help = 'time each stand-in server takes to launch a task')
+	parser.add_argument('--latency', type = float, default = 0.0, help = 'latency of each stand-in server, in seconds')
+	parser.add_argument('--port', type = int, default = 50080, help = 'the port of the first stand-in, the others are on the ports after it')
+	args = parser.parse_args()
+
+	counts = [int(n) for n in args.servers.split(',')]
+	ports = list(range(args.port, args.port + max(counts)))
+	procs = []
+	try:
+		for port in ports:
+			procs.append(start_process(port, args.latency, launch_ms = args.launch_ms))
+		for n_servers in counts:
+			cluster = AutomanCluster(dict(ADAPTER), servers = ports[:n_servers], routing = args.routing, testmode = True)
+			# warm up the connections and the WatchOutcomes streams
+			run(cluster, 100 * n_servers)
+			acknowledged, resolved = run(cluster, args.tasks)
+			print("servers=%-3d tasks=%-7d acknowledged in %7.2fs  resolved %9.0f tasks/s" % (
+					n_servers, args.tasks, acknowledged, args.tasks / resolved))
+	finally:
+		for proc in procs:
+			proc.kill()
@@ -0,0 +1,57 @@
+"""
+Memory benchmark for outcomes. Builds --tasks estimate outcomes, each on its own future and its own
+TaskResponse as the watcher would hand them over, keeps only the outcomes, and reports the bytes
+traced per outcome in three states:
+
+	pending 	the futures have not resolved
+	resolved 	the futures have resolved, and nothing has looked at the outcomes yet
+	evaluated 	every outcome has been waited on with done()
+
+No server is involved: the futures are resolved in this process, so the numbers are the client-side
+cost of holding a large batch of outcomes.
+
+usage: python bench_outcome_memory.py [--tasks N]
+"""
+import argparse
+import gc
+import tracemalloc
+from concurrent.futures import Future
+
+from automanpy.core.outcomes import EstimateOutcome
+from automanpy.core.automanlib_rpc_pb2 import TaskResponse, AutomanOutcome
+from automanpy.core.grpc_classes.automanlib_classes_pb2 import EstimateOutcome as EstimateOutcomeMsg, ValueOutcome, CONFIDENT
+
+def response(i):
+	return TaskResponse(return_code = TaskResponse.VALID, task_id = str(i),
+						outcome = AutomanOutcome(estimate_outcome = EstimateOutcomeMsg(answer = ValueOutcome(est = float(i), low = i - 1.0, high = i + 1.0, cost = 1.8, conf = 0.95),
+																						outcome_type = CONFIDENT)))
+
+def measure(n_tasks, state):
+	"""
+	Returns the bytes traced per outcome, once n_tasks outcomes are in state
+	"""
+	gc.collect()
+	tracemalloc.start()
+	futures = [Future() for _ in range(n_tasks)]
+	outcomes = [EstimateOutcome(future_tr = future) for future in futures]
+	if state != 'pending':
+		for i, future in enumerate(futures):
+			future.set_running_or_notify_cancel()
+			future.set_result(response(i))
+	del futures
+	if state == 'evaluated':
+		for outcome in outcomes:
+			outcome.done()
+	gc.collect()
+	current, _peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+	del outcomes
+	return current / float(n_tasks)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 100000)
+	args = parser.parse_args()
+
+	for state in ['pending', 'resolved', 'evaluated']:
+		print("%-10s tasks=%-7d %8.0f bytes/outcome" % (state, args.tasks, measure(args.tasks, state)))
@@ -0,0 +1,84 @@
+"""
+Memory benchmark for streaming submission. For each task count, submits the tasks in a fresh client
+process, in one of two modes, and writes every outcome to a JSONL file:
+
+	batch 	Automan.submit_many, keeping the Batch until every outcome resolved, then writing them
+	stream 	Automan.submit_stream into a JsonlSink, which writes and lets go of each outcome as it resolves
+
+and reports the growth of the client's peak resident set size over the run, and the rate the tasks
+resolved at. The growth of batch mode is proportional to the number of tasks; that of stream mode is
+bounded by --max-pending.
+
+usage: python bench_streaming.py [--sizes 10000,50000] [--max-pending N] [--latency SECONDS] [--port PORT]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import monotonic
+
+from automanpy.automan import Automan
+from automanpy.core.sinks import JsonlSink, outcome_record
+
+from standin_server import start_process
+
+ADAPTER = {"type" : "mock", "seed" : 1, "answers_per_task" : 5}
+
+def peak_rss_mb():
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# ru_maxrss is in bytes on macOS, in kilobytes on Linux
+	return rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else rss / 1024.0
+
+def tasks(n_tasks):
+	for i in range(n_tasks):
+		yield {"text" : "task-%d: how many cars are in this parking lot?" % i, "budget" : 1.50}
+
+def child(mode, n_tasks, port, max_pending):
+	"""
+	Runs one mode in this process, and prints its results as JSON
+	"""
+	a = Automan(dict(ADAPTER), port = port, testmode = True)
+	start_mb = peak_rss_mb()
+	path = tempfile.mktemp(suffix = '.jsonl')
+	start = monotonic()
+	if mode == 'batch':
+		batch = a.submit_many(tasks(n_tasks))
+		batch.wait_all_done()
+		sink = JsonlSink(path)
+		sink.write([outcome_record(position, key, outcome) for position, (key, outcome) in enumerate(zip(batch.keys, batch.outcomes))])
+		sink.close()
+	else:
+		stream = a.submit_stream(tasks(n_tasks), JsonlSink(path), max_pending = max_pending)
+		stream.wait_all_done()
+		stream.close()
+	wall = monotonic() - start
+	os.remove(path)
+	print(json.dumps({'mode' : mode, 'tasks' : n_tasks, 'growth_mb' : peak_rss_mb() - start_mb, 'tasks_per_s' : n_tasks / wall}))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--sizes', default = '10000,50000')
+	parser.add_argument('--max-pending', type = int, default = 10000)
+	parser.add_argument('--latency', type = float, default = 0.0, help = 'latency of the stand-in server, in seconds')
+	parser.add_argument('--port', type = int, default = 50070)
+	parser.add_argument('--child', default = None, choices = ['batch', 'stream'], help = argparse.SUPPRESS)
+	parser.add_argument('--tasks', type = int, default = 0, help = argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.child is not None:
+		child(args.child, args.tasks, args.port, args.max_pending)
+		sys.exit(0)
+
+	proc = start_process(args.port, args.latency)
+	try:
+		for n_tasks in [int(n) for n in args.sizes.split(',')]:
+			for mode in ['batch', 'stream']:
+				out = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--child', mode, '--tasks', str(n_tasks),
+												'--port', str(args.port), '--max-pending', str(args.max_pending)])
+				result = json.loads(out.decode().strip().splitlines()[-1])
+				print("%-7s tasks=%-7d rss growth=%7.1fMB  %7.0f tasks/s" % (mode, n_tasks, result['growth_mb'], result['tasks_per_s']))
+	finally:
+		proc.kill()
@@ -0,0 +1,56 @@
+"""
+Benchmark for Automan.submit_many(). Compares the throughput of posting tasks with one call per task
+(Automan.estimate) with posting them over a single SubmitTasks stream (Automan.submit_many), against
+the stand-in server running in a separate process.
+
+For each path it reports the time until every task has been handed to the server, and the time
+until every outcome has resolved.
+
+usage: python bench_submit_many.py [--tasks N] [--chunk-size N] [--port PORT]
+"""
+import argparse
+from time import monotonic
+
+from automanpy.automan import Automan
+from automanpy.core.batchjob import Batch
+
+from standin_server import start_process
+
+ADAPTER = {"access_id" : "standin", "access_key" : "standin", "type" : "mturk", "sandbox_mode" : "true"}
+
+def task_rows(n_tasks):
+	return [dict(text = "task-%d: how many cars are in this parking lot?" % i, budget = 1.50, title = "Car Counting-%d" % i,
+				image_url = "https://example.com/lot-%d.jpg" % i) for i in range(n_tasks)]
+
+def per_task(a, rows):
+	start = monotonic()
+	batch = Batch([a.estimate(**row) for row in rows])
+	posted = monotonic() - start
+	batch.wait_all_done()
+	return posted, monotonic() - start
+
+def streamed(a, rows, chunk_size):
+	start = monotonic()
+	batch = a.submit_many(rows, chunk_size = chunk_size)
+	posted = monotonic() - start
+	batch.wait_all_done()
+	return posted, monotonic() - start
+
+def report(name, n_tasks, posted, resolved):
+	print("%-12s tasks=%-7d posted in %7.3fs (%9.0f tasks/s)  resolved in %7.3fs (%9.0f tasks/s)" % (name, n_tasks, posted, n_tasks / posted, resolved, n_tasks / resolved))
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 20000)
+	parser.add_argument('--chunk-size', type = int, default = 500)
+	parser.add_argument('--port', type = int, default = 50071)
+	args = parser.parse_args()
+
+	proc = start_process(args.port)
+	try:
+		a = Automan(dict(ADAPTER), port = args.port, testmode = True)
+		rows = task_rows(args.tasks)
+		report('per-task', args.tasks, *per_task(a, rows))
+		report('SubmitTasks', args.tasks, *streamed(a, rows, args.chunk_size))
+	finally:
+		proc.kill()
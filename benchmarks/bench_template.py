@@ -0,0 +1,57 @@
+"""
+Microbenchmark for task templates. Builds and serializes --tasks estimate tasks that differ in their
+text, image_url and title, and share every other argument, in two ways:
+
+	per_task 	the builder of estimate(): every argument checked, and every field of the Task set, for
+				every task
+	template 	Automan.template(): the shared arguments checked and built into a prototype once, and
+				each task a copy of the prototype with its text, image_url and title set
+
+and reports the time each takes per task, the best of --repeat runs. Each task is serialized, as it
+would be to post it. Nothing is submitted, and the stand-in server is only started for the Automan
+object's constructor.
+
+usage: python bench_template.py [--tasks N] [--repeat R] [--port PORT]
+"""
+import argparse
+from time import perf_counter
+
+from automanpy.automan import Automan
+
+from standin_server import start_process
+
+SHARED = {"budget" : 1.50, "confidence" : 0.9, "wage" : 11.0, "question_timeout_multiplier" : 60}
+
+def per_task(a, rows):
+	return [a._make_estimate_task(**dict(SHARED, **row)).SerializeToString() for row in rows]
+
+def template(a, rows):
+	build = a.template("estimate", **SHARED).build
+	return [build(**row).SerializeToString() for row in rows]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 50000)
+	parser.add_argument('--repeat', type = int, default = 5)
+	parser.add_argument('--port', type = int, default = 50076)
+	args = parser.parse_args()
+
+	rows = [dict(text = "task-%d: how many cars are in this parking lot?" % i, image_url = "https://example.com/lots/%d.jpg" % i,
+				title = "Car Counting-%d" % i) for i in range(args.tasks)]
+	proc = start_process(args.port)
+	try:
+		a = Automan({"type" : "mock"}, port = args.port, testmode = True)
+		results = {}
+		for build in [per_task, template]:
+			best = None
+			for _ in range(args.repeat):
+				start = perf_counter()
+				built = build(a, rows)
+				elapsed = perf_counter() - start
+				best = elapsed if best is None else min(best, elapsed)
+				del built
+			results[build.__name__] = best / args.tasks * 1e6
+			print("%-9s tasks=%-7d %7.2f us/task" % (build.__name__, args.tasks, results[build.__name__]))
+		print("speedup   %.1fx" % (results['per_task'] / results['template']))
+	finally:
+		proc.kill()
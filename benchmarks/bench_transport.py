@@ -0,0 +1,73 @@
+"""
+Benchmark for Automan(transport="uds"). Compares the latency of talking to a local server over TCP
+with talking to it over a Unix domain socket, against the stand-in server running in a separate
+process, once per transport.
+
+For each transport it reports, over --calls calls made one at a time:
+
+	status 		the round trip of a ServerStatus call, the smallest call the client makes
+	task 		the time from submitting an estimate task until its outcome resolves
+
+usage: python bench_transport.py [--calls N] [--port PORT] [--socket PATH]
+"""
+import argparse
+import os
+import tempfile
+from time import monotonic
+
+from automanpy.automan import Automan
+from automanpy.core.automanlib import get_server_status
+
+from standin_server import start_process
+
+ADAPTER = {"type" : "mock", "seed" : 1, "answers_per_task" : 5}
+# calls made before measuring, to warm up the connection and the WatchOutcomes stream
+WARMUP_CALLS = 200
+
+def percentiles(samples):
+	"""
+	Returns the p50, p95 and p99 of samples (in seconds) in microseconds
+	"""
+	samples = sorted(samples)
+	return [1e6 * samples[min(len(samples) - 1, int(len(samples) * q))] for q in (0.50, 0.95, 0.99)]
+
+def measure(a, n_calls):
+	"""
+	Returns the status call and task round trips of n_calls calls, each made after the previous one returned
+	"""
+	for i in range(WARMUP_CALLS):
+		get_server_status(a.channel)
+		a.estimate(text = "warmup-%d" % i, budget = 1.50).done()
+	status = []
+	for i in range(n_calls):
+		start = monotonic()
+		get_server_status(a.channel)
+		status.append(monotonic() - start)
+	task = []
+	for i in range(n_calls):
+		start = monotonic()
+		a.estimate(text = "task-%d: how many cars are in this parking lot?" % i, budget = 1.50).done()
+		task.append(monotonic() - start)
+	return status, task
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--calls', type = int, default = 5000)
+	parser.add_argument('--port', type = int, default = 50074)
+	parser.add_argument('--socket', default = os.path.join(tempfile.gettempdir(), 'automanpy-bench-%d.sock' % os.getpid()))
+	args = parser.parse_args()
+
+	for transport in Automan.TransportVals:
+		socket_path = args.socket if transport == 'uds' else None
+		proc = start_process(args.port, socket_path = socket_path)
+		try:
+			a = Automan(dict(ADAPTER), port = args.port, testmode = True, transport = transport, socket_path = socket_path)
+			status, task = measure(a, args.calls)
+			for name, samples in (('status', status), ('task', task)):
+				print("transport=%-4s %-7s calls=%-6d p50/p95/p99 = %7.1f / %7.1f / %7.1f us" % ((transport, name, args.calls) + tuple(percentiles(samples))))
+			a.channel_pool.close()
+		finally:
+			proc.kill()
+			proc.wait()
+			if socket_path and os.path.exists(socket_path):
+				os.remove(socket_path)
@@ -0,0 +1,51 @@
+"""
+Benchmark for argument validation. Checks the arguments of --tasks estimate tasks that differ in their
+text and budget, and share every other argument, in three ways:
+
+	per_task 	ESTIMATE.validate once per task, as estimate() does
+	lists 		ESTIMATE.validate_many over lists of texts and budgets, a value at a time
+	numpy 		ESTIMATE.validate_many over numpy arrays of texts and budgets, in vectorized passes
+
+and reports the time each takes per task, the best of --repeat runs. No server is involved.
+
+usage: python bench_validate.py [--tasks N] [--repeat R]
+"""
+import argparse
+from time import perf_counter
+
+import numpy
+
+from automanpy.core.schema import ESTIMATE
+
+SHARED = {"title" : "Car Counting", "confidence" : 0.9, "wage" : 11.0, "image_url" : "", "sample_size" : -1}
+
+def per_task(texts, budgets):
+	for text, budget in zip(texts, budgets):
+		ESTIMATE.validate(text = text, budget = budget, **SHARED)
+
+def lists(texts, budgets):
+	ESTIMATE.validate_many(dict(text = texts, budget = budgets), SHARED)
+
+def arrays(texts, budgets):
+	ESTIMATE.validate_many(dict(text = texts, budget = budgets), SHARED)
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 100000)
+	parser.add_argument('--repeat', type = int, default = 5)
+	args = parser.parse_args()
+
+	texts = ["task-%d: how many cars are in this parking lot?" % i for i in range(args.tasks)]
+	budgets = [1.0 + (i % 7) for i in range(args.tasks)]
+	inputs = {'per_task' : (texts, budgets), 'lists' : (texts, budgets), 'numpy' : (numpy.array(texts), numpy.array(budgets))}
+	results = {}
+	for name, check in [('per_task', per_task), ('lists', lists), ('numpy', arrays)]:
+		best = None
+		for _ in range(args.repeat):
+			start = perf_counter()
+			check(*inputs[name])
+			elapsed = perf_counter() - start
+			best = elapsed if best is None else min(best, elapsed)
+		results[name] = best / args.tasks * 1e6
+		print("%-9s tasks=%-7d %7.3f us/task" % (name, args.tasks, results[name]))
+	print("speedup   lists %.1fx, numpy %.1fx" % (results['per_task'] / results['lists'], results['per_task'] / results['numpy']))
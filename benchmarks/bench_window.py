@@ -0,0 +1,43 @@
+"""
+Benchmark for the submission window. Submits --tasks estimate tasks with Automan.submit_many, against
+a stand-in server that takes --latency seconds to resolve each task, with and without a bound on the
+tasks in flight (Automan(max_in_flight=N)), and reports for each:
+
+	peak 		the most tasks posted and unresolved at once, which the server holds queued
+	wall 		the seconds until every outcome resolved
+	waits 		the number of times submission waited for a slot, and the mean wait
+
+An unbounded run is measured through a window too large to ever fill.
+
+usage: python bench_window.py [--tasks N] [--windows 100,1000] [--latency SECONDS] [--port PORT]
+"""
+import argparse
+from time import monotonic
+
+from automanpy.automan import Automan
+
+from standin_server import start_process
+
+def run(port, n_tasks, max_in_flight):
+	a = Automan({"type" : "mock"}, port = port, testmode = True, max_in_flight = max_in_flight)
+	start = monotonic()
+	batch = a.submit_many([{"text" : "task-%d: how many cars are in this parking lot?" % i, "budget" : 1.50} for i in range(n_tasks)])
+	batch.wait_all_done()
+	return monotonic() - start, a.window_metrics()
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--tasks', type = int, default = 20000)
+	parser.add_argument('--windows', default = '100,1000')
+	parser.add_argument('--latency', type = float, default = 0.05, help = 'latency of the stand-in server, in seconds')
+	parser.add_argument('--port', type = int, default = 50077)
+	args = parser.parse_args()
+
+	proc = start_process(args.port, args.latency)
+	try:
+		for window in [None] + [int(w) for w in args.windows.split(',')]:
+			wall, metrics = run(args.port, args.tasks, window or 2 ** 62)
+			print("%-9s tasks=%-7d peak=%-7d wall=%6.2fs  waits=%-6d mean wait=%7.2fms" % (window or 'unbounded', args.tasks, metrics['peak_in_flight'],
+					wall, metrics['waits'], metrics['wait_s_mean'] * 1e3))
+	finally:
+		proc.kill()
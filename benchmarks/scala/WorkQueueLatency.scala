@@ -0,0 +1,86 @@
+package pyautomanlib.benchmarks;
+import pyautomanlib.TaskQueueConsumer;
+import automanlib_rpc.AutomanTask;
+import java.util.concurrent.{BlockingQueue, LinkedBlockingQueue, ConcurrentHashMap, CountDownLatch};
+import java.util.concurrent.atomic.AtomicBoolean;
+import scala.util.Random;
+
+/** Benchmark for the worker's task queue. Measures the time between the server enqueueing a task and
+*	the worker taking it off the queue to launch it, for tasks enqueued one at a time at random intervals.
+*	No AutoMan back-end is involved; the consumer only records when each task reached it.
+*	With --legacy the same tasks are also consumed with the previous peek and sleep(5000) loop.
+*
+*	usage: sbt "test:runMain pyautomanlib.benchmarks.WorkQueueLatency [--tasks N] [--max-gap-ms MS] [--legacy]"
+*/
+object WorkQueueLatency {
+	type QueuedTask = (String, AutomanTask.TaskType);
+
+	/** records the time each task reached the worker */
+	class RecordingConsumer(val queue: BlockingQueue[QueuedTask], val stopFlag: AtomicBoolean,
+							launchedAt: ConcurrentHashMap[String, java.lang.Long], done: CountDownLatch) extends TaskQueueConsumer {
+		def consumeTask(taskID: String, task: AutomanTask.TaskType) : Unit = {
+			launchedAt.put(taskID, System.nanoTime());
+			done.countDown();
+		}
+	}
+
+	/** the loop AutomanWorker used before it blocked on the queue */
+	class LegacyConsumer(queue: BlockingQueue[QueuedTask], stopFlag: AtomicBoolean,
+						launchedAt: ConcurrentHashMap[String, java.lang.Long], done: CountDownLatch) extends Runnable {
+		def run() : Unit = {
+			while(!stopFlag.get){
+				if (queue.peek() != null){
+					val taskTuple = queue.poll();
+					launchedAt.put(taskTuple._1, System.nanoTime());
+					done.countDown();
+				} else {
+					Thread.sleep(5000);
+				}
+			}
+		}
+	}
+
+	def measure(name: String, nTasks: Int, maxGapMs: Int, legacy: Boolean) : Unit = {
+		val queue: BlockingQueue[QueuedTask] = new LinkedBlockingQueue;
+		val stopFlag = new AtomicBoolean(false);
+		val launchedAt = new ConcurrentHashMap[String, java.lang.Long];
+		val done = new CountDownLatch(nTasks);
+		val consumer: Runnable = if (legacy) new LegacyConsumer(queue, stopFlag, launchedAt, done)
+								else new RecordingConsumer(queue, stopFlag, launchedAt, done);
+		val worker = new Thread(consumer, "bench-worker");
+		worker.start();
+
+		val enqueuedAt = new Array[Long](nTasks);
+		val start = System.nanoTime();
+		for (i <- 0 until nTasks) {
+			Thread.sleep(Random.nextInt(maxGapMs + 1));
+			enqueuedAt(i) = System.nanoTime();
+			queue.add((i.toString, AutomanTask.TaskType.Empty));
+		}
+		done.await();
+		val wall = (System.nanoTime() - start) / 1e9;
+		stopFlag.set(true);
+		val stopAsked = System.nanoTime();
+		worker.join();
+		val stopMs = (System.nanoTime() - stopAsked) / 1e6;
+
+		val delays = (0 until nTasks).map(i => (launchedAt.get(i.toString) - enqueuedAt(i)) / 1e6).sorted;
+		println(f"$name%-8s tasks=$nTasks%-6d wall=$wall%7.2fs  p50=${delays(nTasks / 2)}%10.3fms  " +
+				f"p99=${delays(math.min(nTasks - 1, (nTasks * 0.99).toInt))}%10.3fms  max=${delays.last}%10.3fms  stop=$stopMs%8.1fms");
+	}
+
+	def main(args: Array[String]) : Unit = {
+		var nTasks = 1000;
+		var maxGapMs = 10;
+		var legacy = false;
+		args.sliding(2, 1).foreach {
+			case Array("--tasks", n) => nTasks = n.toInt;
+			case Array("--max-gap-ms", ms) => maxGapMs = ms.toInt;
+			case _ => ;
+		}
+		if (args.contains("--legacy")) legacy = true;
+
+		measure("blocking", nTasks, maxGapMs, legacy = false);
+		if (legacy) measure("legacy", nTasks, maxGapMs, legacy = true);
+	}
+}
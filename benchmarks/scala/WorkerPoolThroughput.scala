@@ -0,0 +1,53 @@
+package pyautomanlib.benchmarks;
+import pyautomanlib.TaskQueueConsumer;
+import automanlib_rpc.AutomanTask;
+import java.util.concurrent.{BlockingQueue, LinkedBlockingQueue, CountDownLatch, Executors, TimeUnit};
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/** Benchmark for the server's worker pool. Enqueues --tasks tasks on a shared queue and measures how
+*	fast pools of different sizes drain it. Each worker stands in for an AutomanWorker on a mock
+*	back-end: launching a task costs --launch-ms, the time AutoMan spends scheduling and posting it.
+*
+*	usage: sbt "test:runMain pyautomanlib.benchmarks.WorkerPoolThroughput [--tasks N] [--launch-ms MS] [--workers 1,2,4,8]"
+*/
+object WorkerPoolThroughput {
+	type QueuedTask = (String, AutomanTask.TaskType);
+
+	/** a worker whose launches take launchMs and always succeed */
+	class MockWorker(val queue: BlockingQueue[QueuedTask], val stopFlag: AtomicBoolean, launchMs: Long, done: CountDownLatch) extends TaskQueueConsumer {
+		def consumeTask(taskID: String, task: AutomanTask.TaskType) : Unit = {
+			Thread.sleep(launchMs);
+			done.countDown();
+		}
+	}
+
+	def measure(nWorkers: Int, nTasks: Int, launchMs: Long) : Unit = {
+		val queue: BlockingQueue[QueuedTask] = new LinkedBlockingQueue;
+		val stopFlag = new AtomicBoolean(false);
+		val done = new CountDownLatch(nTasks);
+		val pool = Executors.newFixedThreadPool(nWorkers);
+		for (i <- 1 to nWorkers) pool.execute(new MockWorker(queue, stopFlag, launchMs, done));
+
+		val start = System.nanoTime();
+		for (i <- 0 until nTasks) queue.add((i.toString, AutomanTask.TaskType.Empty));
+		done.await();
+		val wall = (System.nanoTime() - start) / 1e9;
+		stopFlag.set(true);
+		pool.shutdown();
+		pool.awaitTermination(10, TimeUnit.SECONDS);
+		println(f"workers=$nWorkers%-3d tasks=$nTasks%-6d launch=${launchMs}ms  wall=$wall%7.2fs  (${nTasks / wall}%9.1f tasks/s)");
+	}
+
+	def main(args: Array[String]) : Unit = {
+		var nTasks = 2000;
+		var launchMs = 5L;
+		var workers = Seq(1, 2, 4, 8);
+		args.sliding(2, 1).foreach {
+			case Array("--tasks", n) => nTasks = n.toInt;
+			case Array("--launch-ms", ms) => launchMs = ms.toLong;
+			case Array("--workers", ns) => workers = ns.split(",").map(_.toInt).toSeq;
+			case _ => ;
+		}
+		workers.foreach(n => measure(n, nTasks, launchMs));
+	}
+}
@@ -0,0 +1,111 @@
+"""
+Simulation of the adaptive submission window (Automan(max_in_flight='adaptive')) against the mock
+back-end. A stand-in server answers each task --latency seconds after it is posted, as the mock
+adapter does, and is loaded the way a single-threaded server is: it acknowledges each task
+--ack-ms milliseconds later per task outstanding, and turns tasks away with RESOURCE_EXHAUSTED
+beyond --capacity outstanding tasks. The limit the window should settle at is where acknowledging
+takes the window's target latency, target_latency / ack-ms tasks, below the capacity.
+
+Each run posts tasks with estimate() for --seconds seconds, through a fixed window too small for
+the server, a fixed window too large for it, and the adaptive window, and reports for each:
+
+	tasks/s 	the tasks resolved per second
+	rejected 	the tasks the server turned away
+	ack 		the mean seconds between posting a task and the server acknowledging it
+
+For the adaptive window, the limit is sampled every --sample seconds and printed as a trace, with
+every decrease of the limit and its reason, and the mean and range of the limit over the second half
+of the run, once it has had time to converge: a sawtooth that peaks near the expected limit.
+--log prints every change of the limit as it is logged.
+
+The run fails, exiting with status 1, if the mean limit over the second half is not within --tolerance
+of the expected limit, so that it serves as a convergence test. The default tolerance is that of the
+sawtooth itself: once converged, the limit peaks near the expected limit and is halved from there, so
+it stays between half the expected limit and the expected limit.
+
+usage: python sim_aimd.py [--seconds S] [--latency SECONDS] [--ack-ms MS] [--capacity N] [--fixed 8,1000]
+			[--sample SECONDS] [--tolerance FRACTION] [--log] [--port PORT]
+"""
+import argparse
+import logging
+import sys
+import threading
+from time import monotonic
+
+import grpc
+
+from automanpy.automan import Automan
+
+from standin_server import start_process
+
+def run(port, seconds, latency, max_in_flight, sample):
+	a = Automan({"type" : "mock", "latency_s" : latency}, port = port, testmode = True, max_in_flight = max_in_flight)
+	# testmode skips registering the adapter, whose latency_s the stand-in answers after
+	a._register_adptr()
+	trace = list()
+	done = threading.Event()
+
+	def sampler():
+		while not done.wait(sample):
+			metrics = a.window_metrics()
+			trace.append((monotonic() - start, metrics['max_in_flight'], metrics['in_flight'], metrics.get('ack_latency_s')))
+
+	start = monotonic()
+	thread = threading.Thread(target = sampler)
+	thread.daemon = True
+	thread.start()
+	outcomes = list()
+	while monotonic() - start < seconds:
+		outcomes.append(a.estimate(text = "task-%d: how many cars are in this parking lot?" % len(outcomes), budget = 1.50))
+	done.set()
+	rejected = 0
+	for outcome in outcomes:
+		try:
+			outcome.done()
+		except grpc.RpcError:
+			rejected += 1
+	elapsed = monotonic() - start
+	history = list(a.window.history) if max_in_flight == 'adaptive' else None
+	return (len(outcomes) - rejected) / elapsed, rejected, a.window_metrics(), trace, history
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--seconds', type = float, default = 30.0)
+	parser.add_argument('--latency', type = float, default = 0.2, help = 'latency of the mock back-end, in seconds')
+	parser.add_argument('--ack-ms', type = float, default = 2.0)
+	parser.add_argument('--capacity', type = int, default = 200)
+	parser.add_argument('--fixed', default = '8,1000')
+	parser.add_argument('--sample', type = float, default = 1.0)
+	parser.add_argument('--tolerance', type = float, default = 0.5, help = 'the fraction of the expected limit the second-half mean may be off by')
+	parser.add_argument('--log', action = 'store_true')
+	parser.add_argument('--port', type = int, default = 50079)
+	args = parser.parse_args()
+	if args.log:
+		logging.basicConfig(level = logging.INFO, format = "%(relativeCreated)8.0fms %(message)s")
+
+	proc = start_process(args.port, ack_ms = args.ack_ms, capacity = args.capacity)
+	try:
+		for window in [int(w) for w in args.fixed.split(',')] + ['adaptive']:
+			rate, rejected, metrics, trace, history = run(args.port, args.seconds, args.latency, window, args.sample)
+			ack = metrics.get('ack_latency_s')
+			print("%-9s tasks/s=%-8.1f rejected=%-6d ack=%s" % (window, rate, rejected, "%.3fs" % ack if ack is not None else "n/a"))
+		print("\nadaptive limit, %d increases, %d decreases, target latency %.3fs, %d slow acks, %d turned away" % (metrics['limit_increases'],
+				metrics['limit_decreases'], metrics['target_latency'], metrics['slow_acks'], metrics['congestion_events']))
+		for t, limit, in_flight, ack in trace:
+			print("  t=%5.1fs limit=%-5d in_flight=%-5d ack=%.3fs" % (t, limit, in_flight, ack or 0.0))
+		for _, old, limit, reason in history:
+			if limit < old:
+				print("  decrease %d -> %d: %s" % (old, limit, reason))
+		settled = [limit for t, limit, _, _ in trace if t >= args.seconds / 2]
+		expected = min(args.capacity, metrics['target_latency'] / (args.ack_ms / 1000.0))
+		if not settled:
+			print("no sample of the limit in the second half, raise --seconds or lower --sample")
+			sys.exit(1)
+		mean = sum(settled) / len(settled)
+		print("second half: limit mean %.1f, range %d-%d, expected about %.0f" % (mean, min(settled), max(settled), expected))
+		if abs(mean - expected) > args.tolerance * expected:
+			print("limit did not converge: mean %.1f is more than %.0f%% off the expected %.0f" % (mean, 100 * args.tolerance, expected))
+			sys.exit(1)
+		print("limit converged within %.0f%% of the expected %.0f" % (100 * args.tolerance, expected))
+	finally:
+		proc.kill()
@@ -0,0 +1,449 @@
+"""
+A stand-in for the AutoMan RPC server, for benchmarking the Python client without a JVM or a
+crowdsource back-end. It implements the PyautomanPrototype service in-process: every task is
+answered with a confident estimate (or the first radio option) after a configurable latency.
+
+If a "mock" adapter is registered, tasks are answered as the mock back-end would: from the
+task's mock_answers, or from answers drawn from the distributions in the adapter's options,
+after the adapter's latency_s and latency_jitter_s. Answers lost to dropout are not counted,
+and a task whose every answer was lost comes back OVERBUDGET.
+
+Client sessions are tracked as on the RPC server. With --idle-ttl the stand-in runs as a daemon,
+and exits once it has had no open session for that many seconds. With --socket it listens on a
+Unix domain socket instead of the port, as the RPC server does. With --launch-ms every task is
+first launched by a single simulated worker, one task at a time, which caps the tasks the stand-in
+answers per second as the worker pool of an RPC server with one worker does.
+
+With --ack-ms the stand-in acknowledges a task later the more tasks are outstanding (submitted and
+not yet answered), by that many milliseconds per outstanding task, as a loaded server does. With
+--capacity it turns PostTask calls away with RESOURCE_EXHAUSTED once that many tasks are
+outstanding.
+
+usage: python standin_server.py [--port PORT] [--latency SECONDS] [--launch-ms MS] [--idle-ttl SECONDS]
+			[--socket PATH] [--ack-ms MS] [--capacity N]
+"""
+import argparse
+import heapq
+import os
+import random
+import subprocess
+import sys
+import threading
+import uuid
+from concurrent import futures
+from time import monotonic, sleep
+
+from queue import Queue
+
+import grpc
+
+import automanpy.core.automanlib_rpc_pb2_grpc as rpclib
+from automanpy.core.automanlib_rpc_pb2 import TaskResponse, TaskResponseBatch, TaskTicket, AutomanOutcome, ServerStatusResponse, SessionResponse
+from automanpy.core.grpc_classes.automanlib_classes_pb2 import AdapterCredentials, EstimateOutcome, RadioOutcome, ValueOutcome, StringOutcome, CONFIDENT, OVERBUDGET
+
+# the number of seconds a client session lasts unless it is renewed, as on the RPC server
+SESSION_LEASE = 30
+# the number of seconds a resolved posted task is kept for a client to watch it, as on the RPC server
+POSTED_TTL = 600
+
+class Scheduler():
+	"""
+	Runs callbacks at a given time on a single thread, so that simulated task latency does not cost
+	a thread per outstanding task
+	"""
+	def __init__(self):
+		self._heap = list()
+		self._seq = 0
+		self._cond = threading.Condition()
+		thread = threading.Thread(target = self._run, name = "standin-scheduler")
+		thread.daemon = True
+		thread.start()
+
+	def call_later(self, delay, fn):
+		with self._cond:
+			self._seq += 1
+			heapq.heappush(self._heap, (monotonic() + delay, self._seq, fn))
+			self._cond.notify()
+
+	def _run(self):
+		while True:
+			with self._cond:
+				while not self._heap or self._heap[0][0] > monotonic():
+					self._cond.wait(None if not self._heap else self._heap[0][0] - monotonic())
+				_, _, fn = heapq.heappop(self._heap)
+			fn()
+
+class MockBackend():
+	"""
+	Answers tasks the way the worker's mock back-end does, from the options of a "mock" adapter
+	"""
+	def __init__(self, options):
+		self.options = options
+		self._random = random.Random(int(options['seed']) if 'seed' in options else None)
+		self._lock = threading.Lock()
+
+	def option(self, name, default):
+		return float(self.options.get(name, default))
+
+	def delay(self):
+		with self._lock:
+			return self.option('latency_s', 0.0) + self._random.random() * self.option('latency_jitter_s', 0.0)
+
+	def _answers(self, task, draw, parse):
+		with self._lock:
+			answers = [parse(a) for a in task.mock_answers] or [draw() for _ in range(int(self.option('answers_per_task', 30)))]
+			dropout = self.option('dropout', 0.0)
+			return [a for a in answers if self._random.random() >= dropout]
+
+	def answer(self, automan_task):
+		if automan_task.WhichOneof('task_type') == 'radio':
+			task = automan_task.radio.task
+			keys = sorted(list(task.options.single.keys()) + list(task.options.double.keys())) or ['n/a']
+			weights = dict((k, float(w)) for k, w in (entry.rsplit(':', 1) for entry in self.options.get('radio_weights', '').split(',') if entry))
+			weighted = [k for k in keys if weights.get(k, 0.0) > 0]
+			draw = (lambda: self._random.choices(weighted, [weights[k] for k in weighted])[0]) if weighted else (lambda: keys[0])
+			answers = self._answers(task, draw, str)
+			if not answers:
+				return AutomanOutcome(radio_outcome = RadioOutcome(outcome_type = OVERBUDGET, need = task.budget, have = 0.0))
+			option = max(set(answers), key = answers.count)
+			return AutomanOutcome(radio_outcome = RadioOutcome(answer = StringOutcome(option = option, cost = 0.06 * len(answers), conf = task.confidence),
+																outcome_type = CONFIDENT, need = -1.0, have = -1.0))
+		task = automan_task.estimate.task
+		mean, stddev = self.option('estimate_mean', 42.0), self.option('estimate_stddev', 1.0)
+		answers = self._answers(task, lambda: self._random.gauss(mean, stddev), float)
+		if not answers:
+			return AutomanOutcome(estimate_outcome = EstimateOutcome(outcome_type = OVERBUDGET, need = task.budget, have = 0.0))
+		return AutomanOutcome(estimate_outcome = EstimateOutcome(answer = ValueOutcome(est = sum(answers) / len(answers), low = min(answers), high = max(answers),
+																						cost = 0.06 * len(answers), conf = task.confidence),
+																	outcome_type = CONFIDENT, need = -1.0, have = -1.0))
+
+def answer(automan_task, mock = None):
+	"""
+	Returns the TaskResponse the stand-in gives for automan_task, answered by the mock back-end if one is given
+	"""
+	if mock is not None:
+		outcome = mock.answer(automan_task)
+	elif automan_task.WhichOneof('task_type') == 'radio':
+		options = automan_task.radio.task.options
+		option = sorted(options.single.keys() or options.double.keys() or ['n/a'])[0]
+		outcome = AutomanOutcome(radio_outcome = RadioOutcome(answer = StringOutcome(option = option, cost = 0.06, conf = 0.95),
+															outcome_type = CONFIDENT, need = -1.0, have = -1.0))
+	else:
+		outcome = AutomanOutcome(estimate_outcome = EstimateOutcome(answer = ValueOutcome(est = 42.0, low = 40.0, high = 44.0, cost = 0.06, conf = 0.95),
+																	outcome_type = CONFIDENT, need = -1.0, have = -1.0))
+	return TaskResponse(return_code = TaskResponse.VALID, outcome = outcome, task_id = automan_task.task_id)
+
+class StandinServicer(rpclib.PyautomanPrototypeServicer):
+	"""
+	The stand-in servicer
+
+	Attributes
+	----------
+	latency : float
+		The number of seconds between a task being launched and it being answered
+	launch_s : float
+		The number of seconds the single simulated worker takes to launch each task
+	ack_s : float
+		The number of seconds acknowledging a task takes per outstanding task
+	capacity : int
+		The most tasks outstanding before PostTask calls are turned away, None if unbounded
+	tasks_received : int
+		The number of tasks submitted so far, over any rpc
+	outstanding : int
+		The tasks submitted and not yet answered
+	rejected : int
+		The PostTask calls turned away so far
+	"""
+	def __init__(self, latency = 0.0, launch_s = 0.0, ack_s = 0.0, capacity = None):
+		self.latency = latency
+		self.launch_s = launch_s
+		self.ack_s = ack_s
+		self.capacity = capacity
+		self.outstanding = 0
+		self.rejected = 0
+		# when the simulated worker is done launching the tasks submitted so far
+		self._launched_at = monotonic()
+		self.tasks_received = 0
+		self._scheduler = Scheduler()
+		self._lock = threading.Lock()
+		# the registered adapter, and its MockBackend if it is a "mock" adapter
+		self._adapter = None
+		self._mock = None
+		# task_id -> [response or None until resolved, callback of the watcher or None]
+		self._posted = dict()
+		# session_id -> the time its lease runs out
+		self._sessions = dict()
+		self._last_session = monotonic()
+
+	def _count(self, n):
+		with self._lock:
+			self.tasks_received += n
+			self.outstanding += n
+			return self.outstanding - n
+
+	def _answered(self):
+		with self._lock:
+			self.outstanding -= 1
+
+	def _acknowledge(self, backlog):
+		if self.ack_s > 0:
+			sleep(self.ack_s * backlog)
+
+	def _delay(self):
+		delay = self.latency if self._mock is None else self._mock.delay()
+		if self.launch_s > 0:
+			with self._lock:
+				now = monotonic()
+				self._launched_at = max(self._launched_at, now) + self.launch_s
+				delay += self._launched_at - now
+		return delay
+
+	def SubmitTask(self, request, context):
+		self._count(1)
+		delay = self._delay()
+		if delay > 0:
+			sleep(delay)
+		self._answered()
+		return answer(request, self._mock)
+
+	def SubmitTasks(self, request_iterator, context):
+		out = Queue()
+		state = {'outstanding': 0, 'input_done': False}
+		lock = threading.Lock()
+
+		def resolved(response):
+			self._answered()
+			out.put(TaskResponseBatch(responses = [response]))
+			with lock:
+				state['outstanding'] -= 1
+				if state['input_done'] and state['outstanding'] == 0:
+					out.put(None)
+
+		def read_requests():
+			try:
+				for batch in request_iterator:
+					backlog = self._count(len(batch.tasks))
+					with lock:
+						state['outstanding'] += len(batch.tasks)
+					self._acknowledge(backlog)
+					out.put(TaskResponseBatch(responses = [TaskResponse(task_id = t.task_id, return_code = TaskResponse.ACCEPTED) for t in batch.tasks]))
+					for automan_task in batch.tasks:
+						response = answer(automan_task, self._mock)
+						self._scheduler.call_later(self._delay(), lambda response = response: resolved(response))
+			except grpc.RpcError:
+				# the client went away, end the response stream
+				out.put(None)
+				return
+			with lock:
+				state['input_done'] = True
+				if state['outstanding'] == 0:
+					out.put(None)
+
+		reader = threading.Thread(target = read_requests)
+		reader.daemon = True
+		reader.start()
+		while True:
+			response_batch = out.get()
+			if response_batch is None:
+				return
+			yield response_batch
+
+	def PostTask(self, request, context):
+		with self._lock:
+			full = self.capacity is not None and self.outstanding >= self.capacity
+			if full:
+				self.rejected += 1
+		if full:
+			context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, "%d tasks outstanding" % self.capacity)
+		self._acknowledge(self._count(1))
+		task_id = str(uuid.uuid4())
+		with self._lock:
+			self._posted[task_id] = [None, None]
+		response = answer(request, self._mock)
+		response.task_id = task_id
+		self._scheduler.call_later(self._delay(), lambda: self._posted_resolved(task_id, response))
+		return TaskTicket(task_id = task_id)
+
+	def _posted_resolved(self, task_id, response):
+		with self._lock:
+			self.outstanding -= 1
+			entry = self._posted[task_id]
+			entry[0] = response
+			watcher = entry[1]
+		self._scheduler.call_later(POSTED_TTL, lambda: self._drop_posted(task_id, response))
+		if watcher is not None:
+			watcher(response)
+
+	def _drop_posted(self, task_id, response):
+		with self._lock:
+			entry = self._posted.get(task_id)
+			if entry is not None and entry[0] is response:
+				del self._posted[task_id]
+
+	def WatchOutcomes(self, request_iterator, context):
+		out = Queue()
+		state = {'outstanding': 0, 'input_done': False}
+		lock = threading.Lock()
+
+		def resolved(response):
+			out.put(response)
+			with lock:
+				state['outstanding'] -= 1
+				if state['input_done'] and state['outstanding'] == 0:
+					out.put(None)
+
+		def read_requests():
+			try:
+				for ticket in request_iterator:
+					with lock:
+						state['outstanding'] += 1
+					with self._lock:
+						entry = self._posted.get(ticket.task_id)
+						ready = None
+						if entry is not None:
+							entry[1] = resolved
+							ready = entry[0]
+					if entry is None:
+						resolved(TaskResponse(task_id = ticket.task_id, return_code = TaskResponse.ERROR, err_code = TaskResponse.UNKNOWN_TASK_ID))
+					elif ready is not None:
+						resolved(ready)
+			except grpc.RpcError:
+				# the client went away, end the response stream
+				out.put(None)
+				return
+			with lock:
+				state['input_done'] = True
+				if state['outstanding'] == 0:
+					out.put(None)
+
+		reader = threading.Thread(target = read_requests)
+		reader.daemon = True
+		reader.start()
+		while True:
+			response = out.get()
+			if response is None:
+				return
+			yield response
+			# the response was sent, as on the RPC server the task stays posted until then
+			with self._lock:
+				entry = self._posted.get(response.task_id)
+				if entry is not None and entry[0] is response:
+					del self._posted[response.task_id]
+
+	def ServerStatus(self, request, context):
+		return ServerStatusResponse(return_code = ServerStatusResponse.RUNNING)
+
+	def RegisterAdapter(self, request, context):
+		# as on the RPC server, the first adapter registered is used and a different one is refused
+		with self._lock:
+			if self._adapter is None:
+				self._adapter = request
+				if request.adptr_type == AdapterCredentials.MOCK:
+					self._mock = MockBackend(dict(request.adapter_options))
+			if self._adapter != request:
+				return ServerStatusResponse(return_code = ServerStatusResponse.FAILED)
+		return ServerStatusResponse(return_code = ServerStatusResponse.SUCCESS)
+
+	def KillServer(self, request, context):
+		return ServerStatusResponse(return_code = ServerStatusResponse.KILLED)
+
+	def OpenSession(self, request, context):
+		with self._lock:
+			self._sessions[request.session_id] = monotonic() + SESSION_LEASE
+			self._last_session = monotonic()
+			return SessionResponse(return_code = ServerStatusResponse.SUCCESS, sessions = len(self._sessions), lease_seconds = SESSION_LEASE)
+
+	def CloseSession(self, request, context):
+		with self._lock:
+			self._sessions.pop(request.session_id, None)
+			self._last_session = monotonic()
+			return SessionResponse(return_code = ServerStatusResponse.SUCCESS, sessions = len(self._sessions), lease_seconds = SESSION_LEASE)
+
+	def idle_for(self):
+		"""
+		Drops the sessions whose lease ran out, and returns the number of seconds since a session was last open
+		"""
+		with self._lock:
+			now = monotonic()
+			self._sessions = dict((session_id, end) for session_id, end in self._sessions.items() if end >= now)
+			if self._sessions:
+				self._last_session = now
+			return now - self._last_session
+
+def target(port, socket_path = None):
+	"""
+	Returns the address a client dials the stand-in at
+	"""
+	return 'unix:' + os.path.abspath(socket_path) if socket_path else 'localhost:%d' % port
+
+def serve(port, latency = 0.0, max_workers = 256, socket_path = None, launch_s = 0.0, ack_s = 0.0, capacity = None):
+	"""
+	Starts a stand-in server listening on localhost:port, or on socket_path if set, and returns the
+	grpc.Server and the servicer
+	"""
+	# gRPC core cancels calls beyond max_pending_requests waiting for a handler thread, a limit the RPC
+	# server (grpc-java) does not have
+	server = grpc.server(futures.ThreadPoolExecutor(max_workers = max_workers), options = [
+			('grpc.server.max_pending_requests', 1000000), ('grpc.server.max_pending_requests_hard_limit', 1000000)])
+	servicer = StandinServicer(latency = latency, launch_s = launch_s, ack_s = ack_s, capacity = capacity)
+	rpclib.add_PyautomanPrototypeServicer_to_server(servicer, server)
+	if socket_path and os.path.exists(socket_path):
+		os.remove(socket_path)
+	server.add_insecure_port(target(port, socket_path))
+	server.start()
+	return server, servicer
+
+def command(port, latency = 0.0, idle_ttl = None, socket_path = None, launch_ms = 0.0, ack_ms = 0.0, capacity = None):
+	"""
+	Returns the command line that runs a stand-in server on port, or on socket_path if set
+	"""
+	cmd = [sys.executable, os.path.abspath(__file__), '--port', str(port), '--latency', str(latency)]
+	if idle_ttl is not None:
+		cmd += ['--idle-ttl', str(idle_ttl)]
+	if socket_path:
+		cmd += ['--socket', os.path.abspath(socket_path)]
+	if launch_ms:
+		cmd += ['--launch-ms', str(launch_ms)]
+	if ack_ms:
+		cmd += ['--ack-ms', str(ack_ms)]
+	if capacity is not None:
+		cmd += ['--capacity', str(capacity)]
+	return cmd
+
+def start_process(port, latency = 0.0, timeout = 30, socket_path = None, launch_ms = 0.0, ack_ms = 0.0, capacity = None):
+	"""
+	Starts a stand-in server in a separate process, so that it does not share the GIL with the client
+	being measured, and waits until it accepts calls. Returns the Popen object of the process
+	"""
+	proc = subprocess.Popen(command(port, latency, socket_path = socket_path, launch_ms = launch_ms, ack_ms = ack_ms, capacity = capacity),
+							stdout = subprocess.DEVNULL)
+	channel = grpc.insecure_channel(target(port, socket_path))
+	try:
+		grpc.channel_ready_future(channel).result(timeout = timeout)
+	except grpc.FutureTimeoutError:
+		proc.kill()
+		raise
+	finally:
+		channel.close()
+	return proc
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('--port', type = int, default = 50051)
+	parser.add_argument('--latency', type = float, default = 0.0)
+	parser.add_argument('--launch-ms', type = float, default = 0.0)
+	parser.add_argument('--idle-ttl', type = float, default = None)
+	parser.add_argument('--socket', default = None)
+	parser.add_argument('--ack-ms', type = float, default = 0.0)
+	parser.add_argument('--capacity', type = int, default = None)
+	args = parser.parse_args()
+	server, servicer = serve(args.port, args.latency, socket_path = args.socket, launch_s = args.launch_ms / 1000.0,
+								ack_s = args.ack_ms / 1000.0, capacity = args.capacity)
+	print("Stand-in server started on %s ..." % target(args.port, args.socket))
+	if args.idle_ttl is None:
+		server.wait_for_termination()
+	else:
+		# wait_for_termination returns True when it times out
+		while server.wait_for_termination(timeout = 1):
+			if servicer.idle_for() >= args.idle_ttl:
+				server.stop(0)
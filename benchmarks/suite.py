@@ -0,0 +1,227 @@
+"""
+End-to-end benchmark suite for the Python client, run against the stand-in server in a separate
+process. For each task count it measures, in a fresh client process:
+
+	init_ms 					Automan.__init__ against a running server (status check and adapter registration)
+	init_spawn_ms 				Automan.__init__ when it has to start the server itself, here a stand-in in place of the JVM server
+	init_attach_ms 				Automan.__init__ with reuse_server=True against a running server (adds the lock file and a session)
+	submit_<kind>_p50/p95/p99_ms 	the time estimate() and radio() take to return
+	roundtrip_p50/p95/p99_ms 	the time from submitting a task until its outcome resolves, one task at a time
+	resolve_p50/p95/p99_ms 		the same, for tasks submitted back to back, so it includes the time spent queued
+	tasks_per_s 				tasks submitted and resolved per second, over the whole run
+	rss_mb 						the peak resident set size of the client process
+
+Half of the tasks are estimate tasks and half radio tasks, and every outcome is kept until the end
+of the run, as a client collecting results would.
+
+"run" prints the results, and writes them to --out as JSON. "baseline" writes them to the baseline
+file instead. "check" runs the suite and compares it against the baseline file, exiting with status 1
+if any metric regressed by more than --tolerance (twice that for p95 and p99). Baselines are machine specific: record one on the
+machine the checks run on.
+
+usage: python suite.py run|baseline|check [--sizes 1000,10000,100000] [--baseline FILE] [--out FILE]
+			[--tolerance FRACTION] [--latency SECONDS] [--port PORT]
+
+The stand-in runs on PORT, and PORT+1 is used to measure init_spawn_ms.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import threading
+from time import monotonic
+
+import standin_server
+from standin_server import start_process
+
+ADAPTER = {"type" : "mock", "seed" : 1, "answers_per_task" : 5}
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'standin.json')
+# metrics where a higher value is better, every other metric is better lower
+HIGHER_IS_BETTER = set(['tasks_per_s'])
+# the number of tasks the unloaded round trip is measured over, before the timed run
+ROUNDTRIP_TASKS = 200
+# changes in millisecond metrics smaller than this are noise, and never count as a regression
+MIN_DELTA_MS = 1.0
+# tail percentiles vary more from run to run, and are allowed this many times the tolerance
+TAIL_TOLERANCE_FACTOR = 2.0
+
+def percentiles(name, samples):
+	"""
+	Returns the p50, p95 and p99 of samples (in seconds) in milliseconds, keyed name_pXX_ms
+	"""
+	samples = sorted(samples)
+	if not samples:
+		return {}
+	pick = lambda q: 1000 * samples[min(len(samples) - 1, int(len(samples) * q))]
+	return {name + '_p50_ms' : pick(0.50), name + '_p95_ms' : pick(0.95), name + '_p99_ms' : pick(0.99)}
+
+def peak_rss_mb():
+	rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# kilobytes on Linux, bytes on macOS
+	return rss / (1024.0 * 1024.0) if sys.platform == 'darwin' else rss / 1024.0
+
+def spawn_init_ms(port):
+	"""
+	Returns the time Automan.__init__ takes when no server is running on port and it starts one.
+	The stand-in is started in place of the RPC server, so this measures how fast the client notices
+	a server is ready, not the JVM's startup time
+	"""
+	import automanpy.automan
+	from automanpy.automan import Automan
+
+	def start_standin(port, stdout_file = None, stderr_file = None, stderr_log = None, **kwargs):
+		return subprocess.Popen(standin_server.command(port), stdout = subprocess.DEVNULL, stderr = stderr_log)
+
+	start_rpc_server = automanpy.automan.start_rpc_server
+	automanpy.automan.start_rpc_server = start_standin
+	try:
+		start = monotonic()
+		a = Automan(dict(ADAPTER), port = port)
+		init_ms = 1000 * (monotonic() - start)
+		a.srvr_popen_obj.kill()
+		a.srvr_popen_obj.wait()
+	finally:
+		automanpy.automan.start_rpc_server = start_rpc_server
+	return init_ms
+
+def scenario(port, n_tasks):
+	"""
+	Runs one measurement in this process, and returns its metrics
+	"""
+	from automanpy.automan import Automan
+
+	init_spawn_ms = spawn_init_ms(port + 1)
+	start = monotonic()
+	a = Automan(dict(ADAPTER), port = port)
+	init_ms = 1000 * (monotonic() - start)
+
+	start = monotonic()
+	Automan(dict(ADAPTER), port = port, reuse_server = True)
+	init_attach_ms = 1000 * (monotonic() - start)
+
+	roundtrip = []
+	for i in range(ROUNDTRIP_TASKS):
+		submitted_at = monotonic()
+		a.estimate(text = "roundtrip-%d" % i, budget = 1.50).done()
+		roundtrip.append(monotonic() - submitted_at)
+
+	submit = {'estimate' : [], 'radio' : []}
+	resolve = []
+	lock = threading.Lock()
+	all_done = threading.Event()
+
+	def resolved(submitted_at):
+		with lock:
+			resolve.append(monotonic() - submitted_at)
+			if len(resolve) == n_tasks:
+				all_done.set()
+
+	outcomes = []
+	run_start = monotonic()
+	for i in range(n_tasks):
+		submitted_at = monotonic()
+		if i % 2:
+			outcome = a.radio(text = "task-%d: which of these is a cat?" % i, budget = 1.00, options = {'a' : 'Cat', 'b' : 'Dog'})
+			kind = 'radio'
+		else:
+			outcome = a.estimate(text = "task-%d: how many cars are in this parking lot?" % i, budget = 1.50)
+			kind = 'estimate'
+		submit[kind].append(monotonic() - submitted_at)
+		outcome.add_done_callback(lambda _outcome, submitted_at = submitted_at: resolved(submitted_at))
+		outcomes.append(outcome)
+	all_done.wait()
+	wall = monotonic() - run_start
+
+	metrics = {'tasks' : n_tasks, 'init_ms' : init_ms, 'init_spawn_ms' : init_spawn_ms, 'init_attach_ms' : init_attach_ms, 'tasks_per_s' : n_tasks / wall, 'rss_mb' : peak_rss_mb()}
+	for kind, samples in submit.items():
+		metrics.update(percentiles('submit_' + kind, samples))
+	metrics.update(percentiles('roundtrip', roundtrip))
+	metrics.update(percentiles('resolve', resolve))
+	return metrics
+
+def run_suite(sizes, port, latency):
+	"""
+	Starts the stand-in, runs each size in a fresh client process, and returns the results
+	"""
+	proc = start_process(port, latency)
+	try:
+		runs = {}
+		for n_tasks in sizes:
+			out = subprocess.check_output([sys.executable, os.path.abspath(__file__), 'scenario', '--tasks', str(n_tasks), '--port', str(port)])
+			runs[str(n_tasks)] = json.loads(out.decode().strip().splitlines()[-1])
+			report(runs[str(n_tasks)])
+	finally:
+		proc.kill()
+	return {'meta' : {'python' : platform.python_version(), 'machine' : platform.machine(), 'latency_s' : latency}, 'runs' : runs}
+
+def report(metrics):
+	print("tasks=%-7d init=%6.1fms spawn=%6.1fms attach=%6.1fms  submit p50/p99 est=%.3f/%.3fms radio=%.3f/%.3fms  roundtrip p50/p99=%.2f/%.2fms  resolve p50/p95/p99=%.0f/%.0f/%.0fms  %6.0f tasks/s  rss=%6.1fMB" % (
+			metrics['tasks'], metrics['init_ms'], metrics.get('init_spawn_ms', float('nan')), metrics.get('init_attach_ms', float('nan')), metrics['submit_estimate_p50_ms'], metrics['submit_estimate_p99_ms'],
+			metrics['submit_radio_p50_ms'], metrics['submit_radio_p99_ms'], metrics['roundtrip_p50_ms'], metrics['roundtrip_p99_ms'],
+			metrics['resolve_p50_ms'], metrics['resolve_p95_ms'],
+			metrics['resolve_p99_ms'], metrics['tasks_per_s'], metrics['rss_mb']))
+
+def compare(baseline, current, tolerance):
+	"""
+	Compares the runs in current against the runs of the same size in baseline. Prints one line per
+	metric, and returns the list of regressions
+	"""
+	regressions = []
+	for size, base_run in sorted(baseline['runs'].items(), key = lambda item: int(item[0])):
+		run = current['runs'].get(size)
+		if run is None:
+			continue
+		for metric in sorted(base_run):
+			if metric == 'tasks' or metric not in run:
+				continue
+			before, after = base_run[metric], run[metric]
+			change = (after - before) / before if before else 0.0
+			worse = -change if metric in HIGHER_IS_BETTER else change
+			noise = metric.endswith('_ms') and abs(after - before) < MIN_DELTA_MS
+			allowed = tolerance * TAIL_TOLERANCE_FACTOR if metric.endswith(('_p95_ms', '_p99_ms')) else tolerance
+			status = 'REGRESSED' if worse > allowed and not noise else 'ok'
+			if status != 'ok':
+				regressions.append((size, metric, before, after))
+			print("%-7s %-24s %12.3f -> %12.3f  %+7.1f%%  %s" % (size, metric, before, after, 100 * change, status))
+	return regressions
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+	parser.add_argument('command', choices = ['run', 'baseline', 'check', 'scenario'])
+	parser.add_argument('--sizes', default = '1000,10000,100000', help = 'comma separated task counts')
+	parser.add_argument('--tasks', type = int, help = argparse.SUPPRESS)
+	parser.add_argument('--baseline', default = DEFAULT_BASELINE)
+	parser.add_argument('--out', help = 'file to write the results of "run" to')
+	parser.add_argument('--tolerance', type = float, default = 0.25, help = 'allowed relative regression per metric')
+	parser.add_argument('--latency', type = float, default = 0.0, help = 'latency of the stand-in server, in seconds')
+	parser.add_argument('--port', type = int, default = 50072)
+	args = parser.parse_args()
+
+	if args.command == 'scenario':
+		# one measurement, run by run_suite in its own process
+		print(json.dumps(scenario(args.port, args.tasks)))
+		sys.stdout.flush()
+		os._exit(0)
+
+	sizes = [int(size) for size in args.sizes.split(',')]
+	results = run_suite(sizes, args.port, args.latency)
+	if args.command == 'run' and args.out:
+		with open(args.out, 'w') as out:
+			json.dump(results, out, indent = 2, sort_keys = True)
+	elif args.command == 'baseline':
+		if not os.path.isdir(os.path.dirname(args.baseline)):
+			os.makedirs(os.path.dirname(args.baseline))
+		with open(args.baseline, 'w') as out:
+			json.dump(results, out, indent = 2, sort_keys = True)
+		print("baseline written to %s" % args.baseline)
+	elif args.command == 'check':
+		with open(args.baseline) as base:
+			baseline = json.load(base)
+		regressions = compare(baseline, results, args.tolerance)
+		if regressions:
+			print("%d metric(s) regressed by more than %.0f%%" % (len(regressions), 100 * args.tolerance))
+			sys.exit(1)
+		print("no regressions")
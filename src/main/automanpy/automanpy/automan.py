@@ -1,11 +1,22 @@
+import asyncio
+import os
 import sys
 import atexit
-from time import sleep
+from itertools import islice
+from tempfile import TemporaryFile
 
-from automanpy.core.automanlib import make_adapter,start_rpc_server, shutdown_rpc_server, get_server_status, register_adapter_to_server,shutdown_rpc_server,make_channel,make_est_task, make_rad_task, submit_task
-from automanpy.core.batchjob import Batch 
+from automanpy.core.automanlib import make_adapter,start_rpc_server, wait_for_rpc_server, shutdown_rpc_server, get_server_status, register_adapter_to_server,shutdown_rpc_server,make_channel_pool,find_free_port,make_est_task, make_rad_task, post_task, post_task_async, ChannelPool
+from automanpy.core.batchjob import Batch, StreamingBatch
+from automanpy.core.cache import OutcomeCache
+from automanpy.core.dedupe import InflightRegistry, task_key
+from automanpy.core.sinks import Sink, CallbackSink
+from automanpy.core.taskstream import TaskStream
+from automanpy.core.template import TaskTemplate
+from automanpy.core.watcher import OutcomeWatcher
+from automanpy.core.window import SubmissionWindow, AdaptiveWindow
 from automanpy.core.outcomes import EstimateOutcome, RadioOutcome
-from automanpy.core.automanlib_rpc_pb2 import TaskResponse, ServerStatusResponse
+from automanpy.core.schema import ESTIMATE, RADIO
+from automanpy.core.automanlib_rpc_pb2 import AutomanTask, TaskResponse, ServerStatusResponse
 from automanpy.core.grpc_classes.automanlib_classes_pb2 import SymmetricConInt, AsymmetricConInt, UnconstrainedConInt, Task
 from automanpy.core.pyautomanexceptions import ArgumentError, UnsupportedServerError, AdapterError, RPCServerError
 
@@ -83,14 +94,44 @@ class Automan():
 		An integer representing the desired log verbosity for the AutoMan worker
 	srvr_addr : str
 		The hostname for the gRPC server
+	remote : bool
+		Whether the gRPC server is on another host, in which case it must already be running
 	port : int 
-		The port to connect to on the hostname 
+		The port to connect to on the hostname. The port picked, if the object was created with port="auto"
+	auto_port : bool
+		Whether the port was picked by this object, for a server of its own
+	transport : str
+		How the gRPC channels reach the server, 'tcp' or 'uds'
+	socket_path : str
+		The path of the Unix domain socket the server listens on, if transport is 'uds'
 	channel: Channel
-		The gRPC channel to communicate over
+		The gRPC channel to communicate over. The first channel of channel_pool
+	channel_pool : ChannelPool
+		The gRPC channels tasks are posted over
 	srvr_popen_obj : Popen 
 		The Popen object returned when the RPC AutoMan scala server is started
 	supr_lvl : string 
 		Specifies how much of the output to suppress from the RPC server
+	workers : int
+		The number of AutoMan workers the RPC server is started with
+	startup_timeout : float
+		The number of seconds to wait for a spawned RPC server to be ready
+	reuse_server : bool
+		Whether the RPC server is a daemon shared with other client processes
+	idle_ttl : int
+		The number of seconds a daemon RPC server started by this object keeps running without client sessions
+	session : ServerSession
+		This object's session on the shared RPC server, if reuse_server is set
+	watcher : OutcomeWatcher
+		Resolves the outcomes of submitted tasks from the WatchOutcomes stream
+	inflight : InflightRegistry
+		The outcomes of the submitted tasks still in flight, shared by identical submissions, with hit and miss 
+		counters. None if the object was created with dedupe=False
+	cache : OutcomeCache
+		The persistent store of resolved outcomes, or None if the object was created without one
+	window : SubmissionWindow
+		Bounds the tasks in flight and the rate they are posted at, an AdaptiveWindow if max_in_flight was 
+		'adaptive', or None if the object was created without max_in_flight or max_rate
 	"""
 
 	#dicts declared here are used internally for convenience to map user supplied strings to integers
@@ -112,11 +153,30 @@ class Automan():
 	LogLevelVals = ['debug','info','warn','fatal']
 	LoggingVals =  ['none','t','tm','tv','tmv']
 
-	#max number of attempts to connect to RPC server when attempting to spawn a new one
-	MAX_CON_TRIES = 20
+	#default number of seconds to wait for a spawned RPC server to accept connections
+	STARTUP_TIMEOUT = 100
+	#default number of seconds a shared RPC server runs without client sessions
+	IDLE_TTL = 600
+	ChannelPolicyVals = ChannelPool.POLICIES
+	TransportVals = ['tcp', 'uds']
+	#the longest socket path a Unix domain socket address holds
+	MAX_SOCKET_PATH = 107
+	#number of free ports tried when port="auto", in case another process takes the one picked before the server binds it
+	AUTO_PORT_ATTEMPTS = 3
+	#hostnames of this host, where servers can be started
+	LOCAL_ADDRS = ['localhost', '127.0.0.1', '::1']
+	#the arguments estimate_many and radio_many take once for every task
+	SharedArgs = {'estimate' : ('confidence', 'confidence_int', 'dont_reject', 'dry_run', 'initial_worker_timeout_in_s', 'img_alt_txt',
+									'max_value', 'min_value', 'pay_all_on_failure', 'question_timeout_multiplier', 'sample_size', 'wage',
+									'mock_answers'),
+					'radio' : ('options', 'confidence', 'dont_reject', 'dry_run', 'initial_worker_timeout_in_s', 'img_alt_txt',
+								'pay_all_on_failure', 'question_timeout_multiplier', 'wage', 'mock_answers')}
 
 	def __init__(self, adapter, server_addr = 'localhost', port = 50051, suppress_output = 'all', 
-					loglevel = 'fatal', logging='none', stdout =None, stderr = None, testmode=False):
+					loglevel = 'fatal', logging='none', stdout =None, stderr = None, testmode=False, workers = 1, 
+					startup_timeout = STARTUP_TIMEOUT, reuse_server = False, idle_ttl = IDLE_TTL, channels = 1, 
+					channel_policy = 'round_robin', transport = 'tcp', socket_path = None, dedupe = True, 
+					cache = None, max_in_flight = None, max_rate = None):
 		"""
 		Ensure necessary fields in adapter are initializated and
 		set up the gRPC channel
@@ -124,11 +184,15 @@ class Automan():
 		Parameters
 		----------
 		adapter : dict
-			A dictionary containing the parameters for the adapter
+			A dictionary containing the parameters for the adapter. An adapter of type "mock" needs no credentials, 
+			and runs tasks against simulated workers, see automanlib.make_adapter for its options
 		server_addr : str
-			The hostname for the gRPC server
-		port : int 
-			The port to connect to on the hostname 
+			The hostname for the gRPC server. A server on another host is not started by this object: it must already 
+			be running, and is not shut down when the process exits
+		port : int or str
+			The port to connect to on the hostname. 0 or "auto" picks a free port and always starts a server of this 
+			object's own on it, rather than attaching to a server another job started. The port picked is kept in 
+			the port attribute. Cannot be combined with reuse_server
 		suppress_output : string
 			Specifies how much of the output to suppress from the RPC server. Values are:
 				all 	- suppress all output from rpc server
@@ -151,6 +215,55 @@ class Automan():
 				'tmv' 	- log trace, use for memoization and output debug info
 		testmode : bool
 			Specifies whether the object is being created in test mode. Test mode does not start the RPC Server
+		workers : int
+			The number of AutoMan workers launching tasks on the RPC server, if this object starts the server. 
+			Ignored when connecting to a server that is already running
+		startup_timeout : float
+			If this object starts the RPC server, the maximum number of seconds to wait for it to accept connections. 
+			Initialization fails as soon as the server process exits, without waiting out the timeout
+		reuse_server : bool
+			If True, attach to the RPC server shared by the client processes on this port, starting it as a daemon if 
+			none is running, and hold a session on it until this process exits. The server keeps running when the 
+			process exits, and shuts itself down once it has had no session for idle_ttl seconds. Every process 
+			sharing the server must use the same adapter. If False, a server this object starts, or finds running, is 
+			shut down when the process exits
+		idle_ttl : int
+			If reuse_server is True and this object starts the shared RPC server, the number of seconds the server 
+			keeps running without client sessions. 0 shuts it down as soon as the last session is closed
+		channels : int
+			The number of gRPC channels tasks are posted over, each with its own connection to the server. More than 
+			one spreads the tasks posted by many threads over several connections
+		channel_policy : string
+			How the channel of each posted task is picked. Values are:
+				'round_robin' 	- the channels in turn
+				'least_loaded' 	- the channel with the fewest calls in flight
+		transport : string
+			How the client talks to the local RPC server. Values are:
+				'tcp' 	- over a TCP connection to server_addr and port
+				'uds' 	- over a Unix domain socket at socket_path, which skips the TCP/IP stack. A server this 
+							object starts listens on the socket instead of the port
+		socket_path : str
+			The path of the Unix domain socket if transport is 'uds'. Defaults to server-<port>.sock in the runtime 
+			directory of shared servers, see daemon.runtime_dir
+		dedupe : bool
+			If True, a task identical to one submitted by this object that has not resolved yet (same type, text, 
+			title, image_url and parameters) is not posted again: it is given the outcome of the first, and is paid 
+			for once. False posts every task
+		cache : str or OutcomeCache
+			A persistent store of resolved outcomes, or the path of the SQLite database of one. A task whose outcome 
+			is in the store is not posted: its outcome is served from the store at once, so a script that is run 
+			again only posts the tasks it has no outcome for yet. A store opened from a path is closed by shutdown. 
+			Pass an OutcomeCache to set its ttl and size bound, and close it yourself. None (default) stores nothing
+		max_in_flight : int, str or SubmissionWindow
+			The most tasks this object keeps posted and unresolved at once. A submission that would post more waits 
+			until earlier tasks resolve: estimate and radio block, the coroutines of AsyncAutoman wait, and 
+			submit_many sends its tasks as slots free up. 'adaptive' lets the bound adjust itself to the server, 
+			see AdaptiveWindow: it grows while the server acknowledges tasks quickly, and shrinks when it slows 
+			down or turns tasks away. Pass an AdaptiveWindow to tune it, or any SubmissionWindow to share one 
+			between several objects, max_rate then being the window's own. None (default) does not bound them
+		max_rate : float
+			The most tasks this object posts per second, enforced with a token bucket that lets through bursts of up 
+			to max_rate tasks. None (default) does not bound it. See window_metrics for the waits either causes
 		[NOT YET IMPLEMENTED]
 		stdout : string
 			File path to write RPC server standard output to
@@ -159,10 +272,12 @@ class Automan():
 		
 		Raises
 		------
-		AdapterError: Indicates there was an error creating the adapter, see msg field of exception for more info
+		AdapterError: Indicates there was an error creating the adapter, see msg field of exception for more info, or 
+						that the shared server runs a different adapter
 		ArgumentError: Indicates there was an error with one of the supplied arguments
-		UnsupportedServerError: Currently, only local servers (server_addr ='localhost') is supported, this is thrown 
-								the user intends to create a server that is not on localhost
+		UnsupportedServerError: Indicates a server on another host was combined with reuse_server, port="auto" or 
+								transport="uds", which need the server on localhost
+		RPCServerError: Indicates the server could not be started or reached
 
 		"""
 
@@ -170,33 +285,98 @@ class Automan():
 		if not isinstance(adapter, dict): 
 			raise ArgumentError("adapter must be of type dict")
 		if not isinstance(server_addr, str) or not server_addr.strip(): 
-			raise ArgumentError("server_addr must be of type str (only 'localhost' supported), cannot be empty")
-		if not isinstance(port, int) or port<=0: 
-			raise ArgumentError("port must be of type int, must be greater than 0")
+			raise ArgumentError("server_addr must be of type str, cannot be empty")
+		auto_port = port == 'auto' or (port == 0 and not isinstance(port, bool))
+		if not auto_port and (not isinstance(port, int) or isinstance(port, bool) or port<=0): 
+			raise ArgumentError("port must be of type int, must be greater than 0, or 0 or 'auto' to pick a free port")
 		if not isinstance(suppress_output, str) or not suppress_output.strip() or suppress_output.strip() not in Automan.SupprOutVals: 
 			raise ArgumentError("suppress_output must be of type str, cannot be empty")
 		if not isinstance(loglevel, str) or not loglevel.strip() or loglevel.strip() not in Automan.LogLevelVals: 
 			raise ArgumentError("loglevel must be of type str, cannot be empty")
 		if not isinstance(logging, str) or not logging.strip() or logging.strip() not in Automan.LoggingVals: 
 			raise ArgumentError("logging must be of type str, cannot be empty")
+		if not isinstance(workers, int) or workers <= 0: 
+			raise ArgumentError("workers must be of type int, must be greater than 0")
+		if not isinstance(startup_timeout, (int, float)) or startup_timeout <= 0: 
+			raise ArgumentError("startup_timeout must be of type float, must be greater than 0")
+		if not isinstance(reuse_server, bool): 
+			raise ArgumentError("reuse_server must be of type bool")
+		if not isinstance(idle_ttl, int) or idle_ttl < 0: 
+			raise ArgumentError("idle_ttl must be of type int, cannot be negative")
+		if auto_port and reuse_server: 
+			raise ArgumentError("reuse_server needs a fixed port, which the client processes sharing the server agree on")
+		if reuse_server:
+			from automanpy.core.daemon import HAS_FILE_LOCKS
+			if not HAS_FILE_LOCKS:
+				raise ArgumentError("reuse_server needs the file locks of fcntl, which this platform does not have")
+		if not isinstance(channels, int) or channels <= 0: 
+			raise ArgumentError("channels must be of type int, must be greater than 0")
+		if not isinstance(channel_policy, str) or channel_policy not in Automan.ChannelPolicyVals: 
+			raise ArgumentError("channel_policy must be one of "+", ".join(Automan.ChannelPolicyVals))
+		if not isinstance(transport, str) or transport not in Automan.TransportVals: 
+			raise ArgumentError("transport must be one of "+", ".join(Automan.TransportVals))
+		if socket_path is not None and (not isinstance(socket_path, str) or not socket_path.strip()): 
+			raise ArgumentError("socket_path must be of type str, cannot be empty")
+		if not isinstance(dedupe, bool): 
+			raise ArgumentError("dedupe must be of type bool")
+		if cache is not None and not isinstance(cache, (str, OutcomeCache)): 
+			raise ArgumentError("cache must be the path of a cache database, or of type OutcomeCache")
+		if isinstance(max_in_flight, SubmissionWindow):
+			if max_rate is not None:
+				raise ArgumentError("max_rate must be None when max_in_flight is a SubmissionWindow, set it on the window")
+			window = max_in_flight
+		elif isinstance(max_in_flight, str):
+			if max_in_flight != 'adaptive':
+				raise ArgumentError("max_in_flight must be of type int, 'adaptive', or of type SubmissionWindow")
+			window = AdaptiveWindow(max_rate = max_rate)
+		else:
+			window = SubmissionWindow(max_in_flight, max_rate) if max_in_flight is not None or max_rate is not None else None
+		remote = server_addr.strip().lower() not in Automan.LOCAL_ADDRS
+		if remote and (reuse_server or auto_port or transport == 'uds'):
+			raise UnsupportedServerError("reuse_server, port='auto' and transport='uds' need a server at localhost, not "+server_addr)
+		if auto_port:
+			port = find_free_port(server_addr)
+		if transport == 'uds':
+			from automanpy.core.daemon import runtime_dir
+			socket_path = os.path.abspath(socket_path or os.path.join(runtime_dir(), "server-"+str(port)+".sock"))
+			if len(socket_path) > Automan.MAX_SOCKET_PATH: 
+				raise ArgumentError("socket_path must be at most "+str(Automan.MAX_SOCKET_PATH)+" characters long")
+		else:
+			socket_path = None
 
 		# these checks will become relevant when file logging is in place
 		#if stdout and not isinstance(stdout, str): raise ArgumentError("stdout must be of type str (desired path to file)")
 		#if stderr and not isinstance(stderr, str): raise ArgumentError("stderr must be of type str (desired path to file)")
 
-		# this is only temporary
-		if server_addr.lower() != "localhost":
-			raise UnsupportedServerError()
-
 		self.lglvl = Automan.LogLevels.get(loglevel.lower(), Automan.LogLevels['fatal'])
 		self.lg =  Automan.Logging.get(logging.lower(), Automan.Logging['tm'])
 		self.srvr_addr = server_addr
+		self.remote = remote
 		self.port = port
+		self.auto_port = auto_port
 		self.srvr_popen_obj = None
 		self.supr_lvl = suppress_output
+		self.workers = workers
+		self.startup_timeout = startup_timeout
+		self.reuse_server = reuse_server
+		self.idle_ttl = idle_ttl
+		self.session = None
+		# the atexit hook that shuts the server down or closes the session, unregistered by shutdown
+		self._exit_hook = None
+		# the spawned server's error output, kept to report why it failed to start
+		self._srvr_stderr = None
 		self.stdout_file = stdout
 		self.stderr_file = stderr
 		self.channel = None
+		self.n_channels = channels
+		self.channel_policy = channel_policy
+		self.transport = transport
+		self.socket_path = socket_path
+		self.inflight = InflightRegistry() if dedupe else None
+		self.cache = OutcomeCache(cache) if isinstance(cache, str) else cache
+		# a cache opened from a path is closed with this object, one passed in is left to the caller
+		self._owns_cache = isinstance(cache, str)
+		self.window = window
 
 		try:
 			_adptr = make_adapter(adapter, self.lglvl, self.lg) 
@@ -206,74 +386,216 @@ class Automan():
 
 		# set up channel, start and connect to gRPC server
 		chanl = self._init_channel(server_addr, port)
+		self.watcher = OutcomeWatcher(chanl)
 
 		if not testmode:
-			self._start()
-			self._register_adptr()
-			@atexit.register
-			def _shutdown():
-				"""
-				Private method. Shutdown the gRPC server
+			if reuse_server:
+				self._attach()
+				session = self.session
+				@atexit.register
+				def _close_session():
+					"""
+					Private method. Close this object's session on the shared gRPC server
 
-				"""
-				shutdown_rpc_server(chanl)
+					"""
+					session.close()
+				self._exit_hook = _close_session
+			elif remote:
+				self._connect()
+			else:
+				self._start()
+				chanl = self.channel
+				@atexit.register
+				def _shutdown():
+					"""
+					Private method. Shutdown the gRPC server
+
+					"""
+					shutdown_rpc_server(chanl)
+				self._exit_hook = _shutdown
+			self._register_adptr()
 
-	def _start(self, sleep_time = 5):
+	def _start(self):
 		"""
 		Private method, used to start the gRPC AutoMan server on the specified channel.  If a server is already started on
-		this channel, the client will send requests. If a server is not started, the client will start one and wait until it is ready.
+		this channel, the client will send requests. If a server is not started, the client will start one and wait until it 
+		accepts connections, for at most startup_timeout seconds.
+
+		Raises
+		------
+		RPCServerError: Indicates the server could not be reached, or a spawned server exited or was not ready in time
+
+		"""
+		if self.auto_port:
+			self._spawn_on_free_port()
+		elif not self._server_running():
+			self._spawn()
+
+	def _connect(self):
+		"""
+		Private method, used to connect to a gRPC AutoMan server on another host, which this object cannot start
+
+		Raises
+		------
+		RPCServerError: Indicates no server answers at the address
+
+		"""
+		if not self._server_running():
+			raise RPCServerError("No server answers at "+self.srvr_addr+":"+str(self.port)+", and servers are only started on localhost")
+
+	def _spawn_on_free_port(self):
+		"""
+		Private method. Starts a gRPC AutoMan server on the free port picked for this object, without checking for a 
+		server already answering there, since that server would be another job's. If the server exits before it is 
+		ready, because another process took the port in the meantime, the server is started again on a newly picked 
+		port, with new channels to it, up to AUTO_PORT_ATTEMPTS times in all
+
+		Raises
+		------
+		RPCServerError: Indicates the server exited on every port tried, or was not ready in time
+
+		"""
+		for attempt in range(Automan.AUTO_PORT_ATTEMPTS):
+			try:
+				self._spawn()
+				return
+			except RPCServerError:
+				# a server on a socket does not bind the port, and has no other port to try
+				if self.transport == 'uds' or self.srvr_popen_obj.poll() is None or attempt + 1 == Automan.AUTO_PORT_ATTEMPTS:
+					raise
+			self.channel_pool.close()
+			self.port = find_free_port(self.srvr_addr)
+			self.watcher = OutcomeWatcher(self._init_channel(self.srvr_addr, self.port))
+
+	def _attach(self):
+		"""
+		Private method, used to attach to the gRPC AutoMan server shared by the client processes on this port, and open a
+		session on it. The processes take turns holding the port's lock file while they attach, and the one that finds no 
+		server running starts it as a daemon, and records its process ID in the port's pid file. A server that is 
+		shutting down refuses the session, in which case a new one is started once it has exited.
+
+		Raises
+		------
+		RPCServerError: Indicates the server could not be reached, or a spawned server exited or was not ready in time
+
+		"""
+		from automanpy.core.daemon import ServerLock, ServerSession
+		with ServerLock(self.port) as lock:
+			for attempt in range(2):
+				if attempt > 0 or not self._server_running():
+					if not lock.wait_for_exit(self.startup_timeout):
+						raise RPCServerError("RPC server process "+str(lock.read_pid())+" in "+lock.pid_path+
+											" is not reachable on port "+str(self.port)+" and did not exit")
+					self._spawn(idle_ttl = self.idle_ttl)
+					lock.write_pid(self.srvr_popen_obj.pid)
+				self.session = ServerSession(self.channel)
+				if self.session.open():
+					return
+		raise RPCServerError("Shared RPC server on port "+str(self.port)+" refused a session")
+
+	def _server_running(self):
+		"""
+		Private method. Returns whether a gRPC AutoMan server answers on the channel
+
+		Raises
+		------
+		RPCServerError: Indicates the server could not be reached for a reason other than it not running
 
 		"""
 		try:
-			resp = get_server_status(self.channel)
+			get_server_status(self.channel)
 		except grpc.RpcError as rpc_err:
 			if rpc_err.code() == grpc.StatusCode.UNAVAILABLE:
-				self.srvr_popen_obj = start_rpc_server(port=self.port, 
-																	suppress_output = self.supr_lvl,
-																	stdout_file = self.stdout_file, 
-																	stderr_file = self.stderr_file)
-
-				try_count = 0
-				while(try_count < Automan.MAX_CON_TRIES):
-					try:
-						resp = get_server_status(self.channel)
-						return
-					except grpc.RpcError as rpc_err:
-						sleep(sleep_time)
-					try_count = try_count + 1
-
-				self.srvr_popen_obj.kill()
-				raise RPCServerError("Attempted to start RPC server process, but unable to communicate with it after 20 tries. Client quitting ")
-			else:
-				raise RPCServerError("Unable to start server:\n"+rpc_err.details())
+				return False
+			raise RPCServerError("Unable to start server:\n"+rpc_err.details())
+		return True
+
+	def _spawn(self, idle_ttl = None):
+		"""
+		Private method. Starts a gRPC AutoMan server on the port, and waits until it accepts connections, for at most 
+		startup_timeout seconds. With idle_ttl set, the server is started as a daemon, see start_rpc_server
+
+		Raises
+		------
+		RPCServerError: Indicates the server exited or was not ready in time
+
+		"""
+		if self.supr_lvl == 'all':
+			self._srvr_stderr = TemporaryFile()
+		self.srvr_popen_obj = start_rpc_server(port=self.port, 
+															suppress_output = self.supr_lvl,
+															stdout_file = self.stdout_file, 
+															stderr_file = self.stderr_file,
+															workers = self.workers,
+															stderr_log = self._srvr_stderr,
+															idle_ttl = idle_ttl,
+															socket_path = self.socket_path)
+		wait_for_rpc_server(self.channel, self.srvr_popen_obj, self.startup_timeout, self._srvr_stderr)
 	
 	def _register_adptr(self):
 		"""
 		Private method, used to register an adapter with the server
 
+		Raises
+		------
+		AdapterError: Indicates the server runs the adapter of another client, as a shared server does when the client
+			that started it was created with a different adapter
+
 		"""
-		# handle response
 		resp = register_adapter_to_server(self.channel, self.adptr)
+		if resp.return_code == ServerStatusResponse.FAILED:
+			if self.session is not None:
+				self.session.close()
+			raise AdapterError("the RPC server on port "+str(self.port)+" runs a different adapter, and tasks would be posted with it. "
+								"Every client process sharing a server must use the same adapter")
 
 	def _force_svr_shutdown(self):
 		"""
 		Private method. Forces shutdown the gRPC server by killing spawned process
 
 		"""
-		self.srvr_popen_obj.kill()
+		if self.srvr_popen_obj is not None:
+			self.srvr_popen_obj.kill()
 
 	def shutdown(self):
 		"""
-		Shutdown the gRPC server
+		Shutdown the gRPC server. With reuse_server, closes this object's session instead, and the shared server keeps 
+		running for the other client processes using it. Closes the cache if this object opened it from a path. The 
+		server is then not shut down again when the process exits
+
+		"""
+		if self._exit_hook is not None:
+			atexit.unregister(self._exit_hook)
+			self._exit_hook = None
+		if self.session is not None:
+			self.session.close()
+		else:
+			# handle response
+			resp = shutdown_rpc_server(self.channel)
+		self._close_cache()
 
+	def _close_cache(self):
 		"""
-		# handle response
-		resp = shutdown_rpc_server(self.channel)
+		Private method. Closes the cache if this object opened it, see the cache argument of __init__
+
+		"""
+		if self._owns_cache:
+			self.cache.close()
 
 
+	def window_metrics(self):
+		"""
+		Returns the metrics of the submission window, see SubmissionWindow.metrics: the tasks in flight, the tasks
+		queued waiting for a slot, and the time spent waiting, and for an adaptive window the acknowledgement 
+		latency and the changes of the limit, see AdaptiveWindow.metrics. None if the object was created without 
+		max_in_flight or max_rate
+
+		"""
+		return self.window.metrics() if self.window is not None else None
+
 	def _init_channel(self, server_addr, port):
 		"""
-		Private method. Create the gRPC channel
+		Private method. Create the gRPC channels
 
 		Parameters
 		----------
@@ -288,85 +610,223 @@ class Automan():
 			A channel that connects to the gRPC back-end server
 
 		"""
-		self.channel = make_channel(server_addr,str(port))
+		self.channel_pool = make_channel_pool(server_addr, str(port), self.n_channels, self.channel_policy, 
+												socket_path_ = self.socket_path)
+		self.channel = self.channel_pool.channels[0]
 		return self.channel
 
-	def _args_check(self,  budget=None, image_url=None, confidence=None, confidence_int=None, dry_run=None, dont_reject=None,
-					initial_worker_timeout_in_s=None, img_alt_txt=None, max_value=None, min_value=None, options = None,
-					pay_all_on_failure=None, question_timeout_multiplier=None,  sample_size=None, text=None,title=None,  wage=None,
-					options_required=False):
-		'''
+	def estimateBatchUrl(self, text=None, budget=None, image_urls=None, title = "", confidence = 0.95, confidence_int = -1, img_alt_txt = "",sample_size = -1, dont_reject = True, 
+				pay_all_on_failure = True, dry_run = False, wage = 11.00, max_value = sys.float_info.max, min_value = sys.float_info.min, question_timeout_multiplier = 500, 
+				initial_worker_timeout_in_s = 30):
+		"""
+		Estimates the answer to the same task for each of a list of images. See estimate_many, of which this is the
+		special case of a per-task image_url
+
 		Parameters
 		----------
-		The various parameters that each task can have, see task types for details on parameters
+		image_urls : list(str)
+			The url of the image of each task, at least 2
+		See estimate for the other parameters
 
 		Returns
 		-------
-		Nothing
+		Batch
+			A Batch holding one outcome per image, in the order of image_urls
 
 		Raises
 		------
 		ArgumentError: Indicates there was an error with one of the supplied arguments
-
-		'''
-		max_conf_int=100
-		min_conf_int=50
-		max_conf_flo=1.0
-		min_conf_flo=0.5
-		#special check for certain tasks that require options to be specified
-		if options_required:
-			if options is None or not isinstance(options, dict):
-				raise ArgumentError("(required argument) options must be a dictionary, where dict key is type string and entries are tuples of type (string[name]), (string[name],string[url])")
-			if options is not None:
-				singles_test = [isinstance(options[key], str) for key in options.keys()]
-				doubles_test = [isinstance(options[key], tuple) and isinstance(options[key][0], str) and isinstance(options[key][1], str) for key in options.keys()]
-			if not((all(singles_test) and not any(doubles_test)) or (all(doubles_test) and not any(singles_test))):
-				raise ArgumentError("entries of options dict must be tuples of type (string[name]), (string[name],string[url]). Note: cannot mix the two formats")
-		
-		# type checking and basic error checking
-		# -1 specifies use default value for parameter, do not need ot check
-		if budget is None or (not isinstance(budget, (int, float)) or budget <= 0): raise ArgumentError("(required argument) budget must be of type float, must be strictly greater than 0")
-		if confidence is not None and (not isinstance(confidence, (int, float)) or ((confidence<min_conf_int or confidence>max_conf_int) and (confidence<min_conf_flo or confidence>max_conf_flo))): raise ArgumentError("confidence must be of type float, must be strictly greater than 0")
-		if confidence_int is not None and confidence_int != -1:
-			if not isinstance(confidence_int, (int, float)) or confidence_int <= 0: raise ArgumentError("confidence_int must be of type float, must be strictly greater than 0")
-		if dry_run is not None and not isinstance(dry_run, bool): raise ArgumentError("dry_run must be of type bool")
-		if dont_reject is not None and not isinstance(dont_reject, bool): raise ArgumentError("dont_reject must be of type bool")
-		if initial_worker_timeout_in_s is not None and (not isinstance(initial_worker_timeout_in_s, int) or initial_worker_timeout_in_s <= 0): raise ArgumentError("initial_worker_timeout_in_s must be of type int, must be strictly greater than 0")
-		if image_url is not None and not isinstance(image_url, str): raise ArgumentError("image_url must be of type str")
-		if img_alt_txt is not None and not isinstance(img_alt_txt, str): raise ArgumentError("img_alt_txt must be of type str")
-		if max_value is not None and (not isinstance(max_value, (int, float))): raise ArgumentError("max_value must be of type float, must be strictly greater than 0")
-		if min_value is not None and (not isinstance(min_value, (int, float))): raise ArgumentError("min_value must be of type float, must be strictly greater than 0")
-		if pay_all_on_failure is not None and not isinstance(pay_all_on_failure, bool): raise ArgumentError("pay_all_on_failure must be of type bool")
-		if question_timeout_multiplier is not None and (not isinstance(question_timeout_multiplier, int) or question_timeout_multiplier <= 0): raise ArgumentError("question_timeout_multiplier must be of type int, must be strictly greater than 0")
-		if sample_size is not None and sample_size != -1:
-			if not isinstance(sample_size, int) or sample_size <= 0: raise ArgumentError("sample_size must be of type int, must be strictly greater than 0")
-		if text is None or (not isinstance(text, str) or not text.strip()): raise ArgumentError("(required argument) text must be of type str, cannot be empty")
-		if title is not None and not isinstance(title, str): raise ArgumentError("title must be of type str")
-		if wage is not None and (not isinstance(wage, (int, float)) or wage <= 0): raise ArgumentError("wage must be of type float, must be strictly greater than 0")
-		
-	
-	def estimateBatchUrl(self, text=None, budget=None, image_urls=None, title = "", confidence = 0.95, confidence_int = -1, img_alt_txt = "",sample_size = -1, dont_reject = True, 
-				pay_all_on_failure = True, dry_run = False, wage = 11.00, max_value = sys.float_info.max, min_value = sys.float_info.min, question_timeout_multiplier = 500, 
-				initial_worker_timeout_in_s = 30):
-		if len(image_urls) < 2: raise ArgumentError("batch estimation method requires list of urls as input, at least size 2")
-		# check arg types
-		self.args_check(text, budget, image_url, title, confidence, confidence_int, img_alt_txt,sample_size, dont_reject, 
-						pay_all_on_failure, dry_run, wage, max_value, min_value, question_timeout_multiplier, 
-						initial_worker_timeout_in_s)
-
-		job_list = list()
-		for url in image_urls:
-			job_list.append(estimate(text=text, budget=budget, image_url=image_url, title=title, confidence = confidence, confidence_int = confidence_int, 
+		"""
+		if image_urls is None or isinstance(image_urls, str) or len(image_urls) < 2: 
+			raise ArgumentError("batch estimation method requires list of urls as input, at least size 2")
+		return self.estimate_many(text=text, budget=budget, image_url=image_urls, title=title, confidence = confidence, confidence_int = confidence_int, 
 				img_alt_txt = img_alt_txt ,sample_size = sample_size, dont_reject = dont_reject, pay_all_on_failure = pay_all_on_failure, 
 				dry_run = dry_run, wage = wage, max_value = max_value, min_value = min_value, question_timeout_multiplier = question_timeout_multiplier, 
-				initial_worker_timeout_in_s = initial_worker_timeout_in_s))
-		batch = Batch(job_list)
+				initial_worker_timeout_in_s = initial_worker_timeout_in_s)
+
+	def estimate_many(self, text=None, budget=None, image_url="", title="", chunk_size = 500, **shared):
+		"""
+		Submits many estimate tasks that differ only in their text, budget, image_url and title. Each of these is 
+		either a single value, shared by every task, or a sequence (list, tuple or 1-D numpy array) of one value per
+		task. The other parameters of estimate are given once, and shared by every task. Each parameter is checked
+		once, per column rather than per task, and each task is a copy of one prototype with its own values set, 
+		which makes building many tasks much cheaper than calling estimate for each. The tasks are submitted as by 
+		submit_many
+
+		Example
+		-------
+			batch = a.estimate_many(text = "How many cars are in this parking lot?", budget = 1.50, image_url = urls, 
+									title = ["Lot %d" % i for i in range(len(urls))], confidence = 0.9)
+
+		Parameters
+		----------
+		text : str or sequence(str)
+			The text description of the tasks
+		budget : float or sequence(float)
+			The budget of the tasks
+		image_url : str or sequence(str)
+			The url of the image of the tasks
+		title : str or sequence(str)
+			The title of the tasks
+		chunk_size : int
+			The number of tasks sent in each message on the SubmitTasks stream
+		shared
+			The other keyword arguments of estimate, shared by every task
 
-		return batch
+		Returns
+		-------
+		Batch
+			A Batch holding one outcome per task, in the order of the sequences
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		RPCServerError: Indicates the stream ended before the server acknowledged every task
+		"""
+		return self._submit_many_columns('estimate', dict(text=text, budget=budget, image_url=image_url, title=title), shared, chunk_size)
+
+	def radio_many(self, text=None, budget=None, options=None, image_url="", title="", chunk_size = 500, **shared):
+		"""
+		Submits many radio tasks that differ only in their text, budget, image_url and title, given as for 
+		estimate_many. options, and the other parameters of radio, are given once and shared by every task
+
+		Parameters
+		----------
+		text : str or sequence(str)
+			The text description of the tasks
+		budget : float or sequence(float)
+			The budget of the tasks
+		options : dict
+			The choices of every task, see radio
+		image_url : str or sequence(str)
+			The url of the image of the tasks
+		title : str or sequence(str)
+			The title of the tasks
+		chunk_size : int
+			The number of tasks sent in each message on the SubmitTasks stream
+		shared
+			The other keyword arguments of radio, shared by every task
+
+		Returns
+		-------
+		Batch
+			A Batch holding one outcome per task, in the order of the sequences
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		RPCServerError: Indicates the stream ended before the server acknowledged every task
+		"""
+		shared['options'] = options
+		return self._submit_many_columns('radio', dict(text=text, budget=budget, image_url=image_url, title=title), shared, chunk_size)
+
+	def _submit_many_columns(self, kind, columns, shared, chunk_size):
+		"""
+		Private method. Builds and submits the tasks of estimate_many and radio_many, see _build_many
+
+		"""
+		if not isinstance(chunk_size, int) or chunk_size <= 0:
+			raise ArgumentError("chunk_size must be of type int, must be strictly greater than 0")
+		outcomes, keys = self._submit_outcomes(self._build_many(kind, columns, shared), chunk_size)
+		return Batch(outcomes, keys)
+
+	def _build_many(self, kind, columns, shared):
+		"""
+		Private method. Builds the tasks of estimate_many and radio_many: checks the arguments, builds a prototype task
+		from the shared arguments, and copies it once per task, setting its per-task fields
+		
+		Parameters
+		----------
+		kind : str
+			'estimate' or 'radio'
+		columns : dict
+			The per-task fields, each a single value or a sequence of one value per task
+		shared : dict
+			The other arguments of the task, shared by every task
+
+		Returns
+		-------
+		list of AutomanTask
+			The tasks, in the order of the sequences
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		unknown = set(shared) - set(Automan.SharedArgs[kind])
+		if unknown:
+			raise ArgumentError("unknown argument(s) for %s_many: %s"%(kind, ", ".join(sorted(unknown))))
+
+		# every argument is checked once, a column at a time, and every invalid row of every column is reported at once
+		n_tasks = (ESTIMATE if kind == 'estimate' else RADIO).validate_many(columns, shared)
+		if n_tasks is None:
+			raise ArgumentError("at least one of text, budget, image_url and title must be a sequence of one value per task")
+		if n_tasks == 0:
+			raise ArgumentError("the per-task sequences cannot be empty")
+		columns = dict((name, Automan._as_list(name, values)) for name, values in columns.items())
+		# the prototype every task is copied from is built from the shared arguments and the first task's fields
+		first = dict((name, values[0] if isinstance(values, list) else values) for name, values in columns.items())
+		make = self._make_estimate_task if kind == 'estimate' else self._make_radio_task
+		prototype = make(**dict(shared, **first))
+
+		automan_tasks = [AutomanTask() for i in range(n_tasks)]
+		for automan_task in automan_tasks:
+			automan_task.CopyFrom(prototype)
+		# the per-task fields are set a column at a time
+		tasks = [getattr(automan_task, kind).task for automan_task in automan_tasks]
+		for name, values in columns.items():
+			if isinstance(values, list):
+				for task, value in zip(tasks, values):
+					setattr(task, name, value)
+		return automan_tasks
+
+	@staticmethod
+	def _as_list(name, values):
+		"""
+		Private method. Returns a per-task field of estimate_many and radio_many as a list, or as is if it is a single
+		value. Budgets are floats, whatever the type of their sequence
+
+		"""
+		if hasattr(values, 'tolist'):
+			# numpy arrays and numpy scalars alike
+			values = values.tolist()
+		if not isinstance(values, (list, tuple)):
+			return values
+		return [float(value) for value in values] if name == 'budget' else list(values)
+
+	def template(self, kind = "estimate", **shared):
+		"""
+		Returns a template for many tasks of one type that share every parameter but their text, budget, image_url
+		and title. The shared parameters are checked, and built into a prototype task, once; each task submitted 
+		through the template is a copy of the prototype with only its own fields set and checked
+
+		Example
+		-------
+			template = a.template("estimate", budget = 1.50, title = "Car Counting", confidence = 0.9)
+			outcome = template.submit(text = "How many cars are in this parking lot?", image_url = url)
+
+		Parameters
+		----------
+		kind : str
+			'estimate' or 'radio'
+		shared
+			The keyword arguments of estimate or radio shared by every task. text, budget, image_url and title
+			given here are the defaults of the tasks that do not set them
+
+		Returns
+		-------
+		TaskTemplate
+			The template, see core.template
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		return TaskTemplate(self, kind, shared)
 
 	def estimate(self, text=None, budget=None, confidence = 0.95, confidence_int = -1, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
 				img_alt_txt = "",image_url="", max_value = sys.float_info.max, min_value = sys.float_info.min, 
-				pay_all_on_failure = True, question_timeout_multiplier = 500, sample_size = -1,  title = "",wage = 11.00):
+				pay_all_on_failure = True, question_timeout_multiplier = 500, sample_size = -1,  title = "",wage = 11.00, mock_answers = None):
 		"""
 		Estimates the answer to the provided task. Calls AutoMan's estimate functionality on the back-end
 
@@ -406,23 +866,136 @@ class Automan():
 			The title for the task, to display to workers on the crowdsource platform
 		wage : float
 			Minimum hourly wage, used to calculate worker reward based on given initial_worker_timeout_in_s
+		mock_answers : list(float)
+			The answers the mock back-end's workers give to this task, in order. Only used with a "mock" adapter,
+			which otherwise draws answers from its configured distribution
 
 		Returns
 		-------
 		EstimateOutcome
 			A wrapper class that contains a future estimation outcome.
 
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		task = self._make_estimate_task(text=text, budget=budget, confidence=confidence, confidence_int=confidence_int, 
+						dont_reject=dont_reject, dry_run=dry_run, initial_worker_timeout_in_s=initial_worker_timeout_in_s, 
+						img_alt_txt=img_alt_txt, image_url=image_url, max_value=max_value, min_value=min_value, 
+						pay_all_on_failure=pay_all_on_failure, question_timeout_multiplier=question_timeout_multiplier, 
+						sample_size=sample_size, title=title, wage=wage, mock_answers=mock_answers)
+		return self._submit(task, EstimateOutcome)
+
+	def _submit(self, automan_task, outcome_cls):
+		"""
+		Private method. Posts a task to the server, and returns an outcome that is resolved from the
+		WatchOutcomes stream once the server pushes the task's response
+
+		Parameters
+		----------
+		automan_task : AutomanTask
+			The task to post
+		outcome_cls : class
+			The Outcome subclass to wrap the future response in
+
+		Returns
+		-------
+		Outcome
+			An outcome of type outcome_cls, see _share
+		"""
+		if self.window is not None:
+			# the slot is taken before _share, which calls post holding the lock of the in-flight registry, that 
+			# resolving outcomes, and so freeing slots, also takes
+			self.window.acquire()
+		posted = list()
+
+		def post():
+			try:
+				ticket = post_task(self.channel_pool, automan_task)
+			except:
+				self._force_svr_shutdown()
+				raise
+			future = self.watcher.watch(ticket)
+			if self.window is not None:
+				self.window.track_ack(ticket)
+				self.window.release_when_done(future)
+			posted.append(future)
+			return future
+
+		try:
+			return self._share(automan_task, outcome_cls, post)
+		finally:
+			if self.window is not None and not posted:
+				self.window.release(posted = False)
+
+	def _share(self, automan_task, outcome_cls, post):
+		"""
+		Private method. Returns the outcome of a task: served from the cache if it holds the task's outcome, or else 
+		the outcome of an identical task in flight, or else the outcome of the task posted with post
+
+		Parameters
+		----------
+		automan_task : AutomanTask
+			The task
+		outcome_cls : class
+			The Outcome subclass of the task
+		post : callable
+			Posts the task, and returns the future of its TaskResponse. Must not block
+		"""
+		key = task_key(automan_task) if self.inflight is not None or self.cache is not None else None
+		if self.cache is not None:
+			response = self.cache.get(key)
+			if response is not None:
+				return Automan._cached_outcome(outcome_cls, response)
+
+		def submit(positions):
+			future = post()
+			if self.cache is not None:
+				self.cache.store_when_done(key, future)
+			return [outcome_cls(future_tr=future)]
+
+		if self.inflight is None:
+			return submit([0])[0]
+		return self.inflight.share([key], submit)[0]
+
+	@staticmethod
+	def _outcome_cls(automan_task):
+		return RadioOutcome if automan_task.WhichOneof('task_type') == 'radio' else EstimateOutcome
+
+	@staticmethod
+	def _cached_outcome(outcome_cls, response):
+		"""
+		Private method. Returns an outcome of type outcome_cls, already evaluated from a response served from the cache
+
+		"""
+		outcome = outcome_cls(future_tr=OutcomeCache.resolved(response))
+		outcome.done()
+		return outcome
+
+	def _make_estimate_task(self, text=None, budget=None, confidence = 0.95, confidence_int = -1, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
+				img_alt_txt = "",image_url="", max_value = sys.float_info.max, min_value = sys.float_info.min, 
+				pay_all_on_failure = True, question_timeout_multiplier = 500, sample_size = -1,  title = "",wage = 11.00, mock_answers = None):
+		"""
+		Private method. Checks the arguments of an estimate task and builds the AutomanTask to submit. 
+		See estimate for a description of the parameters
+
+		Returns
+		-------
+		AutomanTask
+			The estimate task to submit to the server
+
 		Raises
 		------
 		ArgumentError: Indicates there was an error with one of the supplied arguments
 		"""
 		# check arg types, raise errors
-		self._args_check(text=text, budget=budget, image_url=image_url, title=title, confidence=confidence, confidence_int=confidence_int, 
+		ESTIMATE.validate(text=text, budget=budget, image_url=image_url, title=title, confidence=confidence, confidence_int=confidence_int, 
 						img_alt_txt=img_alt_txt, sample_size=sample_size, dont_reject=dont_reject, pay_all_on_failure=pay_all_on_failure, 
 						dry_run=dry_run, wage=wage, max_value=max_value, min_value=min_value, 
-						question_timeout_multiplier=question_timeout_multiplier, initial_worker_timeout_in_s=initial_worker_timeout_in_s)
+						question_timeout_multiplier=question_timeout_multiplier, initial_worker_timeout_in_s=initial_worker_timeout_in_s,
+						mock_answers=mock_answers)
 
-		task = make_est_task(text_ = text,
+		return make_est_task(text_ = text,
 										budget_ = float(budget),
 										title_ = title,
 										image_url_ = image_url,
@@ -437,17 +1010,11 @@ class Automan():
 										max_value_ = float(max_value),
 										min_value_ = float(min_value),
 										question_timeout_multiplier_ = question_timeout_multiplier,
-										initial_worker_timeout_in_s_ = initial_worker_timeout_in_s)
-		try:
-			resp = submit_task(self.channel, task, self.adptr)
-			eo = EstimateOutcome(future_tr=resp)
-			return eo
-		except:
-			self._force_svr_shutdown()
-			raise
+										initial_worker_timeout_in_s_ = initial_worker_timeout_in_s,
+										mock_answers_ = mock_answers)
 
 	def radio(self, text=None, budget=None, options=None, confidence = 0.95, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
-				img_alt_txt = "",image_url="", pay_all_on_failure = True, question_timeout_multiplier = 500, title = "",wage = 11.00):
+				img_alt_txt = "",image_url="", pay_all_on_failure = True, question_timeout_multiplier = 500, title = "",wage = 11.00, mock_answers = None):
 		"""
 		Estimates the answer to the provided radio task. Calls AutoMan's radio functionality on the back-end
 
@@ -484,23 +1051,47 @@ class Automan():
 			The title for the task, to display to workers on the crowdsource platform
 		wage : float
 			Minimum hourly wage, used to calculate worker reward based on given initial_worker_timeout_in_s
+		mock_answers : list(str)
+			The option keys the mock back-end's workers choose for this task, in order. Only used with a "mock" adapter,
+			which otherwise draws answers from its configured distribution
 
 		Returns
 		-------
 		EstimateOutcome
 			A wrapper class that contains a future estimation outcome.
 
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		task = self._make_radio_task(text=text, budget=budget, options=options, confidence=confidence, dont_reject=dont_reject, 
+						dry_run=dry_run, initial_worker_timeout_in_s=initial_worker_timeout_in_s, img_alt_txt=img_alt_txt, 
+						image_url=image_url, pay_all_on_failure=pay_all_on_failure, 
+						question_timeout_multiplier=question_timeout_multiplier, title=title, wage=wage, mock_answers=mock_answers)
+		return self._submit(task, RadioOutcome)
+
+	def _make_radio_task(self, text=None, budget=None, options=None, confidence = 0.95, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
+				img_alt_txt = "",image_url="", pay_all_on_failure = True, question_timeout_multiplier = 500, title = "",wage = 11.00, mock_answers = None):
+		"""
+		Private method. Checks the arguments of a radio task and builds the AutomanTask to submit. 
+		See radio for a description of the parameters
+
+		Returns
+		-------
+		AutomanTask
+			The radio task to submit to the server
+
 		Raises
 		------
 		ArgumentError: Indicates there was an error with one of the supplied arguments
 		"""
 		# check arg types, raise errors
-		self._args_check(text=text, budget=budget, image_url=image_url, title=title, confidence=confidence, 
+		RADIO.validate(text=text, budget=budget, image_url=image_url, title=title, confidence=confidence, 
 						img_alt_txt=img_alt_txt, dont_reject=dont_reject, pay_all_on_failure=pay_all_on_failure, 
 						dry_run=dry_run, wage=wage, question_timeout_multiplier=question_timeout_multiplier, 
-						options=options, initial_worker_timeout_in_s=initial_worker_timeout_in_s, options_required=True)
+						options=options, initial_worker_timeout_in_s=initial_worker_timeout_in_s, mock_answers=mock_answers)
 
-		task = make_rad_task(text_ = text,
+		return make_rad_task(text_ = text,
 										budget_ = float(budget),
 										options_ =options,
 										title_ = title,
@@ -512,11 +1103,274 @@ class Automan():
 										dry_run_ = dry_run, 
 										wage_ = float(wage),
 										question_timeout_multiplier_ = question_timeout_multiplier,
-										initial_worker_timeout_in_s_ = initial_worker_timeout_in_s)
+										initial_worker_timeout_in_s_ = initial_worker_timeout_in_s,
+										mock_answers_ = mock_answers)
+
+	def submit_many(self, tasks, chunk_size = 500):
+		"""
+		Submits many tasks over a single SubmitTasks stream, rather than with one call per task. Tasks are
+		sent up in chunks, and this method returns once the server has acknowledged queueing all of them. Unless 
+		the object was created with dedupe=False, a task identical to one in flight, or to an earlier one in 
+		tasks, is not sent, and shares its outcome. Neither is a task whose outcome is in the cache
+
+		Parameters
+		----------
+		tasks : iterable
+			The tasks to submit. Each item is either an AutomanTask, or a dict of keyword arguments as
+			taken by estimate (or by radio, if the dict has an 'options' entry)
+		chunk_size : int
+			The number of tasks sent in each message on the stream
+
+		Returns
+		-------
+		Batch
+			A Batch holding one outcome and one key per task, in the order the tasks were given
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied tasks
+		RPCServerError: Indicates the stream ended before the server acknowledged every task
+		"""
+		if not isinstance(chunk_size, int) or chunk_size <= 0:
+			raise ArgumentError("chunk_size must be of type int, must be strictly greater than 0")
+
+		outcomes, keys = self._submit_outcomes([self._make_task_from_item(item) for item in tasks], chunk_size)
+		return Batch(outcomes, keys)
+
+	def submit_stream(self, tasks, sink, chunk_size = 500, max_pending = 10000):
+		"""
+		Submits many tasks in streaming mode: rather than returning a Batch that holds every outcome, each outcome is
+		handed to sink as soon as it resolves, and let go of. tasks is read chunk_size items at a time, and no more
+		than max_pending tasks are left unresolved at once, so the memory used depends on max_pending, not on the
+		number of tasks. Blocks until every task was submitted, waiting for earlier ones to resolve if needed
+
+		Example
+		-------
+			stream = a.submit_stream(({"text" : text, "budget" : 1.50} for text in questions), JsonlSink("outcomes.jsonl"))
+			stream.wait_all_done()
+			stream.close()
+
+		Parameters
+		----------
+		tasks : iterable
+			The tasks to submit, as taken by submit_many. May be a generator
+		sink : Sink or callable
+			Where the outcomes go, see core.sinks: a JsonlSink, CsvSink, SqliteSink, or a function called with the
+			record of each outcome
+		chunk_size : int
+			The number of tasks read and submitted at a time, over one SubmitTasks stream
+		max_pending : int
+			The number of tasks left unresolved at most. Must be at least chunk_size
+
+		Returns
+		-------
+		StreamingBatch
+			The handle of the submission, to wait for the outcomes to be written and close the sink
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments or tasks. The outcomes of the
+			tasks already submitted that have resolved are written, and the sink is closed
+		RPCServerError: Indicates a stream ended before the server acknowledged every task, likewise
+		"""
+		if not isinstance(chunk_size, int) or chunk_size <= 0:
+			raise ArgumentError("chunk_size must be of type int, must be strictly greater than 0")
+		if not isinstance(max_pending, int) or max_pending < chunk_size:
+			raise ArgumentError("max_pending must be of type int, must be at least chunk_size")
+		if not isinstance(sink, Sink):
+			if not callable(sink):
+				raise ArgumentError("sink must be a Sink, or a function taking the record of an outcome")
+			sink = CallbackSink(sink)
+
+		stream = StreamingBatch(sink, max_pending)
+		tasks = iter(tasks)
 		try:
-			resp = submit_task(self.channel, task, self.adptr)
-			ro = RadioOutcome(future_tr=resp)
-			return ro
-		except:
-			self._force_svr_shutdown()
-			raise
\ No newline at end of file
+			while True:
+				items = list(islice(tasks, chunk_size))
+				if not items:
+					break
+				automan_tasks = [self._make_task_from_item(item) for item in items]
+				stream._admit(len(automan_tasks))
+				stream._add(*self._submit_outcomes(automan_tasks, chunk_size))
+		except Exception:
+			stream.close()
+			raise
+		return stream
+
+	def _submit_outcomes(self, automan_tasks, chunk_size):
+		"""
+		Private method. Submits tasks over a single SubmitTasks stream, see submit_many, and returns the list of their 
+		outcomes and the list of their keys, once the server has acknowledged queueing all of them
+		
+		"""
+		keys = [task_key(automan_task) for automan_task in automan_tasks]
+		responses = self.cache.get_many(keys) if self.cache is not None else [None] * len(automan_tasks)
+		# the positions of the tasks the cache has no outcome for
+		pending = [position for position, response in enumerate(responses) if response is None]
+		streams = list()
+
+		def stream(positions):
+			stream_tasks = [automan_tasks[pending[position]] for position in positions]
+			streams.append(TaskStream(self.channel_pool, stream_tasks, chunk_size, self.window))
+			if self.cache is not None:
+				for position, future in zip(positions, streams[-1].futures):
+					self.cache.store_when_done(keys[pending[position]], future)
+			return [Automan._outcome_cls(automan_task)(future_tr=future) for automan_task, future in zip(stream_tasks, streams[-1].futures)]
+
+		if self.inflight is None:
+			posted = stream(range(len(pending)))
+		else:
+			posted = self.inflight.share([keys[position] for position in pending], stream)
+		outcomes = [None if response is None else Automan._cached_outcome(Automan._outcome_cls(automan_task), response) 
+						for automan_task, response in zip(automan_tasks, responses)]
+		for position, outcome in zip(pending, posted):
+			outcomes[position] = outcome
+		for task_stream in streams:
+			if not task_stream.wait_acknowledged():
+				raise RPCServerError("server acknowledged %d of %d tasks before the SubmitTasks stream ended"%(task_stream.acknowledged, len(task_stream.futures)))
+		return outcomes, keys
+
+	def _make_task_from_item(self, item):
+		"""
+		Private method. Builds the AutomanTask for an item given to submit_many
+
+		Raises
+		------
+		ArgumentError: Indicates the item is not an AutomanTask or dict, or has a bad argument
+		"""
+		if isinstance(item, AutomanTask):
+			return item
+		if not isinstance(item, dict):
+			raise ArgumentError("each task must be an AutomanTask, or a dict of keyword arguments for estimate or radio")
+		if 'options' in item:
+			return self._make_radio_task(**item)
+		return self._make_estimate_task(**item)
+
+class AsyncAutoman(Automan):
+	"""
+	The AsyncAutoman Class. An Automan client for use from an asyncio event loop. The RPC server is
+	started and the adapter registered exactly as for Automan, but tasks are posted over a grpc.aio
+	channel. Outcomes are resolved from the single WatchOutcomes stream shared by all tasks, so they
+	can be awaited without tying up a thread per outstanding task.
+
+	Example
+	-------
+		am = AsyncAutoman(adapter)
+		outcome = await am.estimate(text = "How many cars are in this parking lot?", budget = 6.00)
+		await outcome
+		outcome.printOutcome()
+
+	Attributes
+	----------
+	In addition to the attributes of the base class, Automan, AsyncAutomans have:
+
+	aio_channel_pool : ChannelPool
+		The asyncio gRPC channels tasks are submitted over. Created on the first submission, from
+		within the running event loop
+	"""
+
+	def __init__(self, adapter, **kwargs):
+		"""
+		Parameters
+		----------
+		see Automan for description
+		"""
+		Automan.__init__(self, adapter, **kwargs)
+		self.aio_channel_pool = None
+
+	def _get_aio_channel(self):
+		"""
+		Private method. Returns the asyncio gRPC channels, creating them on the running event loop if needed
+
+		"""
+		if self.aio_channel_pool is None:
+			self.aio_channel_pool = make_channel_pool(self.srvr_addr, str(self.port), self.n_channels, self.channel_policy, aio_ = True, 
+														socket_path_ = self.socket_path)
+		return self.aio_channel_pool
+
+	async def estimate(self, text=None, budget=None, confidence = 0.95, confidence_int = -1, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
+				img_alt_txt = "",image_url="", max_value = sys.float_info.max, min_value = sys.float_info.min, 
+				pay_all_on_failure = True, question_timeout_multiplier = 500, sample_size = -1,  title = "",wage = 11.00, mock_answers = None):
+		"""
+		Coroutine. Submits an estimate task. See Automan.estimate for a description of the parameters
+
+		Returns
+		-------
+		EstimateOutcome
+			An awaitable outcome. Awaiting it resolves the outcome without blocking the event loop
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		task = self._make_estimate_task(text=text, budget=budget, confidence=confidence, confidence_int=confidence_int, 
+						dont_reject=dont_reject, dry_run=dry_run, initial_worker_timeout_in_s=initial_worker_timeout_in_s, 
+						img_alt_txt=img_alt_txt, image_url=image_url, max_value=max_value, min_value=min_value, 
+						pay_all_on_failure=pay_all_on_failure, question_timeout_multiplier=question_timeout_multiplier, 
+						sample_size=sample_size, title=title, wage=wage, mock_answers=mock_answers)
+		return await self._submit_async(task, EstimateOutcome)
+
+	async def radio(self, text=None, budget=None, options=None, confidence = 0.95, dont_reject = True, dry_run = False,initial_worker_timeout_in_s = 30, 
+				img_alt_txt = "",image_url="", pay_all_on_failure = True, question_timeout_multiplier = 500, title = "",wage = 11.00, mock_answers = None):
+		"""
+		Coroutine. Submits a radio task. See Automan.radio for a description of the parameters
+
+		Returns
+		-------
+		RadioOutcome
+			An awaitable outcome. Awaiting it resolves the outcome without blocking the event loop
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		task = self._make_radio_task(text=text, budget=budget, options=options, confidence=confidence, dont_reject=dont_reject, 
+						dry_run=dry_run, initial_worker_timeout_in_s=initial_worker_timeout_in_s, img_alt_txt=img_alt_txt, 
+						image_url=image_url, pay_all_on_failure=pay_all_on_failure, 
+						question_timeout_multiplier=question_timeout_multiplier, title=title, wage=wage, mock_answers=mock_answers)
+		return await self._submit_async(task, RadioOutcome)
+
+	async def _submit_async(self, automan_task, outcome_cls):
+		"""
+		Private coroutine. Posts a task over the asyncio channels, see Automan._submit. Returns once the server has 
+		queued the task, or at once if the task was not posted, see Automan._share
+		"""
+		if self.window is not None:
+			# the slot is taken before _share, see Automan._submit
+			await self.window.acquire_async()
+		tickets = list()
+
+		def post():
+			tickets.append(asyncio.ensure_future(post_task_async(self._get_aio_channel(), automan_task)))
+			future = self.watcher.watch(tickets[-1])
+			if self.window is not None:
+				self.window.track_ack(tickets[-1])
+				self.window.release_when_done(future)
+			return future
+
+		try:
+			outcome = self._share(automan_task, outcome_cls, post)
+		finally:
+			if self.window is not None and not tickets:
+				self.window.release(posted = False)
+		if tickets:
+			# raises here if posting the task failed
+			await tickets[0]
+		return outcome
+
+	async def close(self):
+		"""
+		Coroutine. Closes the asyncio gRPC channels, and the cache if this object opened it from a path. 
+		Outstanding calls are cancelled
+
+		"""
+		if self.aio_channel_pool is not None:
+			await self.aio_channel_pool.close_async()
+			self.aio_channel_pool = None
+		self._close_cache()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback):
+		await self.close()
@@ -0,0 +1,245 @@
+import bisect
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from automanpy.automan import Automan
+from automanpy.core.automanlib_rpc_pb2 import AutomanTask
+from automanpy.core.batchjob import Batch
+from automanpy.core.pyautomanexceptions import ArgumentError
+
+class AutomanCluster():
+	"""
+	The AutomanCluster Class. A client of several RPC servers, each with an Automan object of its own, that
+	spreads the tasks it is given over them. A single server, with its pool of AutoMan workers, caps how fast
+	tasks are launched; K servers, on this host or others, launch K times as many at once.
+
+	Example
+	-------
+		cluster = AutomanCluster(adapter, servers = 4)
+		batch = cluster.submit_many([{"text" : text, "budget" : 1.50} for text in questions])
+		for outcome in batch.as_done():
+			outcome.printOutcome()
+
+	Attributes
+	----------
+	members : list
+		The Automan object of each server, in the order the servers were given
+	routing : string
+		How the server of each task is picked, see __init__
+	"""
+
+	RoutingVals = ['least_outstanding', 'hash']
+	#number of points each server has on the hash ring, more spread the tasks more evenly
+	HASH_REPLICAS = 128
+
+	def __init__(self, adapter, servers = 2, routing = 'least_outstanding', **kwargs):
+		"""
+		Starts or connects to every server, in parallel
+
+		Parameters
+		----------
+		adapter : dict
+			A dictionary containing the parameters for the adapter, registered on every server
+		servers : int or list
+			The servers to spread tasks over. An int K starts K servers of this cluster's own on localhost, each on a
+			free port, see Automan(port="auto"). A list gives the servers one by one, each as a port on localhost, a
+			"host:port" string, or a (host, port) tuple. A server on another host must already be running
+		routing : string
+			How the server of each task is picked. Values are:
+				'least_outstanding' 	- the server with the fewest tasks submitted through this cluster that have
+											not resolved yet
+				'hash' 					- consistent hashing of the task's title, or of its text if it has no title,
+											so that tasks with the same title always go to the same server, and
+											adding a server only moves the tasks of its share of the ring
+		kwargs
+			The other arguments of each server's Automan object, see Automan. Cannot include server_addr or port
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		AdapterError, RPCServerError, UnsupportedServerError: As raised by Automan for any of the servers
+		"""
+		if isinstance(servers, int) and not isinstance(servers, bool):
+			if servers <= 0:
+				raise ArgumentError("servers must be greater than 0")
+			targets = [('localhost', 'auto')] * servers
+		elif isinstance(servers, (list, tuple)) and servers:
+			targets = [AutomanCluster._parse_target(server) for server in servers]
+		else:
+			raise ArgumentError("servers must be of type int, or a non-empty list of servers")
+		if not isinstance(routing, str) or routing not in AutomanCluster.RoutingVals:
+			raise ArgumentError("routing must be one of "+", ".join(AutomanCluster.RoutingVals))
+		if 'server_addr' in kwargs or 'port' in kwargs:
+			raise ArgumentError("the address of each server is given by servers, not server_addr or port")
+
+		self.routing = routing
+		self._lock = threading.Lock()
+		self._pool = ThreadPoolExecutor(max_workers = len(targets), thread_name_prefix = "automanpy-cluster")
+		# JVM startup dominates starting a server, so the servers are started side by side
+		starting = [self._pool.submit(Automan, dict(adapter), server_addr = host, port = port, **kwargs) for host, port in targets]
+		wait(starting)
+		failed = [member for member in starting if member.exception() is not None]
+		if failed:
+			# nothing would shut down the servers that did start
+			for member in starting:
+				if member.exception() is None:
+					try:
+						member.result().shutdown()
+					except Exception:
+						pass
+			self._pool.shutdown()
+			failed[0].result()
+		self.members = [member.result() for member in starting]
+		self._outstanding = [0] * len(self.members)
+		self._ring = []
+		self._ring_members = []
+		for index, member in enumerate(self.members):
+			for replica in range(AutomanCluster.HASH_REPLICAS):
+				point = AutomanCluster._hash("%s:%d#%d"%(member.srvr_addr, member.port, replica))
+				at = bisect.bisect(self._ring, point)
+				self._ring.insert(at, point)
+				self._ring_members.insert(at, index)
+
+	@staticmethod
+	def _parse_target(server):
+		"""
+		Private method. Returns the (host, port) of a server as given to __init__
+
+		"""
+		if isinstance(server, int) and not isinstance(server, bool):
+			return ('localhost', server)
+		if isinstance(server, str) and server.rpartition(':')[2].isdigit():
+			host, _sep, port = server.rpartition(':')
+			return (host or 'localhost', int(port))
+		if isinstance(server, tuple) and len(server) == 2 and isinstance(server[0], str) and isinstance(server[1], int):
+			return server
+		raise ArgumentError("each server must be a port, a 'host:port' string or a (host, port) tuple, not "+repr(server))
+
+	@staticmethod
+	def _hash(key):
+		return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+	def __len__(self):
+		return len(self.members)
+
+	def outstanding(self):
+		"""
+		Returns the number of tasks submitted to each server through this cluster that have not resolved yet, in
+		the order of members
+		"""
+		with self._lock:
+			return list(self._outstanding)
+
+	def _route(self, key, assigned = None):
+		"""
+		Private method. Returns the index of the member a task goes to
+
+		Parameters
+		----------
+		key : str
+			The title of the task, or its text if it has no title
+		assigned : list
+			The number of tasks already assigned to each member, but not yet submitted, when routing many at once
+		"""
+		if self.routing == 'hash':
+			at = bisect.bisect(self._ring, AutomanCluster._hash(key or ""))
+			return self._ring_members[at % len(self._ring)]
+		with self._lock:
+			load = list(self._outstanding) if assigned is None else [n + m for n, m in zip(self._outstanding, assigned)]
+		return min(range(len(load)), key = load.__getitem__)
+
+	def _track(self, index, outcome):
+		"""
+		Private method. Counts an outcome as outstanding on a member until it resolves
+
+		"""
+		with self._lock:
+			self._outstanding[index] += 1
+		outcome.add_done_callback(lambda _outcome: self._resolved(index))
+		return outcome
+
+	def _resolved(self, index):
+		with self._lock:
+			self._outstanding[index] -= 1
+
+	def estimate(self, text = None, budget = None, **kwargs):
+		"""
+		Submits an estimate task to the server picked for it. Takes the same arguments as Automan.estimate
+
+		Returns
+		-------
+		EstimateOutcome
+			The outcome of the task
+		"""
+		index = self._route(kwargs.get('title') or text)
+		return self._track(index, self.members[index].estimate(text = text, budget = budget, **kwargs))
+
+	def radio(self, text = None, budget = None, options = None, **kwargs):
+		"""
+		Submits a radio button task to the server picked for it. Takes the same arguments as Automan.radio
+
+		Returns
+		-------
+		RadioOutcome
+			The outcome of the task
+		"""
+		index = self._route(kwargs.get('title') or text)
+		return self._track(index, self.members[index].radio(text = text, budget = budget, options = options, **kwargs))
+
+	@staticmethod
+	def _item_key(item):
+		"""
+		Private method. Returns the routing key of an item given to submit_many
+
+		"""
+		if isinstance(item, AutomanTask):
+			task_type = item.WhichOneof('task_type')
+			task = getattr(item, task_type).task if task_type else None
+			return task.title or task.text if task is not None else ""
+		if isinstance(item, dict):
+			return item.get('title') or item.get('text') or ""
+		return ""
+
+	def submit_many(self, tasks, chunk_size = 500):
+		"""
+		Splits the tasks between the servers, and submits each server's share over its own SubmitTasks stream,
+		all at once. Takes the same arguments as Automan.submit_many
+
+		Returns
+		-------
+		Batch
+			A Batch holding one outcome per task, in the order the tasks were given, whichever server runs it
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied tasks
+		RPCServerError: Indicates a server did not acknowledge all of its tasks
+		"""
+		tasks = list(tasks)
+		shares = [[] for member in self.members]
+		assigned = [0] * len(self.members)
+		for position, item in enumerate(tasks):
+			index = self._route(AutomanCluster._item_key(item), assigned)
+			assigned[index] += 1
+			shares[index].append(position)
+
+		submitting = [(index, self._pool.submit(self.members[index].submit_many, [tasks[position] for position in share], chunk_size))
+						for index, share in enumerate(shares) if share]
+		outcomes = [None] * len(tasks)
+		keys = [None] * len(tasks)
+		for index, batch in submitting:
+			batch = batch.result()
+			for position, outcome, key in zip(shares[index], batch, batch.keys):
+				outcomes[position] = self._track(index, outcome)
+				keys[position] = key
+		return Batch(outcomes, keys)
+
+	def shutdown(self):
+		"""
+		Shutdown every server of the cluster, and the threads the cluster submits tasks on
+
+		"""
+		for member in self.members:
+			member.shutdown()
+		self._pool.shutdown()
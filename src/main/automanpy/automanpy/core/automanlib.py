@@ -1,6 +1,11 @@
-from os import path, devnull
+from os import path, devnull, remove, stat, SEEK_END
+from stat import S_ISSOCK
 from time import sleep
 from subprocess import Popen
+import itertools
+import socket
+import threading
+import weakref
 
 from automanpy.core.automanlib_rpc_pb2 import *
 from automanpy.core.grpc_classes.automanlib_classes_pb2 import *
@@ -8,6 +13,7 @@ import automanpy.core.automanlib_rpc_pb2_grpc as rpclib
 from automanpy.core.pyautomanexceptions import *
 
 import grpc
+import grpc.aio
 
 def isGoodAadapter(adapter):
 	"""
@@ -16,6 +22,7 @@ def isGoodAadapter(adapter):
 		access_id - the access ID for the respective crowdsource back-end
 		access_key - the secret key for the respective crowdsource back-end
 		type - adapter type, determined by back-end crowdsource service
+	A "mock" adapter only needs the type entry
 
 	Parameters
     ----------
@@ -35,18 +42,26 @@ def isGoodAadapter(adapter):
 	"""
 
 	required_strings = ["access_id", "access_key", "type"]
+	if str(adapter.get("type", "")).lower() == "mock":
+		required_strings = ["type"]
 	for req in required_strings:
 		if req not in adapter:
 			return False
 	return True
 
+# client stubs of the synchronous channels they were made for. A stub does not hold on to its channel, so the
+# entry goes when the channel does
+_client_stubs = weakref.WeakKeyDictionary()
+_client_stubs_lock = threading.Lock()
+
 def _make_client_stub(channel_):
 	"""
-	Makes a gRPC client stub from the provided channel
+	Returns the gRPC client stub for the provided channel. Stubs of synchronous channels are made once per channel 
+	and cached, and a ChannelPool hands out the stub of its next channel
 
 	Parameters
     ----------
-    channel_ : Channel
+    channel_ : Channel, grpc.aio.Channel or ChannelPool
     	A gRPC channel
 
     Returns
@@ -55,8 +70,136 @@ def _make_client_stub(channel_):
     	a gRPC client stub
 
 	"""  
+	if isinstance(channel_, ChannelPool):
+		return channel_.stub()
+	if not isinstance(channel_, grpc.Channel):
+		return rpclib.PyautomanPrototypeStub(channel_)
+	stub = _client_stubs.get(channel_)
+	if stub is None:
+		with _client_stubs_lock:
+			stub = _client_stubs.get(channel_)
+			if stub is None:
+				stub = rpclib.PyautomanPrototypeStub(channel_)
+				_client_stubs[channel_] = stub
+	return stub
+
+class ChannelPool():
+	"""
+	The ChannelPool class. A fixed set of gRPC channels to the same server, each with its own HTTP/2 connection, 
+	that calls are spread over so that many submitting threads are not limited by a single connection. The pool
+	can be passed to the functions of this module wherever they take a channel, and each call goes over the 
+	channel picked by the pool's policy:
+		round_robin 	- the channels in turn
+		least_loaded 	- the channel with the fewest calls in flight
+
+	Attributes
+	----------
+	channels : list of Channel or grpc.aio.Channel
+		The channels of the pool
+	policy : str
+		How the channel of each call is picked
+	"""
+	POLICIES = ['round_robin', 'least_loaded']
+
+	def __init__(self, channels, policy = 'round_robin'):
+		"""
+		Parameters
+		----------
+		channels : list of Channel or grpc.aio.Channel
+			The channels of the pool, see make_channel_pool
+		policy : str
+			One of ChannelPool.POLICIES
+		"""
+		self.channels = list(channels)
+		self.policy = policy
+		self._stubs = [rpclib.PyautomanPrototypeStub(channel) for channel in self.channels]
+		self._next = itertools.cycle(range(len(self.channels)))
+		# calls in flight per channel, only counted for least_loaded
+		self._in_flight = [0] * len(self.channels)
+		self._lock = threading.Lock()
+
+	def __len__(self):
+		return len(self.channels)
+
+	def stub(self):
+		"""
+		Returns the stub of the channel the next call should go over
+		"""
+		if self.policy != 'least_loaded':
+			with self._lock:
+				return self._stubs[next(self._next)]
+		with self._lock:
+			index = min(range(len(self.channels)), key = self._in_flight.__getitem__)
+		return _CountingStub(self, index)
+
+	def _started(self, index):
+		with self._lock:
+			self._in_flight[index] += 1
+
+	def _finished(self, index):
+		with self._lock:
+			self._in_flight[index] -= 1
+
+	def close(self):
+		"""
+		Closes every channel of a pool of synchronous channels
+		"""
+		for channel in self.channels:
+			channel.close()
+
+	async def close_async(self):
+		"""
+		Coroutine. Closes every channel of a pool of asyncio channels
+		"""
+		for channel in self.channels:
+			await channel.close()
+
+class _CountingStub():
+	"""
+	Private class. Stands in for the stub of one channel of a least_loaded ChannelPool, and counts each call made 
+	through it as in flight on that channel until the call completes
+	"""
+	def __init__(self, pool, index):
+		self._pool = pool
+		self._index = index
+		self._stub = pool._stubs[index]
 
-	return rpclib.PyautomanPrototypeStub(channel_)
+	def __getattr__(self, method):
+		return _CountingCallable(self._pool, self._index, getattr(self._stub, method))
+
+class _CountingCallable():
+	"""
+	Private class. Wraps a gRPC multi-callable of a _CountingStub
+	"""
+	def __init__(self, pool, index, multi_callable):
+		self._pool = pool
+		self._index = index
+		self._callable = multi_callable
+
+	def __call__(self, request, *args, **kwargs):
+		self._pool._started(self._index)
+		try:
+			call = self._callable(request, *args, **kwargs)
+		except:
+			self._pool._finished(self._index)
+			raise
+		if hasattr(call, 'add_done_callback'):
+			# a future, stream or asyncio call: in flight until it is done
+			call.add_done_callback(lambda _call: self._pool._finished(self._index))
+		else:
+			# a blocking call, which has returned
+			self._pool._finished(self._index)
+		return call
+
+	def future(self, request, *args, **kwargs):
+		self._pool._started(self._index)
+		try:
+			future = self._callable.future(request, *args, **kwargs)
+		except:
+			self._pool._finished(self._index)
+			raise
+		future.add_done_callback(lambda _future: self._pool._finished(self._index))
+		return future
 
 def make_adapter(adapter, lglvl, lg):
 	"""
@@ -65,7 +208,8 @@ def make_adapter(adapter, lglvl, lg):
 	Parameters
 	----------
 	adapter : dict
-		Dictionary that holds the backend login credentials, and any additional options
+		Dictionary that holds the backend login credentials, and any additional options. The options of
+		a "mock" adapter are listed in _make_mock_options
 	lglvl : str
 		The log level for the Automan Worker on the RPC server
 
@@ -80,8 +224,8 @@ def make_adapter(adapter, lglvl, lg):
 	AdapterError: 	Indicates there was an error creating the adapter, see msg field of exception for more info
 	"""
 	if isGoodAadapter(adapter):
-		acc_id = adapter.pop("access_id")
-		acc_key =  adapter.pop("access_key")
+		acc_id = adapter.pop("access_id", "mock")
+		acc_key =  adapter.pop("access_key", "mock")
 		ad_type_str = adapter.pop("type")
 		if ad_type_str.lower() == "mturk":
 			return AdapterCredentials(adptr_type = AdapterCredentials.MTURK, 
@@ -90,14 +234,93 @@ def make_adapter(adapter, lglvl, lg):
 										adapter_options = adapter, 
 										logging = lg,
 										log_level = lglvl)
+		elif ad_type_str.lower() == "mock":
+			return AdapterCredentials(adptr_type = AdapterCredentials.MOCK, 
+										access_id = acc_id, 
+										access_key = acc_key, 
+										adapter_options = _make_mock_options(adapter), 
+										logging = lg,
+										log_level = lglvl)
 		else:
-			raise AdapterError("unsupported adapter type. Currently, the only supported crowdsource backend is mturk")
+			raise AdapterError("unsupported adapter type. Currently, the supported crowdsource backends are mturk and mock")
 	else:
 		raise AdapterError("missing required field in dict in adapter dict. The required fields are : access_id, access_key, type")
 
-def make_channel(address_, port_):
+# option name -> (check on the value, description used in the error message)
+_MOCK_OPTIONS = {
+	"latency_s" : (lambda v: isinstance(v, (int, float)) and v >= 0, "a number of seconds >= 0"),
+	"latency_jitter_s" : (lambda v: isinstance(v, (int, float)) and v >= 0, "a number of seconds >= 0"),
+	"dropout" : (lambda v: isinstance(v, (int, float)) and 0 <= v < 1, "a probability in [0, 1)"),
+	"estimate_mean" : (lambda v: isinstance(v, (int, float)), "a float"),
+	"estimate_stddev" : (lambda v: isinstance(v, (int, float)) and v >= 0, "a float >= 0"),
+	"radio_weights" : (lambda v: isinstance(v, dict) and all(isinstance(k, str) and isinstance(w, (int, float)) and w >= 0 for k, w in v.items()), 
+						"a dict of option key -> weight >= 0"),
+	"answers_per_task" : (lambda v: isinstance(v, int) and v > 0, "an int > 0"),
+	"budget" : (lambda v: isinstance(v, (int, float)) and v > 0, "a float > 0"),
+	"seed" : (lambda v: isinstance(v, int), "an int"),
+}
+
+def _make_mock_options(options):
+	"""
+	Checks the options of a mock adapter, and converts them to the strings sent in AdapterCredentials.adapter_options.
+	The options are:
+		latency_s 			- seconds between a task being launched and a mock worker answering it (default 0).
+							  AutoMan's mock back-end counts in whole seconds
+		latency_jitter_s 	- each answer is delayed by up to this many more seconds, at random (default 0)
+		dropout 			- the probability that a mock worker accepts a task but never answers (default 0)
+		estimate_mean 		- the mean of the normal distribution answers to estimate tasks are drawn from (default 42.0)
+		estimate_stddev 	- the standard deviation of that distribution (default 1.0)
+		radio_weights 		- dict of option key -> weight, the distribution answers to radio tasks are drawn from.
+							  Options not in the dict are never chosen. By default every worker chooses the first option key
+							  in sorted order
+		answers_per_task 	- the number of mock workers answering each task (default 30)
+		budget 				- the balance of the mock account (default 1000.00)
+		seed 				- the seed of the random answers and delays
+
+	Parameters
+	----------
+	options : dict
+		The options given in the adapter dict, besides type, access_id and access_key
+
+	Returns
+	-------
+	dict
+		option name -> option value as a string
+
+	Raises
+	------
+	AdapterError: 	Indicates an unknown option, or an option with a bad value
+	"""
+	mock_options = dict()
+	for name, value in options.items():
+		if name not in _MOCK_OPTIONS:
+			raise AdapterError("unknown mock adapter option "+str(name)+". The options are: "+", ".join(sorted(_MOCK_OPTIONS)))
+		check, description = _MOCK_OPTIONS[name]
+		if isinstance(value, bool) or not check(value):
+			raise AdapterError("mock adapter option "+name+" must be "+description)
+		if name == "radio_weights":
+			mock_options[name] = ",".join("%s:%r"%(key, float(weight)) for key, weight in value.items())
+		else:
+			mock_options[name] = repr(value)
+	return mock_options
+
+# reconnect quickly to a server that is still starting, rather than with gRPC's default backoff of up to 2 minutes
+_CHANNEL_OPTIONS = [("grpc.initial_reconnect_backoff_ms", 100), ("grpc.min_reconnect_backoff_ms", 100), ("grpc.max_reconnect_backoff_ms", 1000)]
+# channels with identical options share their connection to a server, unless they have their own subchannel pool
+_DEDICATED_OPTIONS = [("grpc.use_local_subchannel_pool", 1)]
+_warned_insecure = False
+
+def _target(address_, port_, socket_path_):
+	if socket_path_:
+		return "unix:"+path.abspath(socket_path_)
+	# an IPv6 address is bracketed, so that its colons are not read as the port's
+	if ":" in address_ and not address_.startswith("["):
+		address_ = "["+address_+"]"
+	return address_+":"+port_
+
+def make_channel(address_, port_, dedicated_ = False, socket_path_ = None):
 	"""
-	Makes a gRPC channel to communicate with server
+	Makes a gRPC channel to communicate with server. Warns that the channel is insecure the first time it is called
 
 	Parameters
 	----------
@@ -105,18 +328,76 @@ def make_channel(address_, port_):
 		The hostname of the gRPC server
 	port_ : str
 		The port of the gRPC server
+	dedicated_ : bool
+		Whether the channel opens its own connection to the server, rather than sharing one with the other 
+		channels to it
+	socket_path_ : str
+		If set, the path of the Unix domain socket the gRPC server listens on, dialed in place of address_ and port_
 	Returns
 	-------
 	Channel
     	A gRPC channel to the specified gRPC server
 	"""
-	print("Warning: Making an insecure gRPC channel")
-	return grpc.insecure_channel(address_+":"+port_)
+	global _warned_insecure
+	if not _warned_insecure:
+		_warned_insecure = True
+		print("Warning: Making an insecure gRPC channel")
+	options = _CHANNEL_OPTIONS + _DEDICATED_OPTIONS if dedicated_ else _CHANNEL_OPTIONS
+	return grpc.insecure_channel(_target(address_, port_, socket_path_), options = options)
+
+def make_aio_channel(address_, port_, dedicated_ = False, socket_path_ = None):
+	"""
+	Makes an asyncio gRPC channel to communicate with server. Must be called from
+	within a running event loop
+
+	Parameters
+	----------
+	address_ : str
+		The hostname of the gRPC server
+	port_ : str
+		The port of the gRPC server
+	dedicated_ : bool
+		Whether the channel opens its own connection to the server, see make_channel
+	socket_path_ : str
+		If set, the path of the Unix domain socket the gRPC server listens on, see make_channel
+	Returns
+	-------
+	grpc.aio.Channel
+		An asyncio gRPC channel to the specified gRPC server
+	"""
+	return grpc.aio.insecure_channel(_target(address_, port_, socket_path_), options = _DEDICATED_OPTIONS if dedicated_ else None)
+
+def make_channel_pool(address_, port_, size_, policy_ = 'round_robin', aio_ = False, socket_path_ = None):
+	"""
+	Makes a pool of gRPC channels to the server, each with its own connection. A pool of one channel shares its
+	connection like a channel from make_channel
+
+	Parameters
+	----------
+	address_ : str
+		The hostname of the gRPC server
+	port_ : str
+		The port of the gRPC server
+	size_ : int
+		The number of channels
+	policy_ : str
+		How each call's channel is picked, see ChannelPool
+	aio_ : bool
+		Whether to make asyncio channels, in which case this must be called from within a running event loop
+	socket_path_ : str
+		If set, the path of the Unix domain socket the gRPC server listens on, see make_channel
+	Returns
+	-------
+	ChannelPool
+		The pool of channels
+	"""
+	make = make_aio_channel if aio_ else make_channel
+	return ChannelPool([make(address_, port_, dedicated_ = size_ > 1, socket_path_ = socket_path_) for i in range(size_)], policy_)
 
 def make_est_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ = None, confidence_ = None, confidence_int_ = None,
 				sample_size_ = -1, dont_reject_ = False, pay_all_on_failure_ = True, dry_run_ = False, 
 				wage_ = None, max_value_ = None, min_value_ = None, question_timeout_multiplier_ = None, 
-				initial_worker_timeout_in_s_ = None):
+				initial_worker_timeout_in_s_ = None, mock_answers_ = None):
 	"""
 	Makes an estimation task for an Automan object to service
 
@@ -135,7 +416,8 @@ def make_est_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ =
 						pay_all_on_failure_ =pay_all_on_failure_  , dry_run_ = dry_run_ , wage_ = wage_, 
 						max_value_ = max_value_ , min_value_ = min_value_ , 
 						question_timeout_multiplier_ = question_timeout_multiplier_ , 
-						initial_worker_timeout_in_s_ =initial_worker_timeout_in_s_) 
+						initial_worker_timeout_in_s_ =initial_worker_timeout_in_s_,
+						mock_answers_ = None if mock_answers_ is None else [repr(float(answer)) for answer in mock_answers_]) 
 
 	timeout = int(initial_worker_timeout_in_s_) * int(initial_worker_timeout_in_s_)
 	automan_task = AutomanTask(estimate=EstimateTask(task=task), timeout = timeout)
@@ -143,7 +425,7 @@ def make_est_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ =
 
 def make_rad_task(text_, options_, budget_, image_url_=None, img_alt_txt_ = None, title_ = None, confidence_ = None, 
 				dont_reject_ = False, pay_all_on_failure_ = True, dry_run_ = False, 
-				wage_ = None, question_timeout_multiplier_ = None, initial_worker_timeout_in_s_ = None):
+				wage_ = None, question_timeout_multiplier_ = None, initial_worker_timeout_in_s_ = None, mock_answers_ = None):
 	"""
 	Makes a radio task for an Automan object to service
 
@@ -162,7 +444,8 @@ def make_rad_task(text_, options_, budget_, image_url_=None, img_alt_txt_ = None
 						confidence_=confidence_ ,dont_reject_ =dont_reject_ , options_=opts,
 						pay_all_on_failure_ =pay_all_on_failure_  , dry_run_ = dry_run_ , wage_ = wage_, 
 						question_timeout_multiplier_ = question_timeout_multiplier_ , 
-						initial_worker_timeout_in_s_ =initial_worker_timeout_in_s_) 
+						initial_worker_timeout_in_s_ =initial_worker_timeout_in_s_,
+						mock_answers_ = mock_answers_) 
 	timeout = int(initial_worker_timeout_in_s_) * int(initial_worker_timeout_in_s_)
 	automan_task = AutomanTask(radio=RadioTask(task=task), timeout = timeout)
 	return automan_task
@@ -170,7 +453,7 @@ def make_rad_task(text_, options_, budget_, image_url_=None, img_alt_txt_ = None
 def make_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ = None, pattern_ = None, confidence_ = None, 
 			confidence_int_ = None,sample_size_ = -1, options_ = None, dimensions_ = None, dont_reject_ = False, pay_all_on_failure_ = True,
 			dry_run_ = False, allow_empty_pattern_ = False, pattern_error_text_ = None, wage_ = None, max_value_ = None,
-			min_value_ = None, question_timeout_multiplier_ = None, initial_worker_timeout_in_s_ = None):
+			min_value_ = None, question_timeout_multiplier_ = None, initial_worker_timeout_in_s_ = None, mock_answers_ = None):
 	"""
 	A general function for making tasks, used by other functions in this library for making specific tasks
 
@@ -220,6 +503,9 @@ def make_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ = Non
 		For example: if this value is 60, and the initial_worker_timeout_in_s_ is 60, the question will live for 1 hour
 	initial_worker_timeout_in_s_ : int
 		The time limit for the worker to complete the task once accepted  
+	mock_answers_ : List(str)
+		The answers the workers of a mock back-end give to the task, in order. Estimates are given as 
+		strings of floats, radio answers as option keys. Ignored by other back-ends
 
 	Returns
 	-------
@@ -230,7 +516,8 @@ def make_task(text_, budget_, image_url_=None, img_alt_txt_ = None, title_ = Non
 					pattern = pattern_ , confidence = confidence_, confidence_int = confidence_int_, sample_size = sample_size_, options = options_ , 
 					dimensions = dimensions_ , dont_reject = dont_reject_ , pay_all_on_failure = pay_all_on_failure_,dry_run = dry_run_, 
 					allow_empty_pattern = allow_empty_pattern_, pattern_error_text = pattern_error_text_, wage = wage_, max_value = max_value_, 
-					min_value = min_value_, question_timeout_multiplier = question_timeout_multiplier_, initial_worker_timeout_in_s = initial_worker_timeout_in_s_)
+					min_value = min_value_, question_timeout_multiplier = question_timeout_multiplier_, initial_worker_timeout_in_s = initial_worker_timeout_in_s_,
+					mock_answers = mock_answers_)
 
 	return t
 
@@ -278,7 +565,7 @@ def submit_task(channel_,automan_task_, adapter_):
 
 	Parameters
     ----------
-    channel_ : Channel
+    channel_ : Channel or ChannelPool
     	A gRPC channel
     task_ : Task
     	A Task to be run by Automan
@@ -307,7 +594,127 @@ def submit_task(channel_,automan_task_, adapter_):
 	response = client_stub.SubmitTask.future(automan_task_)
 	return response
 
-def start_rpc_server(port=50051, suppress_output = 'all', stdout_file = None, stderr_file = None):
+def submit_tasks(channel_, automan_tasks_, chunk_size_ = 500, before_send_ = None):
+	"""
+	Submits many tasks to the gRPC server listening on channel_ over a single SubmitTasks stream. 
+	Tasks are sent up in chunks of chunk_size_ tasks. Each task must have its task_id set
+
+	Parameters
+	----------
+	channel_ : Channel or ChannelPool
+		A gRPC channel
+	automan_tasks_ : iterable of AutomanTask
+		The tasks to be run by Automan. Consumed lazily, as the stream is written
+	chunk_size_ : int
+		The number of tasks sent in each message on the stream
+	before_send_ : callable
+		Called with the tasks of each message before it is sent, on the thread writing the stream. May block, 
+		holding the rest of the stream back
+
+	Returns
+	-------
+	iterator of TaskResponseBatch
+		The stream of responses from the gRPC server. See the SubmitTasks rpc in automanlib_rpc.proto
+		for a description of the responses
+	"""
+	def chunks():
+		chunk = TaskBatch()
+		for automan_task in automan_tasks_:
+			chunk.tasks.append(automan_task)
+			if len(chunk.tasks) >= chunk_size_:
+				if before_send_ is not None:
+					before_send_(chunk.tasks)
+				yield chunk
+				chunk = TaskBatch()
+		if len(chunk.tasks) > 0:
+			if before_send_ is not None:
+				before_send_(chunk.tasks)
+			yield chunk
+
+	client_stub = _make_client_stub(channel_)
+	return client_stub.SubmitTasks(chunks())
+
+def post_task(channel_, automan_task_):
+	"""
+	Queues automan_task_ on the gRPC server listening on channel_, without waiting for its outcome. 
+	The outcome is collected with watch_outcomes. Does not block
+
+	Parameters
+	----------
+	channel_ : Channel or ChannelPool
+		A gRPC channel
+	automan_task_ : AutomanTask
+		A Task to be run by Automan
+
+	Returns
+	-------
+	gRPC Future TaskTicket
+		A future resolving to the ticket that holds the task_id the server assigned to the task
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.PostTask.future(automan_task_)
+
+def post_task_async(channel_, automan_task_):
+	"""
+	Queues automan_task_ on the gRPC server listening on the asyncio channel_. See post_task
+
+	Parameters
+	----------
+	channel_ : grpc.aio.Channel or ChannelPool
+		An asyncio gRPC channel
+	automan_task_ : AutomanTask
+		A Task to be run by Automan
+
+	Returns
+	-------
+	grpc.aio.UnaryUnaryCall
+		An awaitable call that resolves to the TaskTicket of the task
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.PostTask(automan_task_)
+
+def watch_outcomes(channel_, tickets_):
+	"""
+	Watches the outcomes of tasks queued with post_task. The server pushes the response of each task 
+	down the returned stream the moment the task is resolved
+
+	Parameters
+	----------
+	channel_ : Channel
+		A gRPC channel
+	tickets_ : iterator of TaskTicket
+		The tickets of the tasks to watch. Consumed lazily, for as long as the stream is open
+
+	Returns
+	-------
+	iterator of TaskResponse
+		The stream of responses, in the order the tasks are resolved. Each response has its task_id set
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.WatchOutcomes(tickets_)
+
+def submit_task_async(channel_, automan_task_):
+	"""
+	Submits task_ to the gRPC server listening on the asyncio channel_. Does not block
+
+	Parameters
+	----------
+	channel_ : grpc.aio.Channel or ChannelPool
+		An asyncio gRPC channel
+	automan_task_ : AutomanTask
+		A Task to be run by Automan
+
+	Returns
+	-------
+	grpc.aio.UnaryUnaryCall
+		An awaitable call that resolves to the TaskResponse from the gRPC server. See
+		submit_task for a description of the TaskResponse
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.SubmitTask(automan_task_)
+
+def start_rpc_server(port=50051, suppress_output = 'all', stdout_file = None, stderr_file = None, workers = 1, stderr_log = None, 
+						idle_ttl = None, socket_path = None):
 	"""
 	Start the remote gRPC server process
 
@@ -323,11 +730,33 @@ def start_rpc_server(port=50051, suppress_output = 'all', stdout_file = None, st
 	    		file 	- redirect output from rpc server to files specified by 
 	    					stdout and stderr 
 	    		none 	- suppress no output from rpc server
+	workers : int
+		The number of AutoMan workers the server launches tasks with. Workers take tasks from a shared queue
+	stderr_log : file
+		A file to write the server's error output to where it would otherwise be suppressed, so that it can be 
+		reported if the server fails to start. See wait_for_rpc_server
+	idle_ttl : int
+		If set, the server is started as a daemon shared by client sessions, in its own process session so that it 
+		outlives the process starting it. It shuts itself down once it has had no open session for idle_ttl seconds
+	socket_path : str
+		If set, the server listens on a Unix domain socket at this path instead of on port. A socket left at the 
+		path by a server that is no longer running is removed first
+
+	Raises
+	------
+	ArgumentError: Indicates something other than a socket is at socket_path
+	RPCServerError: Indicates a server is listening on the socket at socket_path
 	"""
 	# add check port for correct type and valid range
-	cmd_string = [path.dirname(__file__)+"/rpc_server/pack/bin/PyAutoManRpcServer", str(port)]
+	cmd_string = [path.dirname(__file__)+"/rpc_server/pack/bin/PyAutoManRpcServer", str(port), str(workers)]
+	if idle_ttl is not None:
+		cmd_string.append(str(int(idle_ttl)))
+	if socket_path is not None:
+		socket_path = path.abspath(socket_path)
+		_remove_stale_socket(socket_path)
+		cmd_string += ["--socket", socket_path]
 	stout = open(devnull, 'w')
-	sterr = open(devnull, 'w')
+	sterr = open(devnull, 'w') if stderr_log is None else stderr_log
 
 	if suppress_output.lower() == "stdout":
 		stout = open(devnull, 'w')
@@ -343,9 +772,111 @@ def start_rpc_server(port=50051, suppress_output = 'all', stdout_file = None, st
 		sterr = None
 
 	# launch server and wait for it to get ready
-	p = Popen(cmd_string, stdout = stout, stderr = sterr)
+	p = Popen(cmd_string, stdout = stout, stderr = sterr, start_new_session = idle_ttl is not None)
 	return p
 
+def _remove_stale_socket(socket_path_):
+	"""
+	Private function. Removes the socket at socket_path_ if it was left by a server that is no longer running, 
+	which is the case when connecting to it is refused. Does nothing if there is no file at the path
+
+	Raises
+	------
+	ArgumentError: Indicates something other than a socket is at the path
+	RPCServerError: Indicates a server is listening on the socket, or it could not be connected to
+	"""
+	try:
+		mode = stat(socket_path_).st_mode
+	except FileNotFoundError:
+		return
+	if not S_ISSOCK(mode):
+		raise ArgumentError("socket_path "+socket_path_+" exists and is not a socket")
+	with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+		try:
+			sock.connect(socket_path_)
+		except ConnectionRefusedError:
+			remove(socket_path_)
+			return
+		except OSError as os_err:
+			raise RPCServerError("Unable to check the socket "+socket_path_+": "+str(os_err))
+	raise RPCServerError("A server is already listening on the socket "+socket_path_)
+
+def find_free_port(address_ = 'localhost'):
+	"""
+	Returns a TCP port nothing listens on, picked by the operating system. The port is free when this returns, 
+	and another process may still take it before a server started on it binds it
+
+	Parameters
+	----------
+	address_ : str
+		The hostname the port is free on
+	Returns
+	-------
+	int
+		The port number
+	"""
+	# the address family of the hostname, e.g AF_INET6 for '::1'
+	family, _socktype, _proto, _canonname, sockaddr = socket.getaddrinfo(address_, 0, type = socket.SOCK_STREAM)[0]
+	with socket.socket(family, socket.SOCK_STREAM) as sock:
+		sock.bind(sockaddr)
+		return sock.getsockname()[1]
+
+def wait_for_rpc_server(channel_, server_proc_, timeout_, stderr_log_ = None):
+	"""
+	Waits until a spawned gRPC server accepts connections on the channel. Returns as soon as the channel is
+	ready, and fails as soon as the server process exits, without polling either
+
+	Parameters
+	----------
+	channel_ : Channel
+		A gRPC channel to the server
+	server_proc_ : Popen
+		The server process, as returned by start_rpc_server
+	timeout_ : float
+		The maximum number of seconds to wait
+	stderr_log_ : file
+		The file the server's error output was written to, if any. Its tail is included in the error raised
+		if the server exits early
+
+	Raises
+	------
+	RPCServerError: Indicates the server process exited before it was ready, or was not ready within timeout_, in
+					which case the process is killed
+	"""
+	ready = grpc.channel_ready_future(channel_)
+	changed = threading.Event()
+	ready.add_done_callback(lambda _future: changed.set())
+	def wait_exit():
+		server_proc_.wait()
+		changed.set()
+	proc_watcher = threading.Thread(target = wait_exit, name = "automanpy-server-watcher")
+	proc_watcher.daemon = True
+	proc_watcher.start()
+
+	changed.wait(timeout_)
+	if ready.done():
+		return
+	ready.cancel()
+	if server_proc_.poll() is not None:
+		msg = "RPC server process exited with code "+str(server_proc_.returncode)+" before it was ready"
+		tail = _read_tail(stderr_log_)
+		if tail:
+			msg = msg + ". Last output:\n" + tail
+		raise RPCServerError(msg)
+	server_proc_.kill()
+	raise RPCServerError("RPC server process was not ready after "+str(timeout_)+" seconds, killed it")
+
+def _read_tail(file_, n_bytes = 2000):
+	"""
+	Private function. Returns the last n_bytes written to file_, decoded, or None if file_ is None
+	"""
+	if file_ is None:
+		return None
+	file_.flush()
+	file_.seek(0, SEEK_END)
+	file_.seek(max(0, file_.tell() - n_bytes))
+	return file_.read().decode('utf-8', 'replace').strip()
+
 def shutdown_rpc_server(channel_):
 	"""
 	Shutdown the remote gRPC server process
@@ -383,6 +914,45 @@ def register_adapter_to_server(channel_, adptr):
 	response = client_stub.RegisterAdapter(adptr)
 	return response
 
+def open_session(channel_, session_id_):
+	"""
+	Opens a client session on the server, or renews it
+
+	Parameters
+	----------
+	channel_ : Channel
+		A gRPC channel to the server
+	session_id_ : str
+		The session's identifier
+
+	Returns
+	-------
+	SessionResponse
+		return_code is ServerStatusResponse.SUCCESS if the session is open, and ServerStatusResponse.KILLED if the 
+		server is shutting down. lease_seconds is the time within which the session must be renewed
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.OpenSession(Session(session_id = session_id_))
+
+def close_session(channel_, session_id_):
+	"""
+	Closes a client session opened with open_session
+
+	Parameters
+	----------
+	channel_ : Channel
+		A gRPC channel to the server
+	session_id_ : str
+		The session's identifier
+
+	Returns
+	-------
+	SessionResponse
+		sessions is the number of sessions still open on the server
+	"""
+	client_stub = _make_client_stub(channel_)
+	return client_stub.CloseSession(Session(session_id = session_id_))
+
 def get_server_status(channel_):
 	"""
 	Returns the server status
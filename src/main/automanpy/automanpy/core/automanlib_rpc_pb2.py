@@ -1,12 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: automanpy/core/automanlib_rpc.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+"""Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,595 +14,41 @@ _sym_db = _symbol_database.Default()
 from automanpy.core.grpc_classes import automanlib_classes_pb2 as automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='automanpy/core/automanlib_rpc.proto',
-  package='',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n#automanpy/core/automanlib_rpc.proto\x1a\x34\x61utomanpy/core/grpc_classes/automanlib_classes.proto\"\xdc\x02\n\x0b\x41utomanTask\x12!\n\x08\x65stimate\x18\x01 \x01(\x0b\x32\r.EstimateTaskH\x00\x12+\n\rmultiestimate\x18\x02 \x01(\x0b\x32\x12.MultiestimateTaskH\x00\x12!\n\x08\x66reetext\x18\x03 \x01(\x0b\x32\r.FreetextTaskH\x00\x12*\n\rfreetext_dist\x18\x04 \x01(\x0b\x32\x11.FreetextDistTaskH\x00\x12\x1b\n\x05radio\x18\x05 \x01(\x0b\x32\n.RadioTaskH\x00\x12$\n\nradio_dist\x18\x06 \x01(\x0b\x32\x0e.RadioDistTaskH\x00\x12!\n\x08\x63heckbox\x18\x07 \x01(\x0b\x32\r.CheckboxTaskH\x00\x12*\n\rcheckbox_dist\x18\x08 \x01(\x0b\x32\x11.CheckboxDistTaskH\x00\x12\x0f\n\x07timeout\x18\t \x01(\x05\x42\x0b\n\ttask_type\"\xca\x03\n\x0e\x41utomanOutcome\x12\x1f\n\rempty_outcome\x18\x01 \x01(\x0b\x32\x06.EmptyH\x00\x12,\n\x10\x65stimate_outcome\x18\x02 \x01(\x0b\x32\x10.EstimateOutcomeH\x00\x12\x36\n\x15multiestimate_outcome\x18\x03 \x01(\x0b\x32\x15.MultiestimateOutcomeH\x00\x12&\n\rradio_outcome\x18\x04 \x01(\x0b\x32\r.RadioOutcomeH\x00\x12/\n\x12radio_dist_outcome\x18\x05 \x01(\x0b\x32\x11.RadioDistOutcomeH\x00\x12,\n\x10\x66reetext_outcome\x18\x06 \x01(\x0b\x32\x10.FreetextOutcomeH\x00\x12\x35\n\x15\x66reetext_dist_outcome\x18\x07 \x01(\x0b\x32\x14.FreetextDistOutcomeH\x00\x12,\n\x10\x63heckbox_outcome\x18\x08 \x01(\x0b\x32\x10.CheckboxOutcomeH\x00\x12\x35\n\x15\x63heckbox_dist_outcome\x18\t \x01(\x0b\x32\x14.CheckboxDistOutcomeH\x00\x42\x0e\n\x0ctask_outcome\"\xa7\x03\n\x0cTaskResponse\x12\x31\n\x0breturn_code\x18\x01 \x01(\x0e\x32\x1c.TaskResponse.TaskReturnCode\x12 \n\x07outcome\x18\x02 \x01(\x0b\x32\x0f.AutomanOutcome\x12/\n\nexcep_code\x18\x03 \x01(\x0e\x32\x1b.TaskResponse.ExceptionCode\x12)\n\x08\x65rr_code\x18\x04 \x01(\x0e\x32\x17.TaskResponse.ErrorCode\x12\x0f\n\x07\x65rr_msg\x18\x05 \x01(\t\x12\x11\n\texcep_msg\x18\x06 \x01(\t\"N\n\x0eTaskReturnCode\x12\x17\n\x13UNDEFINED_RESP_CODE\x10\x00\x12\t\n\x05VALID\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\r\n\tEXCEPTION\x10\x03\",\n\rExceptionCode\x12\x1b\n\x17UNDEFINED_EXCPTION_CODE\x10\x00\"D\n\tErrorCode\x12\x18\n\x14UNDEFINED_ERROR_CODE\x10\x00\x12\x1d\n\x19NO_CREDENTIALS_REGISTERED\x10\x01\"\xb0\x01\n\x14ServerStatusResponse\x12\x39\n\x0breturn_code\x18\x01 \x01(\x0e\x32$.ServerStatusResponse.StatReturnCode\"]\n\x0eStatReturnCode\x12\x19\n\x15UNDEFINED_STATUS_CODE\x10\x00\x12\x0b\n\x07RUNNING\x10\x01\x12\n\n\x06KILLED\x10\x02\x12\x0b\n\x07SUCCESS\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\"\x07\n\x05\x45mpty2\xe2\x01\n\x12PyautomanPrototype\x12-\n\nKillServer\x12\x06.Empty\x1a\x15.ServerStatusResponse\"\x00\x12+\n\nSubmitTask\x12\x0c.AutomanTask\x1a\r.TaskResponse\"\x00\x12/\n\x0cServerStatus\x12\x06.Empty\x1a\x15.ServerStatusResponse\"\x00\x12?\n\x0fRegisterAdapter\x12\x13.AdapterCredentials\x1a\x15.ServerStatusResponse\"\x00\x62\x06proto3')
-  ,
-  dependencies=[automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.DESCRIPTOR,])
-
-
-
-_TASKRESPONSE_TASKRETURNCODE = _descriptor.EnumDescriptor(
-  name='TaskReturnCode',
-  full_name='TaskResponse.TaskReturnCode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNDEFINED_RESP_CODE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='VALID', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='ERROR', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='EXCEPTION', index=3, number=3,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1135,
-  serialized_end=1213,
-)
-_sym_db.RegisterEnumDescriptor(_TASKRESPONSE_TASKRETURNCODE)
-
-_TASKRESPONSE_EXCEPTIONCODE = _descriptor.EnumDescriptor(
-  name='ExceptionCode',
-  full_name='TaskResponse.ExceptionCode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNDEFINED_EXCPTION_CODE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1215,
-  serialized_end=1259,
-)
-_sym_db.RegisterEnumDescriptor(_TASKRESPONSE_EXCEPTIONCODE)
-
-_TASKRESPONSE_ERRORCODE = _descriptor.EnumDescriptor(
-  name='ErrorCode',
-  full_name='TaskResponse.ErrorCode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNDEFINED_ERROR_CODE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='NO_CREDENTIALS_REGISTERED', index=1, number=1,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1261,
-  serialized_end=1329,
-)
-_sym_db.RegisterEnumDescriptor(_TASKRESPONSE_ERRORCODE)
-
-_SERVERSTATUSRESPONSE_STATRETURNCODE = _descriptor.EnumDescriptor(
-  name='StatReturnCode',
-  full_name='ServerStatusResponse.StatReturnCode',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNDEFINED_STATUS_CODE', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='RUNNING', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='KILLED', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SUCCESS', index=3, number=3,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='FAILED', index=4, number=4,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1415,
-  serialized_end=1508,
-)
-_sym_db.RegisterEnumDescriptor(_SERVERSTATUSRESPONSE_STATRETURNCODE)
-
-
-_AUTOMANTASK = _descriptor.Descriptor(
-  name='AutomanTask',
-  full_name='AutomanTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='estimate', full_name='AutomanTask.estimate', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='multiestimate', full_name='AutomanTask.multiestimate', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='freetext', full_name='AutomanTask.freetext', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='freetext_dist', full_name='AutomanTask.freetext_dist', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='radio', full_name='AutomanTask.radio', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='radio_dist', full_name='AutomanTask.radio_dist', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='checkbox', full_name='AutomanTask.checkbox', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='checkbox_dist', full_name='AutomanTask.checkbox_dist', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='timeout', full_name='AutomanTask.timeout', index=8,
-      number=9, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='task_type', full_name='AutomanTask.task_type',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=94,
-  serialized_end=442,
-)
-
-
-_AUTOMANOUTCOME = _descriptor.Descriptor(
-  name='AutomanOutcome',
-  full_name='AutomanOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='empty_outcome', full_name='AutomanOutcome.empty_outcome', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='estimate_outcome', full_name='AutomanOutcome.estimate_outcome', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='multiestimate_outcome', full_name='AutomanOutcome.multiestimate_outcome', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='radio_outcome', full_name='AutomanOutcome.radio_outcome', index=3,
-      number=4, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='radio_dist_outcome', full_name='AutomanOutcome.radio_dist_outcome', index=4,
-      number=5, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='freetext_outcome', full_name='AutomanOutcome.freetext_outcome', index=5,
-      number=6, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='freetext_dist_outcome', full_name='AutomanOutcome.freetext_dist_outcome', index=6,
-      number=7, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='checkbox_outcome', full_name='AutomanOutcome.checkbox_outcome', index=7,
-      number=8, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='checkbox_dist_outcome', full_name='AutomanOutcome.checkbox_dist_outcome', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-    _descriptor.OneofDescriptor(
-      name='task_outcome', full_name='AutomanOutcome.task_outcome',
-      index=0, containing_type=None, fields=[]),
-  ],
-  serialized_start=445,
-  serialized_end=903,
-)
-
-
-_TASKRESPONSE = _descriptor.Descriptor(
-  name='TaskResponse',
-  full_name='TaskResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='return_code', full_name='TaskResponse.return_code', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome', full_name='TaskResponse.outcome', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='excep_code', full_name='TaskResponse.excep_code', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='err_code', full_name='TaskResponse.err_code', index=3,
-      number=4, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='err_msg', full_name='TaskResponse.err_msg', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='excep_msg', full_name='TaskResponse.excep_msg', index=5,
-      number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _TASKRESPONSE_TASKRETURNCODE,
-    _TASKRESPONSE_EXCEPTIONCODE,
-    _TASKRESPONSE_ERRORCODE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=906,
-  serialized_end=1329,
-)
-
-
-_SERVERSTATUSRESPONSE = _descriptor.Descriptor(
-  name='ServerStatusResponse',
-  full_name='ServerStatusResponse',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='return_code', full_name='ServerStatusResponse.return_code', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-    _SERVERSTATUSRESPONSE_STATRETURNCODE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1332,
-  serialized_end=1508,
-)
-
-
-_EMPTY = _descriptor.Descriptor(
-  name='Empty',
-  full_name='Empty',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1510,
-  serialized_end=1517,
-)
-
-_AUTOMANTASK.fields_by_name['estimate'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._ESTIMATETASK
-_AUTOMANTASK.fields_by_name['multiestimate'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._MULTIESTIMATETASK
-_AUTOMANTASK.fields_by_name['freetext'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._FREETEXTTASK
-_AUTOMANTASK.fields_by_name['freetext_dist'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._FREETEXTDISTTASK
-_AUTOMANTASK.fields_by_name['radio'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._RADIOTASK
-_AUTOMANTASK.fields_by_name['radio_dist'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._RADIODISTTASK
-_AUTOMANTASK.fields_by_name['checkbox'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._CHECKBOXTASK
-_AUTOMANTASK.fields_by_name['checkbox_dist'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._CHECKBOXDISTTASK
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['estimate'])
-_AUTOMANTASK.fields_by_name['estimate'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['multiestimate'])
-_AUTOMANTASK.fields_by_name['multiestimate'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['freetext'])
-_AUTOMANTASK.fields_by_name['freetext'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['freetext_dist'])
-_AUTOMANTASK.fields_by_name['freetext_dist'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['radio'])
-_AUTOMANTASK.fields_by_name['radio'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['radio_dist'])
-_AUTOMANTASK.fields_by_name['radio_dist'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['checkbox'])
-_AUTOMANTASK.fields_by_name['checkbox'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANTASK.oneofs_by_name['task_type'].fields.append(
-  _AUTOMANTASK.fields_by_name['checkbox_dist'])
-_AUTOMANTASK.fields_by_name['checkbox_dist'].containing_oneof = _AUTOMANTASK.oneofs_by_name['task_type']
-_AUTOMANOUTCOME.fields_by_name['empty_outcome'].message_type = _EMPTY
-_AUTOMANOUTCOME.fields_by_name['estimate_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._ESTIMATEOUTCOME
-_AUTOMANOUTCOME.fields_by_name['multiestimate_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._MULTIESTIMATEOUTCOME
-_AUTOMANOUTCOME.fields_by_name['radio_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._RADIOOUTCOME
-_AUTOMANOUTCOME.fields_by_name['radio_dist_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._RADIODISTOUTCOME
-_AUTOMANOUTCOME.fields_by_name['freetext_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._FREETEXTOUTCOME
-_AUTOMANOUTCOME.fields_by_name['freetext_dist_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._FREETEXTDISTOUTCOME
-_AUTOMANOUTCOME.fields_by_name['checkbox_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._CHECKBOXOUTCOME
-_AUTOMANOUTCOME.fields_by_name['checkbox_dist_outcome'].message_type = automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._CHECKBOXDISTOUTCOME
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['empty_outcome'])
-_AUTOMANOUTCOME.fields_by_name['empty_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['estimate_outcome'])
-_AUTOMANOUTCOME.fields_by_name['estimate_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['multiestimate_outcome'])
-_AUTOMANOUTCOME.fields_by_name['multiestimate_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['radio_outcome'])
-_AUTOMANOUTCOME.fields_by_name['radio_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['radio_dist_outcome'])
-_AUTOMANOUTCOME.fields_by_name['radio_dist_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['freetext_outcome'])
-_AUTOMANOUTCOME.fields_by_name['freetext_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['freetext_dist_outcome'])
-_AUTOMANOUTCOME.fields_by_name['freetext_dist_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['checkbox_outcome'])
-_AUTOMANOUTCOME.fields_by_name['checkbox_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_AUTOMANOUTCOME.oneofs_by_name['task_outcome'].fields.append(
-  _AUTOMANOUTCOME.fields_by_name['checkbox_dist_outcome'])
-_AUTOMANOUTCOME.fields_by_name['checkbox_dist_outcome'].containing_oneof = _AUTOMANOUTCOME.oneofs_by_name['task_outcome']
-_TASKRESPONSE.fields_by_name['return_code'].enum_type = _TASKRESPONSE_TASKRETURNCODE
-_TASKRESPONSE.fields_by_name['outcome'].message_type = _AUTOMANOUTCOME
-_TASKRESPONSE.fields_by_name['excep_code'].enum_type = _TASKRESPONSE_EXCEPTIONCODE
-_TASKRESPONSE.fields_by_name['err_code'].enum_type = _TASKRESPONSE_ERRORCODE
-_TASKRESPONSE_TASKRETURNCODE.containing_type = _TASKRESPONSE
-_TASKRESPONSE_EXCEPTIONCODE.containing_type = _TASKRESPONSE
-_TASKRESPONSE_ERRORCODE.containing_type = _TASKRESPONSE
-_SERVERSTATUSRESPONSE.fields_by_name['return_code'].enum_type = _SERVERSTATUSRESPONSE_STATRETURNCODE
-_SERVERSTATUSRESPONSE_STATRETURNCODE.containing_type = _SERVERSTATUSRESPONSE
-DESCRIPTOR.message_types_by_name['AutomanTask'] = _AUTOMANTASK
-DESCRIPTOR.message_types_by_name['AutomanOutcome'] = _AUTOMANOUTCOME
-DESCRIPTOR.message_types_by_name['TaskResponse'] = _TASKRESPONSE
-DESCRIPTOR.message_types_by_name['ServerStatusResponse'] = _SERVERSTATUSRESPONSE
-DESCRIPTOR.message_types_by_name['Empty'] = _EMPTY
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-AutomanTask = _reflection.GeneratedProtocolMessageType('AutomanTask', (_message.Message,), dict(
-  DESCRIPTOR = _AUTOMANTASK,
-  __module__ = 'automanpy.core.automanlib_rpc_pb2'
-  # @@protoc_insertion_point(class_scope:AutomanTask)
-  ))
-_sym_db.RegisterMessage(AutomanTask)
-
-AutomanOutcome = _reflection.GeneratedProtocolMessageType('AutomanOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _AUTOMANOUTCOME,
-  __module__ = 'automanpy.core.automanlib_rpc_pb2'
-  # @@protoc_insertion_point(class_scope:AutomanOutcome)
-  ))
-_sym_db.RegisterMessage(AutomanOutcome)
-
-TaskResponse = _reflection.GeneratedProtocolMessageType('TaskResponse', (_message.Message,), dict(
-  DESCRIPTOR = _TASKRESPONSE,
-  __module__ = 'automanpy.core.automanlib_rpc_pb2'
-  # @@protoc_insertion_point(class_scope:TaskResponse)
-  ))
-_sym_db.RegisterMessage(TaskResponse)
-
-ServerStatusResponse = _reflection.GeneratedProtocolMessageType('ServerStatusResponse', (_message.Message,), dict(
-  DESCRIPTOR = _SERVERSTATUSRESPONSE,
-  __module__ = 'automanpy.core.automanlib_rpc_pb2'
-  # @@protoc_insertion_point(class_scope:ServerStatusResponse)
-  ))
-_sym_db.RegisterMessage(ServerStatusResponse)
-
-Empty = _reflection.GeneratedProtocolMessageType('Empty', (_message.Message,), dict(
-  DESCRIPTOR = _EMPTY,
-  __module__ = 'automanpy.core.automanlib_rpc_pb2'
-  # @@protoc_insertion_point(class_scope:Empty)
-  ))
-_sym_db.RegisterMessage(Empty)
-
-
-
-_PYAUTOMANPROTOTYPE = _descriptor.ServiceDescriptor(
-  name='PyautomanPrototype',
-  full_name='PyautomanPrototype',
-  file=DESCRIPTOR,
-  index=0,
-  serialized_options=None,
-  serialized_start=1520,
-  serialized_end=1746,
-  methods=[
-  _descriptor.MethodDescriptor(
-    name='KillServer',
-    full_name='PyautomanPrototype.KillServer',
-    index=0,
-    containing_service=None,
-    input_type=_EMPTY,
-    output_type=_SERVERSTATUSRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='SubmitTask',
-    full_name='PyautomanPrototype.SubmitTask',
-    index=1,
-    containing_service=None,
-    input_type=_AUTOMANTASK,
-    output_type=_TASKRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='ServerStatus',
-    full_name='PyautomanPrototype.ServerStatus',
-    index=2,
-    containing_service=None,
-    input_type=_EMPTY,
-    output_type=_SERVERSTATUSRESPONSE,
-    serialized_options=None,
-  ),
-  _descriptor.MethodDescriptor(
-    name='RegisterAdapter',
-    full_name='PyautomanPrototype.RegisterAdapter',
-    index=3,
-    containing_service=None,
-    input_type=automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2._ADAPTERCREDENTIALS,
-    output_type=_SERVERSTATUSRESPONSE,
-    serialized_options=None,
-  ),
-])
-_sym_db.RegisterServiceDescriptor(_PYAUTOMANPROTOTYPE)
-
-DESCRIPTOR.services_by_name['PyautomanPrototype'] = _PYAUTOMANPROTOTYPE
-
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n#automanpy/core/automanlib_rpc.proto\x1a\x34\x61utomanpy/core/grpc_classes/automanlib_classes.proto\"\xed\x02\n\x0b\x41utomanTask\x12!\n\x08\x65stimate\x18\x01 \x01(\x0b\x32\r.EstimateTaskH\x00\x12+\n\rmultiestimate\x18\x02 \x01(\x0b\x32\x12.MultiestimateTaskH\x00\x12!\n\x08\x66reetext\x18\x03 \x01(\x0b\x32\r.FreetextTaskH\x00\x12*\n\rfreetext_dist\x18\x04 \x01(\x0b\x32\x11.FreetextDistTaskH\x00\x12\x1b\n\x05radio\x18\x05 \x01(\x0b\x32\n.RadioTaskH\x00\x12$\n\nradio_dist\x18\x06 \x01(\x0b\x32\x0e.RadioDistTaskH\x00\x12!\n\x08\x63heckbox\x18\x07 \x01(\x0b\x32\r.CheckboxTaskH\x00\x12*\n\rcheckbox_dist\x18\x08 \x01(\x0b\x32\x11.CheckboxDistTaskH\x00\x12\x0f\n\x07timeout\x18\t \x01(\x05\x12\x0f\n\x07task_id\x18\n \x01(\tB\x0b\n\ttask_type\"(\n\tTaskBatch\x12\x1b\n\x05tasks\x18\x01 \x03(\x0b\x32\x0c.AutomanTask\"\xca\x03\n\x0e\x41utomanOutcome\x12\x1f\n\rempty_outcome\x18\x01 \x01(\x0b\x32\x06.EmptyH\x00\x12,\n\x10\x65stimate_outcome\x18\x02 \x01(\x0b\x32\x10.EstimateOutcomeH\x00\x12\x36\n\x15multiestimate_outcome\x18\x03 \x01(\x0b\x32\x15.MultiestimateOutcomeH\x00\x12&\n\rradio_outcome\x18\x04 \x01(\x0b\x32\r.RadioOutcomeH\x00\x12/\n\x12radio_dist_outcome\x18\x05 \x01(\x0b\x32\x11.RadioDistOutcomeH\x00\x12,\n\x10\x66reetext_outcome\x18\x06 \x01(\x0b\x32\x10.FreetextOutcomeH\x00\x12\x35\n\x15\x66reetext_dist_outcome\x18\x07 \x01(\x0b\x32\x14.FreetextDistOutcomeH\x00\x12,\n\x10\x63heckbox_outcome\x18\x08 \x01(\x0b\x32\x10.CheckboxOutcomeH\x00\x12\x35\n\x15\x63heckbox_dist_outcome\x18\t \x01(\x0b\x32\x14.CheckboxDistOutcomeH\x00\x42\x0e\n\x0ctask_outcome\"\xef\x03\n\x0cTaskResponse\x12\x31\n\x0breturn_code\x18\x01 \x01(\x0e\x32\x1c.TaskResponse.TaskReturnCode\x12 \n\x07outcome\x18\x02 \x01(\x0b\x32\x0f.AutomanOutcome\x12/\n\nexcep_code\x18\x03 \x01(\x0e\x32\x1b.TaskResponse.ExceptionCode\x12)\n\x08\x65rr_code\x18\x04 \x01(\x0e\x32\x17.TaskResponse.ErrorCode\x12\x0f\n\x07\x65rr_msg\x18\x05 \x01(\t\x12\x11\n\texcep_msg\x18\x06 \x01(\t\x12\x0f\n\x07task_id\x18\x07 \x01(\t\"\\\n\x0eTaskReturnCode\x12\x17\n\x13UNDEFINED_RESP_CODE\x10\x00\x12\t\n\x05VALID\x10\x01\x12\t\n\x05\x45RROR\x10\x02\x12\r\n\tEXCEPTION\x10\x03\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x04\",\n\rExceptionCode\x12\x1b\n\x17UNDEFINED_EXCPTION_CODE\x10\x00\"m\n\tErrorCode\x12\x18\n\x14UNDEFINED_ERROR_CODE\x10\x00\x12\x1d\n\x19NO_CREDENTIALS_REGISTERED\x10\x01\x12\x13\n\x0fUNKNOWN_TASK_ID\x10\x02\x12\x12\n\x0eTASK_TIMED_OUT\x10\x03\"5\n\x11TaskResponseBatch\x12 \n\tresponses\x18\x01 \x03(\x0b\x32\r.TaskResponse\"\x1d\n\nTaskTicket\x12\x0f\n\x07task_id\x18\x01 \x01(\t\"\xb0\x01\n\x14ServerStatusResponse\x12\x39\n\x0breturn_code\x18\x01 \x01(\x0e\x32$.ServerStatusResponse.StatReturnCode\"]\n\x0eStatReturnCode\x12\x19\n\x15UNDEFINED_STATUS_CODE\x10\x00\x12\x0b\n\x07RUNNING\x10\x01\x12\n\n\x06KILLED\x10\x02\x12\x0b\n\x07SUCCESS\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\"\x07\n\x05\x45mpty\"\x1d\n\x07Session\x12\x12\n\nsession_id\x18\x01 \x01(\t\"u\n\x0fSessionResponse\x12\x39\n\x0breturn_code\x18\x01 \x01(\x0e\x32$.ServerStatusResponse.StatReturnCode\x12\x10\n\x08sessions\x18\x02 \x01(\x05\x12\x15\n\rlease_seconds\x18\x03 \x01(\x05\x32\xce\x03\n\x12PyautomanPrototype\x12-\n\nKillServer\x12\x06.Empty\x1a\x15.ServerStatusResponse\"\x00\x12+\n\nSubmitTask\x12\x0c.AutomanTask\x1a\r.TaskResponse\"\x00\x12/\n\x0cServerStatus\x12\x06.Empty\x1a\x15.ServerStatusResponse\"\x00\x12?\n\x0fRegisterAdapter\x12\x13.AdapterCredentials\x1a\x15.ServerStatusResponse\"\x00\x12\x33\n\x0bSubmitTasks\x12\n.TaskBatch\x1a\x12.TaskResponseBatch\"\x00(\x01\x30\x01\x12\'\n\x08PostTask\x12\x0c.AutomanTask\x1a\x0b.TaskTicket\"\x00\x12\x31\n\rWatchOutcomes\x12\x0b.TaskTicket\x1a\r.TaskResponse\"\x00(\x01\x30\x01\x12+\n\x0bOpenSession\x12\x08.Session\x1a\x10.SessionResponse\"\x00\x12,\n\x0c\x43loseSession\x12\x08.Session\x1a\x10.SessionResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'automanpy.core.automanlib_rpc_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_AUTOMANTASK']._serialized_start=94
+  _globals['_AUTOMANTASK']._serialized_end=459
+  _globals['_TASKBATCH']._serialized_start=461
+  _globals['_TASKBATCH']._serialized_end=501
+  _globals['_AUTOMANOUTCOME']._serialized_start=504
+  _globals['_AUTOMANOUTCOME']._serialized_end=962
+  _globals['_TASKRESPONSE']._serialized_start=965
+  _globals['_TASKRESPONSE']._serialized_end=1460
+  _globals['_TASKRESPONSE_TASKRETURNCODE']._serialized_start=1211
+  _globals['_TASKRESPONSE_TASKRETURNCODE']._serialized_end=1303
+  _globals['_TASKRESPONSE_EXCEPTIONCODE']._serialized_start=1305
+  _globals['_TASKRESPONSE_EXCEPTIONCODE']._serialized_end=1349
+  _globals['_TASKRESPONSE_ERRORCODE']._serialized_start=1351
+  _globals['_TASKRESPONSE_ERRORCODE']._serialized_end=1460
+  _globals['_TASKRESPONSEBATCH']._serialized_start=1462
+  _globals['_TASKRESPONSEBATCH']._serialized_end=1515
+  _globals['_TASKTICKET']._serialized_start=1517
+  _globals['_TASKTICKET']._serialized_end=1546
+  _globals['_SERVERSTATUSRESPONSE']._serialized_start=1549
+  _globals['_SERVERSTATUSRESPONSE']._serialized_end=1725
+  _globals['_SERVERSTATUSRESPONSE_STATRETURNCODE']._serialized_start=1632
+  _globals['_SERVERSTATUSRESPONSE_STATRETURNCODE']._serialized_end=1725
+  _globals['_EMPTY']._serialized_start=1727
+  _globals['_EMPTY']._serialized_end=1734
+  _globals['_SESSION']._serialized_start=1736
+  _globals['_SESSION']._serialized_end=1765
+  _globals['_SESSIONRESPONSE']._serialized_start=1767
+  _globals['_SESSIONRESPONSE']._serialized_end=1884
+  _globals['_PYAUTOMANPROTOTYPE']._serialized_start=1887
+  _globals['_PYAUTOMANPROTOTYPE']._serialized_end=2349
 # @@protoc_insertion_point(module_scope)
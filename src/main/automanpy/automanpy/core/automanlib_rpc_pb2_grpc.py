@@ -1,4 +1,5 @@
 # Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
 import grpc
 
 from automanpy.core import automanlib_rpc_pb2 as automanpy_dot_core_dot_automanlib__rpc__pb2
@@ -6,191 +7,670 @@ from automanpy.core.grpc_classes import automanlib_classes_pb2 as automanpy_dot_
 
 
 class PyautomanPrototypeStub(object):
-  """****
-  This service is a prototype of the Estimation functionality of
-  AutoMan only. 
-  RPC methods:
-
-  KillServer 
-  This method shuts the rpc server down
-  parameters:
-  None
-  returns:
-  ServerStatusResponse
-  Indicates the current status of the server, "KILLED" if the
-  method was successful
-
-  RegisterAdapter 
-  Registers a crowdsource adapter with one of the RPC workers. To be 
-  used when submitting jobs
-  parameters:
-  AdapterCredentials 
-  returns:
-  ServerStatusResponse
-  Indicates whether the adapter was added successfully or not,
-  SUCCESS if it was successful, otherwise FAILED
-
-  ServerStatus 
-  Reports the status of the server
-  parameters:
-  None 
-  returns:
-  ServerStatusResponse
-  Indicates the current status of the server, either "RUNNING" or 
-  "KILLED"
-
-
-  SubmitTask 
-  Submits a task to the AutoMan server to post to the crowdsource back-end
-  parameters:
-  AutomanTask 
-  returns:
-  TaskResponse
-  A response from the Automan server on the submitted task
-  If the response code is VALID, the 
-  task was completed successfully and one of task_outcome will be set depending
-  on the respective task.
-  If the response code was ERROR, an error occured and the err_code and err_msg
-  fields will be set.
-  If the response code was EXCEPTION, an exception occured and the excep_code
-  and excep_msg fields will be set.
-
-  ***
-  """
-
-  def __init__(self, channel):
-    """Constructor.
-
-    Args:
-      channel: A grpc.Channel.
+    """****
+    This service is a prototype of the Estimation functionality of
+    AutoMan only. 
+    RPC methods:
+
+    KillServer 
+    This method shuts the rpc server down
+    parameters:
+    None
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, "KILLED" if the
+    method was successful
+
+    RegisterAdapter 
+    Registers a crowdsource adapter with one of the RPC workers. To be 
+    used when submitting jobs
+    parameters:
+    AdapterCredentials 
+    returns:
+    ServerStatusResponse
+    Indicates whether the adapter was added successfully or not,
+    SUCCESS if it was successful, otherwise FAILED
+
+    ServerStatus 
+    Reports the status of the server
+    parameters:
+    None 
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, either "RUNNING" or 
+    "KILLED"
+
+
+    SubmitTask 
+    Submits a task to the AutoMan server to post to the crowdsource back-end
+    parameters:
+    AutomanTask 
+    returns:
+    TaskResponse
+    A response from the Automan server on the submitted task
+    If the response code is VALID, the 
+    task was completed successfully and one of task_outcome will be set depending
+    on the respective task.
+    If the response code was ERROR, an error occured and the err_code and err_msg
+    fields will be set.
+    If the response code was EXCEPTION, an exception occured and the excep_code
+    and excep_msg fields will be set.
+    If the task is not resolved before its deadline, the call fails with
+    status DEADLINE_EXCEEDED
+
+    SubmitTasks 
+    Submits many tasks over a single bidirectional stream. Tasks are sent up 
+    in chunks, and each chunk is acknowledged as soon as its tasks are queued
+    parameters:
+    stream of TaskBatch 
+    Each task should have its task_id set, so that responses can be 
+    matched to the tasks they answer
+    returns:
+    stream of TaskResponseBatch
+    For every task, one response with return code ACCEPTED once it is
+    queued, then one response, as for SubmitTask, once it is resolved.
+    Responses carry the task_id of the task they answer, and arrive in
+    the order the tasks are resolved. The stream is closed once the
+    client has closed its side and every task is resolved. A task that
+    is not resolved before its deadline is answered with return code
+    ERROR and err_code TASK_TIMED_OUT
+
+    PostTask 
+    Queues a task to be posted to the crowdsource back-end, and returns 
+    right away. The outcome of the task is collected with WatchOutcomes
+    parameters:
+    AutomanTask 
+    returns:
+    TaskTicket
+    Holds the task_id the server assigned to the task
+
+    WatchOutcomes 
+    Watches the outcomes of tasks queued with PostTask. The client sends 
+    the ticket of each task it wants the outcome of, at any time, and 
+    the server pushes the TaskResponse of each task the moment it is 
+    resolved. A task's outcome can be watched once
+    parameters:
+    stream of TaskTicket 
+    returns:
+    stream of TaskResponse
+    One response per ticket, as for SubmitTask, with task_id set to the
+    ticket's task_id. The response to an unknown ticket has return code
+    ERROR and err_code UNKNOWN_TASK_ID, and a task that is not resolved
+    before its deadline (counted from PostTask) is answered with return
+    code ERROR and err_code TASK_TIMED_OUT. The stream is closed once the 
+    client has closed its side and every watched task is resolved
+
+    OpenSession 
+    Opens a client session on a server shared by several client processes, 
+    or renews one. A session that is not renewed within its lease expires, 
+    so a client renews its session until it closes it. A server started as 
+    a daemon shuts itself down once it has had no open session for its idle 
+    TTL
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS if the session is open, KILLED if the server is shutting 
+    down and accepts no new sessions
+
+    CloseSession 
+    Closes a client session opened with OpenSession
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS, also if the session was not open
+
+    ***
     """
-    self.KillServer = channel.unary_unary(
-        '/PyautomanPrototype/KillServer',
-        request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
-        response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
-        )
-    self.SubmitTask = channel.unary_unary(
-        '/PyautomanPrototype/SubmitTask',
-        request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.SerializeToString,
-        response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.FromString,
-        )
-    self.ServerStatus = channel.unary_unary(
-        '/PyautomanPrototype/ServerStatus',
-        request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
-        response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
-        )
-    self.RegisterAdapter = channel.unary_unary(
-        '/PyautomanPrototype/RegisterAdapter',
-        request_serializer=automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.AdapterCredentials.SerializeToString,
-        response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
-        )
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.KillServer = channel.unary_unary(
+                '/PyautomanPrototype/KillServer',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+                )
+        self.SubmitTask = channel.unary_unary(
+                '/PyautomanPrototype/SubmitTask',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.FromString,
+                )
+        self.ServerStatus = channel.unary_unary(
+                '/PyautomanPrototype/ServerStatus',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+                )
+        self.RegisterAdapter = channel.unary_unary(
+                '/PyautomanPrototype/RegisterAdapter',
+                request_serializer=automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.AdapterCredentials.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+                )
+        self.SubmitTasks = channel.stream_stream(
+                '/PyautomanPrototype/SubmitTasks',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskBatch.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponseBatch.FromString,
+                )
+        self.PostTask = channel.unary_unary(
+                '/PyautomanPrototype/PostTask',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.FromString,
+                )
+        self.WatchOutcomes = channel.stream_stream(
+                '/PyautomanPrototype/WatchOutcomes',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.FromString,
+                )
+        self.OpenSession = channel.unary_unary(
+                '/PyautomanPrototype/OpenSession',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Session.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.FromString,
+                )
+        self.CloseSession = channel.unary_unary(
+                '/PyautomanPrototype/CloseSession',
+                request_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Session.SerializeToString,
+                response_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.FromString,
+                )
 
 
 class PyautomanPrototypeServicer(object):
-  """****
-  This service is a prototype of the Estimation functionality of
-  AutoMan only. 
-  RPC methods:
-
-  KillServer 
-  This method shuts the rpc server down
-  parameters:
-  None
-  returns:
-  ServerStatusResponse
-  Indicates the current status of the server, "KILLED" if the
-  method was successful
-
-  RegisterAdapter 
-  Registers a crowdsource adapter with one of the RPC workers. To be 
-  used when submitting jobs
-  parameters:
-  AdapterCredentials 
-  returns:
-  ServerStatusResponse
-  Indicates whether the adapter was added successfully or not,
-  SUCCESS if it was successful, otherwise FAILED
-
-  ServerStatus 
-  Reports the status of the server
-  parameters:
-  None 
-  returns:
-  ServerStatusResponse
-  Indicates the current status of the server, either "RUNNING" or 
-  "KILLED"
-
-
-  SubmitTask 
-  Submits a task to the AutoMan server to post to the crowdsource back-end
-  parameters:
-  AutomanTask 
-  returns:
-  TaskResponse
-  A response from the Automan server on the submitted task
-  If the response code is VALID, the 
-  task was completed successfully and one of task_outcome will be set depending
-  on the respective task.
-  If the response code was ERROR, an error occured and the err_code and err_msg
-  fields will be set.
-  If the response code was EXCEPTION, an exception occured and the excep_code
-  and excep_msg fields will be set.
-
-  ***
-  """
-
-  def KillServer(self, request, context):
-    # missing associated documentation comment in .proto file
-    pass
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def SubmitTask(self, request, context):
-    # missing associated documentation comment in .proto file
-    pass
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def ServerStatus(self, request, context):
-    # missing associated documentation comment in .proto file
-    pass
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
-
-  def RegisterAdapter(self, request, context):
-    # missing associated documentation comment in .proto file
-    pass
-    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-    context.set_details('Method not implemented!')
-    raise NotImplementedError('Method not implemented!')
+    """****
+    This service is a prototype of the Estimation functionality of
+    AutoMan only. 
+    RPC methods:
+
+    KillServer 
+    This method shuts the rpc server down
+    parameters:
+    None
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, "KILLED" if the
+    method was successful
+
+    RegisterAdapter 
+    Registers a crowdsource adapter with one of the RPC workers. To be 
+    used when submitting jobs
+    parameters:
+    AdapterCredentials 
+    returns:
+    ServerStatusResponse
+    Indicates whether the adapter was added successfully or not,
+    SUCCESS if it was successful, otherwise FAILED
+
+    ServerStatus 
+    Reports the status of the server
+    parameters:
+    None 
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, either "RUNNING" or 
+    "KILLED"
+
+
+    SubmitTask 
+    Submits a task to the AutoMan server to post to the crowdsource back-end
+    parameters:
+    AutomanTask 
+    returns:
+    TaskResponse
+    A response from the Automan server on the submitted task
+    If the response code is VALID, the 
+    task was completed successfully and one of task_outcome will be set depending
+    on the respective task.
+    If the response code was ERROR, an error occured and the err_code and err_msg
+    fields will be set.
+    If the response code was EXCEPTION, an exception occured and the excep_code
+    and excep_msg fields will be set.
+    If the task is not resolved before its deadline, the call fails with
+    status DEADLINE_EXCEEDED
+
+    SubmitTasks 
+    Submits many tasks over a single bidirectional stream. Tasks are sent up 
+    in chunks, and each chunk is acknowledged as soon as its tasks are queued
+    parameters:
+    stream of TaskBatch 
+    Each task should have its task_id set, so that responses can be 
+    matched to the tasks they answer
+    returns:
+    stream of TaskResponseBatch
+    For every task, one response with return code ACCEPTED once it is
+    queued, then one response, as for SubmitTask, once it is resolved.
+    Responses carry the task_id of the task they answer, and arrive in
+    the order the tasks are resolved. The stream is closed once the
+    client has closed its side and every task is resolved. A task that
+    is not resolved before its deadline is answered with return code
+    ERROR and err_code TASK_TIMED_OUT
+
+    PostTask 
+    Queues a task to be posted to the crowdsource back-end, and returns 
+    right away. The outcome of the task is collected with WatchOutcomes
+    parameters:
+    AutomanTask 
+    returns:
+    TaskTicket
+    Holds the task_id the server assigned to the task
+
+    WatchOutcomes 
+    Watches the outcomes of tasks queued with PostTask. The client sends 
+    the ticket of each task it wants the outcome of, at any time, and 
+    the server pushes the TaskResponse of each task the moment it is 
+    resolved. A task's outcome can be watched once
+    parameters:
+    stream of TaskTicket 
+    returns:
+    stream of TaskResponse
+    One response per ticket, as for SubmitTask, with task_id set to the
+    ticket's task_id. The response to an unknown ticket has return code
+    ERROR and err_code UNKNOWN_TASK_ID, and a task that is not resolved
+    before its deadline (counted from PostTask) is answered with return
+    code ERROR and err_code TASK_TIMED_OUT. The stream is closed once the 
+    client has closed its side and every watched task is resolved
+
+    OpenSession 
+    Opens a client session on a server shared by several client processes, 
+    or renews one. A session that is not renewed within its lease expires, 
+    so a client renews its session until it closes it. A server started as 
+    a daemon shuts itself down once it has had no open session for its idle 
+    TTL
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS if the session is open, KILLED if the server is shutting 
+    down and accepts no new sessions
+
+    CloseSession 
+    Closes a client session opened with OpenSession
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS, also if the session was not open
+
+    ***
+    """
+
+    def KillServer(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitTask(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ServerStatus(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RegisterAdapter(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SubmitTasks(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PostTask(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WatchOutcomes(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def OpenSession(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CloseSession(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
 
 
 def add_PyautomanPrototypeServicer_to_server(servicer, server):
-  rpc_method_handlers = {
-      'KillServer': grpc.unary_unary_rpc_method_handler(
-          servicer.KillServer,
-          request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.FromString,
-          response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
-      ),
-      'SubmitTask': grpc.unary_unary_rpc_method_handler(
-          servicer.SubmitTask,
-          request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.FromString,
-          response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.SerializeToString,
-      ),
-      'ServerStatus': grpc.unary_unary_rpc_method_handler(
-          servicer.ServerStatus,
-          request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.FromString,
-          response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
-      ),
-      'RegisterAdapter': grpc.unary_unary_rpc_method_handler(
-          servicer.RegisterAdapter,
-          request_deserializer=automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.AdapterCredentials.FromString,
-          response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
-      ),
-  }
-  generic_handler = grpc.method_handlers_generic_handler(
-      'PyautomanPrototype', rpc_method_handlers)
-  server.add_generic_rpc_handlers((generic_handler,))
+    rpc_method_handlers = {
+            'KillServer': grpc.unary_unary_rpc_method_handler(
+                    servicer.KillServer,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
+            ),
+            'SubmitTask': grpc.unary_unary_rpc_method_handler(
+                    servicer.SubmitTask,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.SerializeToString,
+            ),
+            'ServerStatus': grpc.unary_unary_rpc_method_handler(
+                    servicer.ServerStatus,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
+            ),
+            'RegisterAdapter': grpc.unary_unary_rpc_method_handler(
+                    servicer.RegisterAdapter,
+                    request_deserializer=automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.AdapterCredentials.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.SerializeToString,
+            ),
+            'SubmitTasks': grpc.stream_stream_rpc_method_handler(
+                    servicer.SubmitTasks,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskBatch.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponseBatch.SerializeToString,
+            ),
+            'PostTask': grpc.unary_unary_rpc_method_handler(
+                    servicer.PostTask,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.SerializeToString,
+            ),
+            'WatchOutcomes': grpc.stream_stream_rpc_method_handler(
+                    servicer.WatchOutcomes,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.SerializeToString,
+            ),
+            'OpenSession': grpc.unary_unary_rpc_method_handler(
+                    servicer.OpenSession,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Session.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.SerializeToString,
+            ),
+            'CloseSession': grpc.unary_unary_rpc_method_handler(
+                    servicer.CloseSession,
+                    request_deserializer=automanpy_dot_core_dot_automanlib__rpc__pb2.Session.FromString,
+                    response_serializer=automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'PyautomanPrototype', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+
+
+ # This class is part of an EXPERIMENTAL API.
+class PyautomanPrototype(object):
+    """****
+    This service is a prototype of the Estimation functionality of
+    AutoMan only. 
+    RPC methods:
+
+    KillServer 
+    This method shuts the rpc server down
+    parameters:
+    None
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, "KILLED" if the
+    method was successful
+
+    RegisterAdapter 
+    Registers a crowdsource adapter with one of the RPC workers. To be 
+    used when submitting jobs
+    parameters:
+    AdapterCredentials 
+    returns:
+    ServerStatusResponse
+    Indicates whether the adapter was added successfully or not,
+    SUCCESS if it was successful, otherwise FAILED
+
+    ServerStatus 
+    Reports the status of the server
+    parameters:
+    None 
+    returns:
+    ServerStatusResponse
+    Indicates the current status of the server, either "RUNNING" or 
+    "KILLED"
+
+
+    SubmitTask 
+    Submits a task to the AutoMan server to post to the crowdsource back-end
+    parameters:
+    AutomanTask 
+    returns:
+    TaskResponse
+    A response from the Automan server on the submitted task
+    If the response code is VALID, the 
+    task was completed successfully and one of task_outcome will be set depending
+    on the respective task.
+    If the response code was ERROR, an error occured and the err_code and err_msg
+    fields will be set.
+    If the response code was EXCEPTION, an exception occured and the excep_code
+    and excep_msg fields will be set.
+    If the task is not resolved before its deadline, the call fails with
+    status DEADLINE_EXCEEDED
+
+    SubmitTasks 
+    Submits many tasks over a single bidirectional stream. Tasks are sent up 
+    in chunks, and each chunk is acknowledged as soon as its tasks are queued
+    parameters:
+    stream of TaskBatch 
+    Each task should have its task_id set, so that responses can be 
+    matched to the tasks they answer
+    returns:
+    stream of TaskResponseBatch
+    For every task, one response with return code ACCEPTED once it is
+    queued, then one response, as for SubmitTask, once it is resolved.
+    Responses carry the task_id of the task they answer, and arrive in
+    the order the tasks are resolved. The stream is closed once the
+    client has closed its side and every task is resolved. A task that
+    is not resolved before its deadline is answered with return code
+    ERROR and err_code TASK_TIMED_OUT
+
+    PostTask 
+    Queues a task to be posted to the crowdsource back-end, and returns 
+    right away. The outcome of the task is collected with WatchOutcomes
+    parameters:
+    AutomanTask 
+    returns:
+    TaskTicket
+    Holds the task_id the server assigned to the task
+
+    WatchOutcomes 
+    Watches the outcomes of tasks queued with PostTask. The client sends 
+    the ticket of each task it wants the outcome of, at any time, and 
+    the server pushes the TaskResponse of each task the moment it is 
+    resolved. A task's outcome can be watched once
+    parameters:
+    stream of TaskTicket 
+    returns:
+    stream of TaskResponse
+    One response per ticket, as for SubmitTask, with task_id set to the
+    ticket's task_id. The response to an unknown ticket has return code
+    ERROR and err_code UNKNOWN_TASK_ID, and a task that is not resolved
+    before its deadline (counted from PostTask) is answered with return
+    code ERROR and err_code TASK_TIMED_OUT. The stream is closed once the 
+    client has closed its side and every watched task is resolved
+
+    OpenSession 
+    Opens a client session on a server shared by several client processes, 
+    or renews one. A session that is not renewed within its lease expires, 
+    so a client renews its session until it closes it. A server started as 
+    a daemon shuts itself down once it has had no open session for its idle 
+    TTL
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS if the session is open, KILLED if the server is shutting 
+    down and accepts no new sessions
+
+    CloseSession 
+    Closes a client session opened with OpenSession
+    parameters:
+    Session 
+    returns:
+    SessionResponse
+    SUCCESS, also if the session was not open
+
+    ***
+    """
+
+    @staticmethod
+    def KillServer(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/KillServer',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SubmitTask(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/SubmitTask',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def ServerStatus(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/ServerStatus',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.Empty.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def RegisterAdapter(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/RegisterAdapter',
+            automanpy_dot_core_dot_grpc__classes_dot_automanlib__classes__pb2.AdapterCredentials.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.ServerStatusResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def SubmitTasks(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/PyautomanPrototype/SubmitTasks',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskBatch.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponseBatch.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PostTask(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/PostTask',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.AutomanTask.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def WatchOutcomes(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/PyautomanPrototype/WatchOutcomes',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskTicket.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.TaskResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def OpenSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/OpenSession',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.Session.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def CloseSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/PyautomanPrototype/CloseSession',
+            automanpy_dot_core_dot_automanlib__rpc__pb2.Session.SerializeToString,
+            automanpy_dot_core_dot_automanlib__rpc__pb2.SessionResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -1,69 +1,397 @@
-from automanpy.core.outcomes import EstimateOutcome, RadioOutcome
+import asyncio
+import threading
+from array import array
+from time import monotonic
 
-#from pyautomanexceptions import ArgumentError, UnsupportedServerError, AdapterError
+from queue import Queue, Empty
+
+from grpc import FutureTimeoutError
+
+from automanpy.core.outcomes import Outcome, EstimateOutcome, RadioOutcome
+from automanpy.core.pyautomanexceptions import ArgumentError
+from automanpy.core.sinks import outcome_record
 
 class Batch():
 	"""
-	The Batch class. A collection of (possibly unresolved future) EstimateOutcomes, representing
-	the result of a batch task submission.
+	The Batch class. A collection of (possibly unresolved future) outcomes, representing
+	the result of a batch task submission. A Batch can be iterated over, and the outcomes it holds
+	can be passed to asyncio.as_completed. From a coroutine, 'async for' yields the outcomes in
+	the order they resolve.
 
 	Attributes
 	----------
 	outcomes : list
 		A list of outcomes, in the order in which the tasks submitted (order of image_urls)
+	keys : list
+		The key of each task, see dedupe.task_key, in the order of outcomes. None if the batch was built
+		without them
 	"""
 
-	def __init__(self, outcomes):
+	#the categories of the outcome_type column of to_numpy, indexed by its codes
+	OUTCOME_TYPES = ('PENDING', 'CONFIDENT', 'LOW_CONFIDENCE', 'OVERBUDGET', 'ERROR')
+
+	def __init__(self, outcomes, keys = None):
 		"""
 		Parameters
 		----------
 		outcomes : list
 			A list of futures, representing the future outcome of each task submitted to the server
+		keys : list
+			The key of each task, in the order of outcomes
 		"""
 		if not isinstance(outcomes, list): 
 			raise ArgumentError("Cannot create Batch object: outcomes must be a list")
 		for outcome in outcomes:
-			if not isinstance(outcome, EstimateOutcome): 
-				raise ArgumentError("Cannot create Batch object: each item in the list of outcomes must be of type EstimateOutcome")
+			if not isinstance(outcome, Outcome): 
+				raise ArgumentError("Cannot create Batch object: each item in the list of outcomes must be of type EstimateOutcome or RadioOutcome")
+		if keys is not None and (not isinstance(keys, list) or len(keys) != len(outcomes)):
+			raise ArgumentError("Cannot create Batch object: keys must be a list with one key per outcome")
 
 		self.outcomes = outcomes
+		self.keys = keys
+		# the columns of to_numpy, built on its first call and from then on filled in as the outcomes resolve, 
+		# so that a batch never turned into columns costs nothing per outcome
+		self._columns = None
+		self._columns_lock = threading.Lock()
+
+	def __len__(self):
+		return len(self.outcomes)
+
+	def __iter__(self):
+		return iter(self.outcomes)
+
+	def __aiter__(self):
+		"""
+		Asynchronously iterates over the outcomes, yielding each one as soon as it is resolved
+
+		"""
+		return self._as_done_async()
+
+	async def _as_done_async(self):
+		for next_done in asyncio.as_completed(self.outcomes):
+			yield await next_done
 
-	def wait_all_done(self):
+	async def wait_all_done_async(self):
+		"""
+		Coroutine that waits until the future of every outcome in the batch is resolved
+
+		"""
+		await asyncio.gather(*self.outcomes)
+
+	def wait_all_done(self, timeout = None):
 		"""
 		Method blocks until the future of every outcome in the batch is resolved
 
+		Parameters
+		----------
+		timeout : float
+			The maximum number of seconds to wait for the whole batch. If None, waits indefinitely
+
+		Raises
+		------
+		FutureTimeoutError: 	If the batch is not fully resolved before the timeout expires
+		"""
+		deadline = None if timeout is None else monotonic() + timeout
+		for outcome in self.outcomes:
+			outcome.done(timeout = Batch._remaining(deadline))
+
+	def as_done(self, timeout = None):
+		"""
+		Method yields each outcome as soon as its future resolves, in the order they resolve. 
+		Completion is pushed by the futures themselves, so results are yielded the instant they 
+		are available and no outcome is re-checked
+
+		Parameters
+		----------
+		timeout : float
+			The maximum number of seconds to wait for the whole batch. If None, waits indefinitely
+
+		Raises
+		------
+		FutureTimeoutError: 	If the batch is not fully resolved before the timeout expires
 		"""
+		deadline = None if timeout is None else monotonic() + timeout
+		done_queue = Queue()
 		for outcome in self.outcomes:
+			outcome.add_done_callback(done_queue.put)
+
+		for _ in range(len(self.outcomes)):
+			try:
+				outcome = done_queue.get(timeout = Batch._remaining(deadline))
+			except Empty:
+				raise FutureTimeoutError()
+			# the future is already complete, this only initializes the outcome's fields
 			outcome.done()
+			yield outcome
 
-	def as_done(self):
+	@staticmethod
+	def _remaining(deadline):
 		"""
-		Method yields the next resolved outcome
+		Private method. Returns the number of seconds left before deadline, None if there is no deadline
 
+		Raises
+		------
+		FutureTimeoutError: 	If the deadline has passed
 		"""
-		outcomes_ = self.outcomes.copy()
-		while outcomes_:
-			for i, outcome in enumerate(outcomes_):
-				if outcome.isDone():
-					yield outcomes_.pop(i)
-			sleep(2)
-		return
+		if deadline is None:
+			return None
+		remaining = deadline - monotonic()
+		if remaining <= 0:
+			raise FutureTimeoutError()
+		return remaining
 
-	def apply(self, callable_fn):
+	def apply(self, callable_fn, timeout = None):
 		"""
 		Method takes a function that is applied to each outcome as it's future is resolved, and yields the result
 
 		"""
-		outcomes_ = self.as_done()
+		outcomes_ = self.as_done(timeout = timeout)
 		for outcome in outcomes_:
 			yield callable_fn(outcome)
 				
+	def to_numpy(self, structured = True):
+		"""
+		Returns the fields of the outcomes as columns, one row per outcome in the order of outcomes. Needs numpy.
+		The columns are:
+			key 			- the key of the task, "" if the batch has no keys
+			outcome_type 	- the code of the outcome type, an index into Batch.OUTCOME_TYPES. PENDING for an outcome
+								not resolved yet, ERROR for one that resolved to an error
+			est, low, high 	- the estimate, NaN for radio outcomes
+			conf, cost 		- NaN unless CONFIDENT or LOW_CONFIDENCE
+			need, have 		- NaN unless OVERBUDGET
+			answer 			- the option picked, None for estimate outcomes
+		The columns are a copy of the outcomes resolved so far, and do not change as more of them resolve. Does 
+		not block. The first call reads every outcome resolved so far, and later calls only copy the columns, 
+		which are filled in as the other outcomes resolve
+
+		Parameters
+		----------
+		structured : bool
+			True returns a structured array, False a dict of 1-D arrays keyed by column name
+
+		Returns
+		-------
+		numpy.ndarray or dict
+
+		Raises
+		------
+		ImportError: 	If numpy is not installed
+		"""
+		try:
+			import numpy
+		except ImportError:
+			raise ImportError("Batch.to_numpy needs numpy, install it with: pip install automanpy[numpy]")
+		with self._columns_lock:
+			if self._columns is None:
+				self._columns = _Columns(self.outcomes)
+		columns = self._columns.snapshot(numpy)
+		columns['key'] = numpy.array(self.keys if self.keys is not None else [""] * len(self.outcomes), dtype = 'U64')
+		if not structured:
+			return columns
+		rows = numpy.empty(len(self.outcomes), dtype = [(name, columns[name].dtype) for name in _Columns.NAMES])
+		for name in _Columns.NAMES:
+			rows[name] = columns[name]
+		return rows
+
 	def get(self, i):
 		"""
 		Method returns the EstimateOutcome at index i
 
 		"""
 		# ensure future of outcome is resolved before returning it
-		outcomes[i].done()
+		self.outcomes[i].done()
 		return self.outcomes[i]
 
+
+class StreamingBatch():
+	"""
+	The StreamingBatch class. The result of a streaming submission, see Automan.submit_stream. Rather than holding 
+	every outcome, it hands each one to a sink as soon as it resolves and lets go of it, so that only the outcomes
+	of the tasks still pending are held. The sink is written from a writer thread of the batch's own, so a slow sink
+	does not hold up the threads that resolve outcomes
+
+	Attributes
+	----------
+	sink : Sink
+		Where the record of each outcome is written, see core.sinks
+	max_pending : int
+		The number of tasks left unresolved at most, None for no limit
+	submitted : int
+		The number of tasks submitted so far
+	written : int
+		The number of outcomes written to the sink so far
+	"""
+
+	#the number of records handed to the sink in one write, at most
+	WRITE_CHUNK = 500
+
+	def __init__(self, sink, max_pending = None):
+		"""
+		Starts the writer thread
+
+		Parameters
+		----------
+		sink : Sink
+			Where the record of each outcome is written
+		max_pending : int
+			The number of tasks left unresolved at most, None for no limit
+		"""
+		self.sink = sink
+		self.max_pending = max_pending
+		self.submitted = 0
+		self.written = 0
+		self._error = None
+		self._closed = False
+		self._progress = threading.Condition()
+		self._resolved = Queue()
+		self._writer = threading.Thread(target = self._write, name = "automanpy-sink-writer")
+		self._writer.daemon = True
+		self._writer.start()
+
+	def pending(self):
+		"""
+		Returns the number of tasks submitted whose outcome has not been written yet
+
+		"""
+		with self._progress:
+			return self.submitted - self.written
+
+	def _admit(self, n_tasks):
+		"""
+		Private method. Blocks until n_tasks more tasks can be submitted without going over max_pending
+
+		Raises
+		------
+		Exception: 	The error the sink raised, if it failed
+		"""
+		with self._progress:
+			while self._error is None and self.max_pending is not None and self.submitted - self.written + n_tasks > self.max_pending:
+				self._progress.wait()
+			if self._error is not None:
+				raise self._error
+
+	def _add(self, outcomes, keys):
+		"""
+		Private method. Adds the outcomes of tasks just submitted, and their keys, to be written as they resolve
+
+		"""
+		with self._progress:
+			first = self.submitted
+			self.submitted += len(outcomes)
+		for position, outcome, key in zip(range(first, first + len(outcomes)), outcomes, keys):
+			outcome.add_done_callback(lambda resolved, position = position, key = key: self._on_resolved(position, key, resolved))
+
+	def _on_resolved(self, position, key, outcome):
+		if not self._closed:
+			self._resolved.put((position, key, outcome))
+
+	def _write(self):
+		"""
+		Private method. Runs on the writer thread, writing the outcomes to the sink as they resolve, a chunk at a time,
+		until close. Once the sink failed, outcomes are dropped rather than written
+
+		"""
+		closing = False
+		while not closing:
+			resolved = [self._resolved.get()]
+			while resolved[-1] is not None and len(resolved) < StreamingBatch.WRITE_CHUNK:
+				try:
+					resolved.append(self._resolved.get_nowait())
+				except Empty:
+					break
+			if resolved[-1] is None:
+				closing = True
+				resolved.pop()
+			if not resolved or self._error is not None:
+				continue
+			try:
+				self.sink.write([outcome_record(position, key, outcome) for position, key, outcome in resolved])
+			except Exception as exc:
+				with self._progress:
+					self._error = exc
+					self._progress.notify_all()
+				continue
+			with self._progress:
+				self.written += len(resolved)
+				self._progress.notify_all()
+
+	def wait_all_done(self, timeout = None):
+		"""
+		Method blocks until the outcome of every task submitted was written to the sink
+
+		Parameters
+		----------
+		timeout : float
+			The maximum number of seconds to wait. If None, waits indefinitely
+
+		Raises
+		------
+		FutureTimeoutError: 	If not every outcome was written before the timeout expires
+		Exception: 				The error the sink raised, if it failed
+		"""
+		deadline = None if timeout is None else monotonic() + timeout
+		with self._progress:
+			while self._error is None and self.written < self.submitted:
+				self._progress.wait(Batch._remaining(deadline))
+			if self._error is not None:
+				raise self._error
+
+	def close(self):
+		"""
+		Writes the outcomes resolved so far, stops the writer thread and closes the sink. Outcomes that resolve after 
+		this are not written, call wait_all_done first to write every one
+
+		"""
+		if self._closed:
+			return
+		self._closed = True
+		self._resolved.put(None)
+		self._writer.join()
+		self.sink.close()
+
+class _Columns():
+	"""
+	Private class. The columns of Batch.to_numpy but the key, a row filled in from the thread that resolves each
+	outcome, or at once for the outcomes already resolved when the columns are built. The rows are kept in flat arrays of the standard library, so that numpy is only imported by to_numpy
+	"""
+
+	NAMES = ('key', 'outcome_type', 'est', 'low', 'high', 'conf', 'cost', 'need', 'have', 'answer')
+	FLOATS = ('est', 'low', 'high', 'conf', 'cost', 'need', 'have')
+
+	def __init__(self, outcomes):
+		self._lock = threading.Lock()
+		self._outcome_type = array('b', bytes(len(outcomes)))
+		# one row of floats per outcome, so that an outcome is filled in with a single assignment
+		self._floats = array('d', [float('nan')]) * (len(outcomes) * len(_Columns.FLOATS))
+		self._answer = [None] * len(outcomes)
+		for row, outcome in enumerate(outcomes):
+			outcome.add_done_callback(lambda resolved, row = row: self._fill(row, resolved))
+
+	def _fill(self, row, outcome):
+		# an outcome that resolved to an error is left unevaluated
+		if not outcome.isDone():
+			with self._lock:
+				self._outcome_type[row] = Batch.OUTCOME_TYPES.index('ERROR')
+			return
+		nan = float('nan')
+		floats = array('d', (getattr(outcome, 'est', nan), getattr(outcome, 'low', nan), getattr(outcome, 'high', nan), 
+								outcome.conf, outcome.cost, outcome.need, outcome.have))
+		start = row * len(_Columns.FLOATS)
+		with self._lock:
+			self._outcome_type[row] = Outcome.types_outcome[outcome.outcomeType()]
+			self._floats[start:start + len(_Columns.FLOATS)] = floats
+			self._answer[row] = getattr(outcome, 'answer', None)
+
+	def snapshot(self, numpy):
+		"""
+		Returns a copy of each column as a numpy array, keyed by name
+
+		"""
+		with self._lock:
+			outcome_type, floats, answers = self._outcome_type.tobytes(), self._floats.tobytes(), list(self._answer)
+		floats = numpy.frombuffer(floats, dtype = numpy.float64).reshape(len(answers), len(_Columns.FLOATS))
+		columns = dict((name, floats[:, i].copy()) for i, name in enumerate(_Columns.FLOATS))
+		columns['outcome_type'] = numpy.frombuffer(outcome_type, dtype = numpy.int8).copy()
+		columns['answer'] = numpy.empty(len(answers), dtype = object)
+		columns['answer'][:] = answers
+		return columns
@@ -0,0 +1,231 @@
+import sqlite3
+import threading
+from concurrent.futures import Future
+from time import time
+
+from automanpy.core.automanlib_rpc_pb2 import TaskResponse
+from automanpy.core.grpc_classes.automanlib_classes_pb2 import OVERBUDGET
+from automanpy.core.pyautomanexceptions import ArgumentError
+
+class OutcomeCache():
+	"""
+	The OutcomeCache class. A persistent store of the responses of resolved tasks, in an SQLite database keyed
+	by the content hash of each task (see dedupe.task_key), so that a script that is run again is given the
+	outcomes of the tasks it already paid for at once, rather than posting them again. Only confident and low
+	confidence outcomes are stored: an over budget task may succeed once the account is topped up.
+
+	Entries older than ttl are not served, and once the store holds more than max_entries, the least recently
+	used entries are evicted. Writes are committed one at a time, so a crash loses at most the outcome being
+	written.
+
+	Attributes
+	----------
+	path : str
+		The path of the database file
+	ttl : float
+		The number of seconds an entry is served after it was stored, None for no limit
+	max_entries : int
+		The number of entries kept, None for no limit
+	hits : int
+		The number of lookups served from the store
+	misses : int
+		The number of lookups that found no live entry
+	stores : int
+		The number of outcomes stored
+	evictions : int
+		The number of entries dropped, for being too old or over max_entries
+	"""
+
+	def __init__(self, path, ttl = None, max_entries = None):
+		"""
+		Opens the store, creating the database file if needed
+
+		Parameters
+		----------
+		path : str
+			The path of the database file. ":memory:" keeps the store in memory, for this process only
+		ttl : float
+			The number of seconds an entry is served after it was stored. None keeps entries until evicted
+		max_entries : int
+			The number of entries kept. None keeps every entry
+		"""
+		if not isinstance(path, str) or not path.strip():
+			raise ArgumentError("cache path must be of type str, cannot be empty")
+		if ttl is not None and (not isinstance(ttl, (int, float)) or ttl <= 0):
+			raise ArgumentError("cache ttl must be of type float, must be strictly greater than 0")
+		if max_entries is not None and (not isinstance(max_entries, int) or max_entries <= 0):
+			raise ArgumentError("cache max_entries must be of type int, must be strictly greater than 0")
+		self.path = path
+		self.ttl = ttl
+		self.max_entries = max_entries
+		self.hits = 0
+		self.misses = 0
+		self.stores = 0
+		self.evictions = 0
+		self._lock = threading.Lock()
+		# outcomes are stored from the threads that resolve them
+		self._db = sqlite3.connect(path, check_same_thread = False, isolation_level = None)
+		self._db.execute("PRAGMA journal_mode=WAL")
+		self._db.execute("PRAGMA synchronous=NORMAL")
+		self._db.execute("CREATE TABLE IF NOT EXISTS outcomes (key TEXT PRIMARY KEY, response BLOB NOT NULL, "
+							"stored_at REAL NOT NULL, used_at REAL NOT NULL)")
+		self._db.execute("CREATE INDEX IF NOT EXISTS outcomes_used_at ON outcomes (used_at)")
+		self._entries = self._db.execute("SELECT COUNT(*) FROM outcomes").fetchone()[0]
+
+	def get(self, key):
+		"""
+		Returns the stored response of the task with this key, or None if there is no live entry
+
+		Parameters
+		----------
+		key : str
+			The key of the task
+
+		Returns
+		-------
+		TaskResponse
+			The response the task resolved to
+
+		Raises
+		------
+		ValueError: Indicates the cache was closed
+		"""
+		return self.get_many([key])[0]
+
+	def get_many(self, keys):
+		"""
+		Returns the stored response of each key, or None where there is no live entry, in the order of keys
+
+		Raises
+		------
+		ValueError: Indicates the cache was closed
+		"""
+		now = time()
+		responses = dict()
+		with self._lock:
+			self._check_open()
+			# SQLite limits the number of parameters of a statement
+			for start in range(0, len(keys), 500):
+				chunk = keys[start:start + 500]
+				rows = self._db.execute("SELECT key, response, stored_at FROM outcomes WHERE key IN (%s)"%",".join("?" * len(chunk)), chunk).fetchall()
+				expired = set(key for key, _response, stored_at in rows if self.ttl is not None and now - stored_at > self.ttl)
+				if expired:
+					self._db.executemany("DELETE FROM outcomes WHERE key = ?", [(key,) for key in expired])
+					self.evictions += len(expired)
+					self._entries -= len(expired)
+				live = [(key, response) for key, response, stored_at in rows if key not in expired]
+				if live:
+					self._db.execute("UPDATE outcomes SET used_at = ? WHERE key IN (%s)"%",".join("?" * len(live)), [now] + [key for key, _response in live])
+				responses.update(live)
+			found = sum(1 for key in keys if key in responses)
+			self.hits += found
+			self.misses += len(keys) - found
+		return [TaskResponse.FromString(responses[key]) if key in responses else None for key in keys]
+
+	def put(self, key, response):
+		"""
+		Stores the response of a resolved task, unless it is an error or an over budget outcome
+
+		Parameters
+		----------
+		key : str
+			The key of the task
+		response : TaskResponse
+			The response the task resolved to
+		"""
+		if response.return_code != TaskResponse.VALID:
+			return
+		task_outcome = response.outcome.WhichOneof('task_outcome')
+		if task_outcome is None or getattr(getattr(response.outcome, task_outcome), 'outcome_type', None) == OVERBUDGET:
+			return
+		stored = TaskResponse()
+		stored.CopyFrom(response)
+		stored.ClearField('task_id')
+		now = time()
+		with self._lock:
+			# a task that resolves after the cache was closed is not stored
+			if self._db is None:
+				return
+			if self._db.execute("SELECT 1 FROM outcomes WHERE key = ?", (key,)).fetchone() is None:
+				self._entries += 1
+			self._db.execute("INSERT OR REPLACE INTO outcomes (key, response, stored_at, used_at) VALUES (?, ?, ?, ?)",
+								(key, stored.SerializeToString(), now, now))
+			self.stores += 1
+			if self.max_entries is not None and self._entries > self.max_entries:
+				evicted = self._db.execute("DELETE FROM outcomes WHERE key IN (SELECT key FROM outcomes ORDER BY used_at LIMIT ?)",
+											(self._entries - self.max_entries,)).rowcount
+				self.evictions += evicted
+				self._entries -= evicted
+
+	def store_when_done(self, key, future):
+		"""
+		Stores the response of a task once its future resolves, if it resolves to a response
+
+		Parameters
+		----------
+		key : str
+			The key of the task
+		future : Future
+			The future of the task's TaskResponse
+		"""
+		def done(resolved):
+			if not resolved.cancelled() and resolved.exception() is None:
+				self.put(key, resolved.result())
+		future.add_done_callback(done)
+
+	@staticmethod
+	def resolved(response):
+		"""
+		Returns a future already resolved to response, to build an outcome from a stored response
+
+		"""
+		future = Future()
+		future.set_running_or_notify_cancel()
+		future.set_result(response)
+		return future
+
+	def __len__(self):
+		with self._lock:
+			return self._entries
+
+	def stats(self):
+		"""
+		Returns
+		-------
+		dict
+			The hits, misses, stores and evictions so far, and the number of entries in the store
+		"""
+		with self._lock:
+			return {'hits' : self.hits, 'misses' : self.misses, 'stores' : self.stores, 'evictions' : self.evictions, 'entries' : self._entries}
+
+	def clear(self):
+		"""
+		Drops every entry
+
+		Raises
+		------
+		ValueError: Indicates the cache was closed
+		"""
+		with self._lock:
+			self._check_open()
+			self._db.execute("DELETE FROM outcomes")
+			self._entries = 0
+
+	def close(self):
+		"""
+		Closes the database. Looking outcomes up or clearing the cache raises a ValueError after this, as for a 
+		closed file, and the outcomes still to be stored by store_when_done are dropped. Closing it again does nothing
+
+		"""
+		with self._lock:
+			if self._db is not None:
+				self._db.close()
+				self._db = None
+
+	def _check_open(self):
+		"""
+		Private method. Raises a ValueError if the cache was closed. The lock must be held
+
+		"""
+		if self._db is None:
+			raise ValueError("the outcome cache at "+self.path+" is closed")
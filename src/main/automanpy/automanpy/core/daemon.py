@@ -0,0 +1,195 @@
+import errno
+import os
+import threading
+from time import monotonic, sleep
+
+import grpc
+
+from automanpy.core.automanlib import open_session, close_session
+from automanpy.core.automanlib_rpc_pb2 import ServerStatusResponse
+
+try:
+	import fcntl
+except ImportError:
+	# Windows has no flock
+	fcntl = None
+
+#True if the platform has the file locks ServerLock takes, which sharing a server needs
+HAS_FILE_LOCKS = fcntl is not None
+
+def runtime_dir():
+	"""
+	Returns the directory the lock and pid files of shared servers are kept in, $AUTOMANPY_RUNTIME_DIR
+	or ~/.automanpy, and creates it if needed
+	"""
+	run_dir = os.environ.get("AUTOMANPY_RUNTIME_DIR") or os.path.join(os.path.expanduser("~"), ".automanpy")
+	os.makedirs(run_dir, exist_ok = True)
+	return run_dir
+
+class ServerLock():
+	"""
+	The ServerLock class. An exclusive lock on the shared server of a port, held by the client process that
+	checks for the server and starts it if needed, so that two processes never both start one. The lock
+	is a lock file, released when the lock is exited or the process holding it dies. The pid file next to
+	it holds the process ID of the last server started on the port.
+
+	Attributes
+	----------
+	port : int
+		The port of the server
+	lock_path : str
+		The path of the lock file
+	pid_path : str
+		The path of the pid file
+	"""
+
+	def __init__(self, port):
+		"""
+		Parameters
+		----------
+		port : int
+			The port of the server
+		"""
+		self.port = port
+		run_dir = runtime_dir()
+		self.lock_path = os.path.join(run_dir, "server-"+str(port)+".lock")
+		self.pid_path = os.path.join(run_dir, "server-"+str(port)+".pid")
+		self._lock_file = None
+
+	def __enter__(self):
+		self._lock_file = open(self.lock_path, "a")
+		fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_EX)
+		return self
+
+	def __exit__(self, *exc_info):
+		fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+		self._lock_file.close()
+		self._lock_file = None
+
+	def read_pid(self):
+		"""
+		Returns the process ID in the pid file, or None if there is no pid file or its process is not running
+		"""
+		try:
+			with open(self.pid_path) as pid_file:
+				pid = int(pid_file.read().strip())
+		except (IOError, ValueError):
+			return None
+		return pid if _pid_running(pid) else None
+
+	def write_pid(self, pid):
+		"""
+		Records pid as the process ID of the server on the port
+		"""
+		with open(self.pid_path, "w") as pid_file:
+			pid_file.write(str(pid))
+
+	def wait_for_exit(self, timeout):
+		"""
+		Waits for at most timeout seconds for the server process in the pid file to exit. The process is not
+		a child of this one, and can only be polled
+
+		Returns
+		-------
+		bool
+			True if no server process is running
+		"""
+		end = monotonic() + timeout
+		while self.read_pid() is not None:
+			if monotonic() >= end:
+				return False
+			sleep(0.05)
+		return True
+
+def _pid_running(pid):
+	try:
+		os.kill(pid, 0)
+	except OSError as err:
+		return err.errno == errno.EPERM
+	# a daemon that exited after the process that started it is a zombie until it is reaped, which /proc tells 
+	# where there is one. Elsewhere the signal having been delivered is all there is to go by
+	if not os.path.isdir("/proc"):
+		return True
+	try:
+		with open("/proc/"+str(pid)+"/stat") as stat:
+			return stat.read().rsplit(")", 1)[1].split()[0] != "Z"
+	except (IOError, IndexError):
+		return True
+
+class ServerSession():
+	"""
+	The ServerSession class. A client session on a shared server, which keeps the server running while it is
+	open. The session is renewed in the background until it is closed, so the server drops it on its own if
+	this process dies without closing it.
+
+	Attributes
+	----------
+	channel : Channel
+		The gRPC channel to the server
+	session_id : str
+		The identifier of the session
+	lease_s : int
+		The number of seconds the server keeps the session open without a renewal
+	"""
+
+	def __init__(self, channel):
+		"""
+		Parameters
+		----------
+		channel : Channel
+			A gRPC channel
+		"""
+		self.channel = channel
+		# os.urandom rather than uuid4, as importing uuid costs more than the attach it is used for
+		self.session_id = str(os.getpid())+"-"+os.urandom(16).hex()
+		self.lease_s = None
+		self._closed = threading.Event()
+		self._renewer = None
+
+	def open(self):
+		"""
+		Opens the session, and starts renewing it
+
+		Returns
+		-------
+		bool
+			True if the session is open, False if the server is shutting down and refused it
+
+		Raises
+		------
+		grpc.RpcError: If the server could not be reached
+		"""
+		resp = open_session(self.channel, self.session_id)
+		if resp.return_code != ServerStatusResponse.SUCCESS:
+			return False
+		self.lease_s = resp.lease_seconds
+		self._renewer = threading.Thread(target = self._renew, name = "automanpy-session")
+		self._renewer.daemon = True
+		self._renewer.start()
+		return True
+
+	def _renew(self):
+		"""
+		Private method. Renews the session three times per lease until it is closed
+		"""
+		while not self._closed.wait(self.lease_s / 3.0):
+			try:
+				open_session(self.channel, self.session_id)
+			except grpc.RpcError:
+				# the server is gone, or busy: try again at the next renewal
+				pass
+
+	def close(self):
+		"""
+		Stops renewing the session and closes it. The server may shut down once every session is closed
+
+		Returns
+		-------
+		int
+			The number of sessions still open on the server, or None if the server could not be reached
+		"""
+		self._closed.set()
+		try:
+			return close_session(self.channel, self.session_id).sessions
+		except grpc.RpcError:
+			return None
@@ -0,0 +1,155 @@
+import hashlib
+import threading
+
+def task_key(automan_task):
+	"""
+	Returns the key of a task: the sha256 of its deterministic serialization, without its task_id. Tasks with the 
+	same type, text, title, image_url and parameters have the same key
+
+	Parameters
+	----------
+	automan_task : AutomanTask
+		The task
+	"""
+	if automan_task.task_id:
+		automan_task = type(automan_task).FromString(automan_task.SerializeToString())
+		automan_task.ClearField('task_id')
+	return hashlib.sha256(automan_task.SerializeToString(deterministic = True)).hexdigest()
+
+class InflightRegistry():
+	"""
+	The InflightRegistry class. The outcomes of submitted tasks that have not resolved yet, keyed by a hash of
+	the content of the task. Submitting a task identical to one still in flight returns the outcome of the
+	first, rather than posting the task, and paying for it, a second time. An outcome is forgotten once it
+	resolves, so a task submitted again after that is posted again.
+
+	Attributes
+	----------
+	hits : int
+		The number of submissions that were given the outcome of an identical task in flight
+	misses : int
+		The number of submissions that were posted
+	"""
+
+	def __init__(self):
+		self.hits = 0
+		self.misses = 0
+		self._inflight = dict()
+		self._lock = threading.Lock()
+		# notified when a reservation that other calls wait on is published
+		self._published = threading.Condition(self._lock)
+
+	def share(self, keys, submit):
+		"""
+		Returns one outcome per key: the in-flight outcome of the key if there is one, or else a newly submitted
+		one. Keys repeated in the list share the outcome of their first occurrence. The keys to post are reserved
+		while submit runs, outside the lock, so that other submissions go on meanwhile: one wanting a reserved key 
+		waits until its outcome is published, and posts the key itself if submit failed
+
+		Parameters
+		----------
+		keys : list of str
+			The keys of the tasks, see task_key
+		submit : callable
+			Called with the list of the positions in keys of the tasks to post, once per key not in flight, and
+			returns the list of their outcomes in the same order
+
+		Returns
+		-------
+		list
+			The outcomes, in the order of keys
+		"""
+		outcomes = [None] * len(keys)
+		first = dict()
+		# the positions of the keys another call has reserved, with its reservation
+		reserved = list()
+		reservation = _Reservation()
+		with self._lock:
+			for position, key in enumerate(keys):
+				if key in first:
+					continue
+				entry = self._inflight.get(key)
+				if entry is None:
+					first[key] = position
+					self._inflight[key] = reservation
+				elif isinstance(entry, _Reservation):
+					entry.waited = True
+					reserved.append((position, key, entry))
+				else:
+					outcomes[position] = entry
+			self.hits += len(keys) - len(first)
+			self.misses += len(first)
+
+		posted = dict()
+		if first:
+			try:
+				posted = dict(zip(first, submit(list(first.values()))))
+			finally:
+				with self._lock:
+					for key in first:
+						if key in posted:
+							self._inflight[key] = posted[key]
+						else:
+							del self._inflight[key]
+					reservation.outcomes = posted
+					if reservation.waited:
+						self._published.notify_all()
+			for key, outcome in posted.items():
+				outcome.add_done_callback(lambda _outcome, key = key: self._forget(key, _outcome))
+
+		retry = list()
+		if reserved:
+			with self._lock:
+				for position, key, other in reserved:
+					while other.outcomes is None:
+						self._published.wait()
+					outcomes[position] = other.outcomes.get(key)
+					if outcomes[position] is None:
+						retry.append(position)
+				self.hits -= len(retry)
+		if retry:
+			for position, outcome in zip(retry, self.share([keys[position] for position in retry], 
+																lambda positions: submit([retry[position] for position in positions]))):
+				outcomes[position] = outcome
+		return [outcome if outcome is not None else posted[key] for key, outcome in zip(keys, outcomes)]
+
+	def _forget(self, key, outcome):
+		"""
+		Private method. Drops a resolved outcome, unless its key has since been given another
+
+		"""
+		with self._lock:
+			if self._inflight.get(key) is outcome:
+				del self._inflight[key]
+
+	def __len__(self):
+		with self._lock:
+			return len(self._inflight)
+
+	def stats(self):
+		"""
+		Returns
+		-------
+		dict
+			The hits and misses so far, and the number of outcomes in flight
+		"""
+		with self._lock:
+			return {'hits' : self.hits, 'misses' : self.misses, 'inflight' : len(self._inflight)}
+
+class _Reservation():
+	"""
+	Private class. Stands in the registry for the keys a call of InflightRegistry.share is posting, until it 
+	publishes their outcomes
+
+	Attributes
+	----------
+	outcomes : dict
+		The outcomes posted, keyed by key, empty if posting failed. None until published
+	waited : bool
+		Whether another call waits on the outcomes
+	"""
+	__slots__ = ('outcomes', 'waited')
+
+	def __init__(self):
+		self.outcomes = None
+		self.waited = False
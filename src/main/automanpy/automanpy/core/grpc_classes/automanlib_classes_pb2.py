@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: automanpy/core/grpc_classes/automanlib_classes.proto
-
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
-from google.protobuf.internal import enum_type_wrapper
+"""Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
+from google.protobuf import descriptor_pool as _descriptor_pool
 from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -15,1737 +13,83 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor.FileDescriptor(
-  name='automanpy/core/grpc_classes/automanlib_classes.proto',
-  package='',
-  syntax='proto3',
-  serialized_options=None,
-  serialized_pb=_b('\n4automanpy/core/grpc_classes/automanlib_classes.proto\"\x17\n\tDimension\x12\n\n\x02id\x18\x01 \x01(\t\"\xe6\x03\n\x04Task\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x11\n\timage_url\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0bimg_alt_txt\x18\x04 \x01(\t\x12\x0f\n\x07pattern\x18\x05 \x01(\t\x12\x0e\n\x06\x62udget\x18\x06 \x01(\x01\x12\x12\n\nconfidence\x18\x07 \x01(\x01\x12\x13\n\x0bsample_size\x18\x08 \x01(\x05\x12\x1e\n\x07options\x18\t \x01(\x0b\x32\r.OptionsTuple\x12\x1e\n\ndimensions\x18\n \x03(\x0b\x32\n.Dimension\x12\x13\n\x0b\x64ont_reject\x18\x0b \x01(\x08\x12\x1a\n\x12pay_all_on_failure\x18\x0c \x01(\x08\x12\x0f\n\x07\x64ry_run\x18\r \x01(\x08\x12\x1b\n\x13\x61llow_empty_pattern\x18\x0e \x01(\x08\x12\x1a\n\x12pattern_error_text\x18\x10 \x01(\t\x12#\n\x1bquestion_timeout_multiplier\x18\x11 \x01(\x05\x12#\n\x1binitial_worker_timeout_in_s\x18\x12 \x01(\x05\x12\x0c\n\x04wage\x18\x13 \x01(\x01\x12\x11\n\tmax_value\x18\x14 \x01(\x01\x12\x11\n\tmin_value\x18\x15 \x01(\x01\x12\x16\n\x0e\x63onfidence_int\x18\x16 \x01(\x01\"\x15\n\x13UnconstrainedConInt\"\x1e\n\x0fSymmetricConInt\x12\x0b\n\x03\x65rr\x18\x01 \x01(\x01\"5\n\x10\x41symmetricConInt\x12\x0f\n\x07low_err\x18\x01 \x01(\x01\x12\x10\n\x08high_err\x18\x02 \x01(\x01\"(\n\x0b\x44oubleTuple\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\"\x1b\n\x0bSingleTuple\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xad\x02\n\x0cOptionsTuple\x12)\n\x06single\x18\x01 \x03(\x0b\x32\x19.OptionsTuple.SingleEntry\x12)\n\x06\x64ouble\x18\x02 \x03(\x0b\x32\x19.OptionsTuple.DoubleEntry\x12*\n\ntuple_type\x18\x03 \x01(\x0e\x32\x16.OptionsTuple.tup_type\x1a-\n\x0bSingleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a;\n\x0b\x44oubleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1b\n\x05value\x18\x02 \x01(\x0b\x32\x0c.DoubleTuple:\x02\x38\x01\"/\n\x08tup_type\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06SINGLE\x10\x01\x12\n\n\x06\x44OUBLE\x10\x02\"R\n\x0cValueOutcome\x12\x0b\n\x03\x65st\x18\x01 \x01(\x01\x12\x0b\n\x03low\x18\x02 \x01(\x01\x12\x0c\n\x04high\x18\x03 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x04 \x01(\x01\x12\x0c\n\x04\x63onf\x18\x05 \x01(\x01\";\n\rStringOutcome\x12\x0e\n\x06option\x18\x01 \x01(\t\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x01\x12\x0c\n\x04\x63onf\x18\x03 \x01(\x01\"\xbc\x02\n\x12\x41\x64\x61pterCredentials\x12\x33\n\nadptr_type\x18\x01 \x01(\x0e\x32\x1f.AdapterCredentials.AdapterType\x12\x11\n\taccess_id\x18\x02 \x01(\t\x12\x12\n\naccess_key\x18\x03 \x01(\t\x12@\n\x0f\x61\x64\x61pter_options\x18\x04 \x03(\x0b\x32\'.AdapterCredentials.AdapterOptionsEntry\x12\x11\n\tlog_level\x18\x05 \x01(\x05\x12\x0f\n\x07logging\x18\x06 \x01(\x05\x1a\x35\n\x13\x41\x64\x61pterOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"-\n\x0b\x41\x64\x61pterType\x12\x13\n\x0fUNKNOWN_ADAPTER\x10\x00\x12\t\n\x05MTURK\x10\x01\"#\n\x0c\x45stimateTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"(\n\x11MultiestimateTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"#\n\x0c\x46reetextTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"\'\n\x10\x46reetextDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\" \n\tRadioTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"$\n\rRadioDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"#\n\x0c\x43heckboxTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"\'\n\x10\x43heckboxDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"p\n\x0f\x45stimateOutcome\x12\x1d\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\r.ValueOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x14MultiestimateOutcome\x12\x1d\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\r.ValueOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"q\n\x0f\x46reetextOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x13\x46reetextDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"q\n\x0f\x43heckboxOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x13\x43heckboxDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"n\n\x0cRadioOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"r\n\x10RadioDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01*U\n\x0bOutcomeType\x12\x13\n\x0fUNKNOWN_OUTCOME\x10\x00\x12\r\n\tCONFIDENT\x10\x01\x12\x12\n\x0eLOW_CONFIDENCE\x10\x02\x12\x0e\n\nOVERBUDGET\x10\x03\x62\x06proto3')
-)
-
-_OUTCOMETYPE = _descriptor.EnumDescriptor(
-  name='OutcomeType',
-  full_name='OutcomeType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN_OUTCOME', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='CONFIDENT', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='LOW_CONFIDENCE', index=2, number=2,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='OVERBUDGET', index=3, number=3,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=2755,
-  serialized_end=2840,
-)
-_sym_db.RegisterEnumDescriptor(_OUTCOMETYPE)
-
-OutcomeType = enum_type_wrapper.EnumTypeWrapper(_OUTCOMETYPE)
-UNKNOWN_OUTCOME = 0
-CONFIDENT = 1
-LOW_CONFIDENCE = 2
-OVERBUDGET = 3
-
-
-_OPTIONSTUPLE_TUP_TYPE = _descriptor.EnumDescriptor(
-  name='tup_type',
-  full_name='OptionsTuple.tup_type',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='SINGLE', index=1, number=1,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='DOUBLE', index=2, number=2,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1006,
-  serialized_end=1053,
-)
-_sym_db.RegisterEnumDescriptor(_OPTIONSTUPLE_TUP_TYPE)
-
-_ADAPTERCREDENTIALS_ADAPTERTYPE = _descriptor.EnumDescriptor(
-  name='AdapterType',
-  full_name='AdapterCredentials.AdapterType',
-  filename=None,
-  file=DESCRIPTOR,
-  values=[
-    _descriptor.EnumValueDescriptor(
-      name='UNKNOWN_ADAPTER', index=0, number=0,
-      serialized_options=None,
-      type=None),
-    _descriptor.EnumValueDescriptor(
-      name='MTURK', index=1, number=1,
-      serialized_options=None,
-      type=None),
-  ],
-  containing_type=None,
-  serialized_options=None,
-  serialized_start=1472,
-  serialized_end=1517,
-)
-_sym_db.RegisterEnumDescriptor(_ADAPTERCREDENTIALS_ADAPTERTYPE)
-
-
-_DIMENSION = _descriptor.Descriptor(
-  name='Dimension',
-  full_name='Dimension',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='id', full_name='Dimension.id', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=56,
-  serialized_end=79,
-)
-
-
-_TASK = _descriptor.Descriptor(
-  name='Task',
-  full_name='Task',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='text', full_name='Task.text', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='image_url', full_name='Task.image_url', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='title', full_name='Task.title', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='img_alt_txt', full_name='Task.img_alt_txt', index=3,
-      number=4, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='pattern', full_name='Task.pattern', index=4,
-      number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='budget', full_name='Task.budget', index=5,
-      number=6, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='confidence', full_name='Task.confidence', index=6,
-      number=7, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='sample_size', full_name='Task.sample_size', index=7,
-      number=8, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='options', full_name='Task.options', index=8,
-      number=9, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dimensions', full_name='Task.dimensions', index=9,
-      number=10, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dont_reject', full_name='Task.dont_reject', index=10,
-      number=11, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='pay_all_on_failure', full_name='Task.pay_all_on_failure', index=11,
-      number=12, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='dry_run', full_name='Task.dry_run', index=12,
-      number=13, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='allow_empty_pattern', full_name='Task.allow_empty_pattern', index=13,
-      number=14, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='pattern_error_text', full_name='Task.pattern_error_text', index=14,
-      number=16, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='question_timeout_multiplier', full_name='Task.question_timeout_multiplier', index=15,
-      number=17, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='initial_worker_timeout_in_s', full_name='Task.initial_worker_timeout_in_s', index=16,
-      number=18, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='wage', full_name='Task.wage', index=17,
-      number=19, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='max_value', full_name='Task.max_value', index=18,
-      number=20, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='min_value', full_name='Task.min_value', index=19,
-      number=21, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='confidence_int', full_name='Task.confidence_int', index=20,
-      number=22, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=82,
-  serialized_end=568,
-)
-
-
-_UNCONSTRAINEDCONINT = _descriptor.Descriptor(
-  name='UnconstrainedConInt',
-  full_name='UnconstrainedConInt',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=570,
-  serialized_end=591,
-)
-
-
-_SYMMETRICCONINT = _descriptor.Descriptor(
-  name='SymmetricConInt',
-  full_name='SymmetricConInt',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='err', full_name='SymmetricConInt.err', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=593,
-  serialized_end=623,
-)
-
-
-_ASYMMETRICCONINT = _descriptor.Descriptor(
-  name='AsymmetricConInt',
-  full_name='AsymmetricConInt',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='low_err', full_name='AsymmetricConInt.low_err', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='high_err', full_name='AsymmetricConInt.high_err', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=625,
-  serialized_end=678,
-)
-
-
-_DOUBLETUPLE = _descriptor.Descriptor(
-  name='DoubleTuple',
-  full_name='DoubleTuple',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='DoubleTuple.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='url', full_name='DoubleTuple.url', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=680,
-  serialized_end=720,
-)
-
-
-_SINGLETUPLE = _descriptor.Descriptor(
-  name='SingleTuple',
-  full_name='SingleTuple',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='name', full_name='SingleTuple.name', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=722,
-  serialized_end=749,
-)
-
-
-_OPTIONSTUPLE_SINGLEENTRY = _descriptor.Descriptor(
-  name='SingleEntry',
-  full_name='OptionsTuple.SingleEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='OptionsTuple.SingleEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='OptionsTuple.SingleEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=898,
-  serialized_end=943,
-)
-
-_OPTIONSTUPLE_DOUBLEENTRY = _descriptor.Descriptor(
-  name='DoubleEntry',
-  full_name='OptionsTuple.DoubleEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='OptionsTuple.DoubleEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='OptionsTuple.DoubleEntry.value', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=945,
-  serialized_end=1004,
-)
-
-_OPTIONSTUPLE = _descriptor.Descriptor(
-  name='OptionsTuple',
-  full_name='OptionsTuple',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='single', full_name='OptionsTuple.single', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='double', full_name='OptionsTuple.double', index=1,
-      number=2, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='tuple_type', full_name='OptionsTuple.tuple_type', index=2,
-      number=3, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_OPTIONSTUPLE_SINGLEENTRY, _OPTIONSTUPLE_DOUBLEENTRY, ],
-  enum_types=[
-    _OPTIONSTUPLE_TUP_TYPE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=752,
-  serialized_end=1053,
-)
-
-
-_VALUEOUTCOME = _descriptor.Descriptor(
-  name='ValueOutcome',
-  full_name='ValueOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='est', full_name='ValueOutcome.est', index=0,
-      number=1, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='low', full_name='ValueOutcome.low', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='high', full_name='ValueOutcome.high', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='cost', full_name='ValueOutcome.cost', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='conf', full_name='ValueOutcome.conf', index=4,
-      number=5, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1055,
-  serialized_end=1137,
-)
-
-
-_STRINGOUTCOME = _descriptor.Descriptor(
-  name='StringOutcome',
-  full_name='StringOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='option', full_name='StringOutcome.option', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='cost', full_name='StringOutcome.cost', index=1,
-      number=2, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='conf', full_name='StringOutcome.conf', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1139,
-  serialized_end=1198,
-)
-
-
-_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY = _descriptor.Descriptor(
-  name='AdapterOptionsEntry',
-  full_name='AdapterCredentials.AdapterOptionsEntry',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='key', full_name='AdapterCredentials.AdapterOptionsEntry.key', index=0,
-      number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='value', full_name='AdapterCredentials.AdapterOptionsEntry.value', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=_b('8\001'),
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1417,
-  serialized_end=1470,
-)
-
-_ADAPTERCREDENTIALS = _descriptor.Descriptor(
-  name='AdapterCredentials',
-  full_name='AdapterCredentials',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='adptr_type', full_name='AdapterCredentials.adptr_type', index=0,
-      number=1, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='access_id', full_name='AdapterCredentials.access_id', index=1,
-      number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='access_key', full_name='AdapterCredentials.access_key', index=2,
-      number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='adapter_options', full_name='AdapterCredentials.adapter_options', index=3,
-      number=4, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='log_level', full_name='AdapterCredentials.log_level', index=4,
-      number=5, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='logging', full_name='AdapterCredentials.logging', index=5,
-      number=6, type=5, cpp_type=1, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY, ],
-  enum_types=[
-    _ADAPTERCREDENTIALS_ADAPTERTYPE,
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1201,
-  serialized_end=1517,
-)
-
-
-_ESTIMATETASK = _descriptor.Descriptor(
-  name='EstimateTask',
-  full_name='EstimateTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='EstimateTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1519,
-  serialized_end=1554,
-)
-
-
-_MULTIESTIMATETASK = _descriptor.Descriptor(
-  name='MultiestimateTask',
-  full_name='MultiestimateTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='MultiestimateTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1556,
-  serialized_end=1596,
-)
-
-
-_FREETEXTTASK = _descriptor.Descriptor(
-  name='FreetextTask',
-  full_name='FreetextTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='FreetextTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1598,
-  serialized_end=1633,
-)
-
-
-_FREETEXTDISTTASK = _descriptor.Descriptor(
-  name='FreetextDistTask',
-  full_name='FreetextDistTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='FreetextDistTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1635,
-  serialized_end=1674,
-)
-
-
-_RADIOTASK = _descriptor.Descriptor(
-  name='RadioTask',
-  full_name='RadioTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='RadioTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1676,
-  serialized_end=1708,
-)
-
-
-_RADIODISTTASK = _descriptor.Descriptor(
-  name='RadioDistTask',
-  full_name='RadioDistTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='RadioDistTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1710,
-  serialized_end=1746,
-)
-
-
-_CHECKBOXTASK = _descriptor.Descriptor(
-  name='CheckboxTask',
-  full_name='CheckboxTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='CheckboxTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1748,
-  serialized_end=1783,
-)
-
-
-_CHECKBOXDISTTASK = _descriptor.Descriptor(
-  name='CheckboxDistTask',
-  full_name='CheckboxDistTask',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='task', full_name='CheckboxDistTask.task', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1785,
-  serialized_end=1824,
-)
-
-
-_ESTIMATEOUTCOME = _descriptor.Descriptor(
-  name='EstimateOutcome',
-  full_name='EstimateOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='EstimateOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='EstimateOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='EstimateOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='EstimateOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1826,
-  serialized_end=1938,
-)
-
-
-_MULTIESTIMATEOUTCOME = _descriptor.Descriptor(
-  name='MultiestimateOutcome',
-  full_name='MultiestimateOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='MultiestimateOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='MultiestimateOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='MultiestimateOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='MultiestimateOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=1940,
-  serialized_end=2057,
-)
-
-
-_FREETEXTOUTCOME = _descriptor.Descriptor(
-  name='FreetextOutcome',
-  full_name='FreetextOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='FreetextOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='FreetextOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='FreetextOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='FreetextOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2059,
-  serialized_end=2172,
-)
-
-
-_FREETEXTDISTOUTCOME = _descriptor.Descriptor(
-  name='FreetextDistOutcome',
-  full_name='FreetextDistOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='FreetextDistOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='FreetextDistOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='FreetextDistOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='FreetextDistOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2174,
-  serialized_end=2291,
-)
-
-
-_CHECKBOXOUTCOME = _descriptor.Descriptor(
-  name='CheckboxOutcome',
-  full_name='CheckboxOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='CheckboxOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='CheckboxOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='CheckboxOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='CheckboxOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2293,
-  serialized_end=2406,
-)
-
-
-_CHECKBOXDISTOUTCOME = _descriptor.Descriptor(
-  name='CheckboxDistOutcome',
-  full_name='CheckboxDistOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='CheckboxDistOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=3,
-      has_default_value=False, default_value=[],
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='CheckboxDistOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='CheckboxDistOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='CheckboxDistOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2408,
-  serialized_end=2525,
-)
-
-
-_RADIOOUTCOME = _descriptor.Descriptor(
-  name='RadioOutcome',
-  full_name='RadioOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='RadioOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='RadioOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='RadioOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='RadioOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2527,
-  serialized_end=2637,
-)
-
-
-_RADIODISTOUTCOME = _descriptor.Descriptor(
-  name='RadioDistOutcome',
-  full_name='RadioDistOutcome',
-  filename=None,
-  file=DESCRIPTOR,
-  containing_type=None,
-  fields=[
-    _descriptor.FieldDescriptor(
-      name='answer', full_name='RadioDistOutcome.answer', index=0,
-      number=1, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='outcome_type', full_name='RadioDistOutcome.outcome_type', index=1,
-      number=2, type=14, cpp_type=8, label=1,
-      has_default_value=False, default_value=0,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='need', full_name='RadioDistOutcome.need', index=2,
-      number=3, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-    _descriptor.FieldDescriptor(
-      name='have', full_name='RadioDistOutcome.have', index=3,
-      number=4, type=1, cpp_type=5, label=1,
-      has_default_value=False, default_value=float(0),
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      serialized_options=None, file=DESCRIPTOR),
-  ],
-  extensions=[
-  ],
-  nested_types=[],
-  enum_types=[
-  ],
-  serialized_options=None,
-  is_extendable=False,
-  syntax='proto3',
-  extension_ranges=[],
-  oneofs=[
-  ],
-  serialized_start=2639,
-  serialized_end=2753,
-)
-
-_TASK.fields_by_name['options'].message_type = _OPTIONSTUPLE
-_TASK.fields_by_name['dimensions'].message_type = _DIMENSION
-_OPTIONSTUPLE_SINGLEENTRY.containing_type = _OPTIONSTUPLE
-_OPTIONSTUPLE_DOUBLEENTRY.fields_by_name['value'].message_type = _DOUBLETUPLE
-_OPTIONSTUPLE_DOUBLEENTRY.containing_type = _OPTIONSTUPLE
-_OPTIONSTUPLE.fields_by_name['single'].message_type = _OPTIONSTUPLE_SINGLEENTRY
-_OPTIONSTUPLE.fields_by_name['double'].message_type = _OPTIONSTUPLE_DOUBLEENTRY
-_OPTIONSTUPLE.fields_by_name['tuple_type'].enum_type = _OPTIONSTUPLE_TUP_TYPE
-_OPTIONSTUPLE_TUP_TYPE.containing_type = _OPTIONSTUPLE
-_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY.containing_type = _ADAPTERCREDENTIALS
-_ADAPTERCREDENTIALS.fields_by_name['adptr_type'].enum_type = _ADAPTERCREDENTIALS_ADAPTERTYPE
-_ADAPTERCREDENTIALS.fields_by_name['adapter_options'].message_type = _ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY
-_ADAPTERCREDENTIALS_ADAPTERTYPE.containing_type = _ADAPTERCREDENTIALS
-_ESTIMATETASK.fields_by_name['task'].message_type = _TASK
-_MULTIESTIMATETASK.fields_by_name['task'].message_type = _TASK
-_FREETEXTTASK.fields_by_name['task'].message_type = _TASK
-_FREETEXTDISTTASK.fields_by_name['task'].message_type = _TASK
-_RADIOTASK.fields_by_name['task'].message_type = _TASK
-_RADIODISTTASK.fields_by_name['task'].message_type = _TASK
-_CHECKBOXTASK.fields_by_name['task'].message_type = _TASK
-_CHECKBOXDISTTASK.fields_by_name['task'].message_type = _TASK
-_ESTIMATEOUTCOME.fields_by_name['answer'].message_type = _VALUEOUTCOME
-_ESTIMATEOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_MULTIESTIMATEOUTCOME.fields_by_name['answer'].message_type = _VALUEOUTCOME
-_MULTIESTIMATEOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_FREETEXTOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_FREETEXTOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_FREETEXTDISTOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_FREETEXTDISTOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_CHECKBOXOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_CHECKBOXOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_CHECKBOXDISTOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_CHECKBOXDISTOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_RADIOOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_RADIOOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-_RADIODISTOUTCOME.fields_by_name['answer'].message_type = _STRINGOUTCOME
-_RADIODISTOUTCOME.fields_by_name['outcome_type'].enum_type = _OUTCOMETYPE
-DESCRIPTOR.message_types_by_name['Dimension'] = _DIMENSION
-DESCRIPTOR.message_types_by_name['Task'] = _TASK
-DESCRIPTOR.message_types_by_name['UnconstrainedConInt'] = _UNCONSTRAINEDCONINT
-DESCRIPTOR.message_types_by_name['SymmetricConInt'] = _SYMMETRICCONINT
-DESCRIPTOR.message_types_by_name['AsymmetricConInt'] = _ASYMMETRICCONINT
-DESCRIPTOR.message_types_by_name['DoubleTuple'] = _DOUBLETUPLE
-DESCRIPTOR.message_types_by_name['SingleTuple'] = _SINGLETUPLE
-DESCRIPTOR.message_types_by_name['OptionsTuple'] = _OPTIONSTUPLE
-DESCRIPTOR.message_types_by_name['ValueOutcome'] = _VALUEOUTCOME
-DESCRIPTOR.message_types_by_name['StringOutcome'] = _STRINGOUTCOME
-DESCRIPTOR.message_types_by_name['AdapterCredentials'] = _ADAPTERCREDENTIALS
-DESCRIPTOR.message_types_by_name['EstimateTask'] = _ESTIMATETASK
-DESCRIPTOR.message_types_by_name['MultiestimateTask'] = _MULTIESTIMATETASK
-DESCRIPTOR.message_types_by_name['FreetextTask'] = _FREETEXTTASK
-DESCRIPTOR.message_types_by_name['FreetextDistTask'] = _FREETEXTDISTTASK
-DESCRIPTOR.message_types_by_name['RadioTask'] = _RADIOTASK
-DESCRIPTOR.message_types_by_name['RadioDistTask'] = _RADIODISTTASK
-DESCRIPTOR.message_types_by_name['CheckboxTask'] = _CHECKBOXTASK
-DESCRIPTOR.message_types_by_name['CheckboxDistTask'] = _CHECKBOXDISTTASK
-DESCRIPTOR.message_types_by_name['EstimateOutcome'] = _ESTIMATEOUTCOME
-DESCRIPTOR.message_types_by_name['MultiestimateOutcome'] = _MULTIESTIMATEOUTCOME
-DESCRIPTOR.message_types_by_name['FreetextOutcome'] = _FREETEXTOUTCOME
-DESCRIPTOR.message_types_by_name['FreetextDistOutcome'] = _FREETEXTDISTOUTCOME
-DESCRIPTOR.message_types_by_name['CheckboxOutcome'] = _CHECKBOXOUTCOME
-DESCRIPTOR.message_types_by_name['CheckboxDistOutcome'] = _CHECKBOXDISTOUTCOME
-DESCRIPTOR.message_types_by_name['RadioOutcome'] = _RADIOOUTCOME
-DESCRIPTOR.message_types_by_name['RadioDistOutcome'] = _RADIODISTOUTCOME
-DESCRIPTOR.enum_types_by_name['OutcomeType'] = _OUTCOMETYPE
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
-
-Dimension = _reflection.GeneratedProtocolMessageType('Dimension', (_message.Message,), dict(
-  DESCRIPTOR = _DIMENSION,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:Dimension)
-  ))
-_sym_db.RegisterMessage(Dimension)
-
-Task = _reflection.GeneratedProtocolMessageType('Task', (_message.Message,), dict(
-  DESCRIPTOR = _TASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:Task)
-  ))
-_sym_db.RegisterMessage(Task)
-
-UnconstrainedConInt = _reflection.GeneratedProtocolMessageType('UnconstrainedConInt', (_message.Message,), dict(
-  DESCRIPTOR = _UNCONSTRAINEDCONINT,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:UnconstrainedConInt)
-  ))
-_sym_db.RegisterMessage(UnconstrainedConInt)
-
-SymmetricConInt = _reflection.GeneratedProtocolMessageType('SymmetricConInt', (_message.Message,), dict(
-  DESCRIPTOR = _SYMMETRICCONINT,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:SymmetricConInt)
-  ))
-_sym_db.RegisterMessage(SymmetricConInt)
-
-AsymmetricConInt = _reflection.GeneratedProtocolMessageType('AsymmetricConInt', (_message.Message,), dict(
-  DESCRIPTOR = _ASYMMETRICCONINT,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:AsymmetricConInt)
-  ))
-_sym_db.RegisterMessage(AsymmetricConInt)
-
-DoubleTuple = _reflection.GeneratedProtocolMessageType('DoubleTuple', (_message.Message,), dict(
-  DESCRIPTOR = _DOUBLETUPLE,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:DoubleTuple)
-  ))
-_sym_db.RegisterMessage(DoubleTuple)
-
-SingleTuple = _reflection.GeneratedProtocolMessageType('SingleTuple', (_message.Message,), dict(
-  DESCRIPTOR = _SINGLETUPLE,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:SingleTuple)
-  ))
-_sym_db.RegisterMessage(SingleTuple)
-
-OptionsTuple = _reflection.GeneratedProtocolMessageType('OptionsTuple', (_message.Message,), dict(
-
-  SingleEntry = _reflection.GeneratedProtocolMessageType('SingleEntry', (_message.Message,), dict(
-    DESCRIPTOR = _OPTIONSTUPLE_SINGLEENTRY,
-    __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-    # @@protoc_insertion_point(class_scope:OptionsTuple.SingleEntry)
-    ))
-  ,
-
-  DoubleEntry = _reflection.GeneratedProtocolMessageType('DoubleEntry', (_message.Message,), dict(
-    DESCRIPTOR = _OPTIONSTUPLE_DOUBLEENTRY,
-    __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-    # @@protoc_insertion_point(class_scope:OptionsTuple.DoubleEntry)
-    ))
-  ,
-  DESCRIPTOR = _OPTIONSTUPLE,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:OptionsTuple)
-  ))
-_sym_db.RegisterMessage(OptionsTuple)
-_sym_db.RegisterMessage(OptionsTuple.SingleEntry)
-_sym_db.RegisterMessage(OptionsTuple.DoubleEntry)
-
-ValueOutcome = _reflection.GeneratedProtocolMessageType('ValueOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _VALUEOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:ValueOutcome)
-  ))
-_sym_db.RegisterMessage(ValueOutcome)
-
-StringOutcome = _reflection.GeneratedProtocolMessageType('StringOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _STRINGOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:StringOutcome)
-  ))
-_sym_db.RegisterMessage(StringOutcome)
-
-AdapterCredentials = _reflection.GeneratedProtocolMessageType('AdapterCredentials', (_message.Message,), dict(
-
-  AdapterOptionsEntry = _reflection.GeneratedProtocolMessageType('AdapterOptionsEntry', (_message.Message,), dict(
-    DESCRIPTOR = _ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY,
-    __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-    # @@protoc_insertion_point(class_scope:AdapterCredentials.AdapterOptionsEntry)
-    ))
-  ,
-  DESCRIPTOR = _ADAPTERCREDENTIALS,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:AdapterCredentials)
-  ))
-_sym_db.RegisterMessage(AdapterCredentials)
-_sym_db.RegisterMessage(AdapterCredentials.AdapterOptionsEntry)
-
-EstimateTask = _reflection.GeneratedProtocolMessageType('EstimateTask', (_message.Message,), dict(
-  DESCRIPTOR = _ESTIMATETASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:EstimateTask)
-  ))
-_sym_db.RegisterMessage(EstimateTask)
-
-MultiestimateTask = _reflection.GeneratedProtocolMessageType('MultiestimateTask', (_message.Message,), dict(
-  DESCRIPTOR = _MULTIESTIMATETASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:MultiestimateTask)
-  ))
-_sym_db.RegisterMessage(MultiestimateTask)
-
-FreetextTask = _reflection.GeneratedProtocolMessageType('FreetextTask', (_message.Message,), dict(
-  DESCRIPTOR = _FREETEXTTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:FreetextTask)
-  ))
-_sym_db.RegisterMessage(FreetextTask)
-
-FreetextDistTask = _reflection.GeneratedProtocolMessageType('FreetextDistTask', (_message.Message,), dict(
-  DESCRIPTOR = _FREETEXTDISTTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:FreetextDistTask)
-  ))
-_sym_db.RegisterMessage(FreetextDistTask)
-
-RadioTask = _reflection.GeneratedProtocolMessageType('RadioTask', (_message.Message,), dict(
-  DESCRIPTOR = _RADIOTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:RadioTask)
-  ))
-_sym_db.RegisterMessage(RadioTask)
-
-RadioDistTask = _reflection.GeneratedProtocolMessageType('RadioDistTask', (_message.Message,), dict(
-  DESCRIPTOR = _RADIODISTTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:RadioDistTask)
-  ))
-_sym_db.RegisterMessage(RadioDistTask)
-
-CheckboxTask = _reflection.GeneratedProtocolMessageType('CheckboxTask', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKBOXTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:CheckboxTask)
-  ))
-_sym_db.RegisterMessage(CheckboxTask)
-
-CheckboxDistTask = _reflection.GeneratedProtocolMessageType('CheckboxDistTask', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKBOXDISTTASK,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:CheckboxDistTask)
-  ))
-_sym_db.RegisterMessage(CheckboxDistTask)
-
-EstimateOutcome = _reflection.GeneratedProtocolMessageType('EstimateOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _ESTIMATEOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:EstimateOutcome)
-  ))
-_sym_db.RegisterMessage(EstimateOutcome)
-
-MultiestimateOutcome = _reflection.GeneratedProtocolMessageType('MultiestimateOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _MULTIESTIMATEOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:MultiestimateOutcome)
-  ))
-_sym_db.RegisterMessage(MultiestimateOutcome)
-
-FreetextOutcome = _reflection.GeneratedProtocolMessageType('FreetextOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _FREETEXTOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:FreetextOutcome)
-  ))
-_sym_db.RegisterMessage(FreetextOutcome)
-
-FreetextDistOutcome = _reflection.GeneratedProtocolMessageType('FreetextDistOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _FREETEXTDISTOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:FreetextDistOutcome)
-  ))
-_sym_db.RegisterMessage(FreetextDistOutcome)
-
-CheckboxOutcome = _reflection.GeneratedProtocolMessageType('CheckboxOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKBOXOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:CheckboxOutcome)
-  ))
-_sym_db.RegisterMessage(CheckboxOutcome)
-
-CheckboxDistOutcome = _reflection.GeneratedProtocolMessageType('CheckboxDistOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _CHECKBOXDISTOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:CheckboxDistOutcome)
-  ))
-_sym_db.RegisterMessage(CheckboxDistOutcome)
-
-RadioOutcome = _reflection.GeneratedProtocolMessageType('RadioOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _RADIOOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:RadioOutcome)
-  ))
-_sym_db.RegisterMessage(RadioOutcome)
-
-RadioDistOutcome = _reflection.GeneratedProtocolMessageType('RadioDistOutcome', (_message.Message,), dict(
-  DESCRIPTOR = _RADIODISTOUTCOME,
-  __module__ = 'automanpy.core.grpc_classes.automanlib_classes_pb2'
-  # @@protoc_insertion_point(class_scope:RadioDistOutcome)
-  ))
-_sym_db.RegisterMessage(RadioDistOutcome)
-
-
-_OPTIONSTUPLE_SINGLEENTRY._options = None
-_OPTIONSTUPLE_DOUBLEENTRY._options = None
-_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY._options = None
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n4automanpy/core/grpc_classes/automanlib_classes.proto\"\x17\n\tDimension\x12\n\n\x02id\x18\x01 \x01(\t\"\xfc\x03\n\x04Task\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x11\n\timage_url\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0bimg_alt_txt\x18\x04 \x01(\t\x12\x0f\n\x07pattern\x18\x05 \x01(\t\x12\x0e\n\x06\x62udget\x18\x06 \x01(\x01\x12\x12\n\nconfidence\x18\x07 \x01(\x01\x12\x13\n\x0bsample_size\x18\x08 \x01(\x05\x12\x1e\n\x07options\x18\t \x01(\x0b\x32\r.OptionsTuple\x12\x1e\n\ndimensions\x18\n \x03(\x0b\x32\n.Dimension\x12\x13\n\x0b\x64ont_reject\x18\x0b \x01(\x08\x12\x1a\n\x12pay_all_on_failure\x18\x0c \x01(\x08\x12\x0f\n\x07\x64ry_run\x18\r \x01(\x08\x12\x1b\n\x13\x61llow_empty_pattern\x18\x0e \x01(\x08\x12\x1a\n\x12pattern_error_text\x18\x10 \x01(\t\x12#\n\x1bquestion_timeout_multiplier\x18\x11 \x01(\x05\x12#\n\x1binitial_worker_timeout_in_s\x18\x12 \x01(\x05\x12\x0c\n\x04wage\x18\x13 \x01(\x01\x12\x11\n\tmax_value\x18\x14 \x01(\x01\x12\x11\n\tmin_value\x18\x15 \x01(\x01\x12\x16\n\x0e\x63onfidence_int\x18\x16 \x01(\x01\x12\x14\n\x0cmock_answers\x18\x17 \x03(\t\"\x15\n\x13UnconstrainedConInt\"\x1e\n\x0fSymmetricConInt\x12\x0b\n\x03\x65rr\x18\x01 \x01(\x01\"5\n\x10\x41symmetricConInt\x12\x0f\n\x07low_err\x18\x01 \x01(\x01\x12\x10\n\x08high_err\x18\x02 \x01(\x01\"(\n\x0b\x44oubleTuple\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0b\n\x03url\x18\x02 \x01(\t\"\x1b\n\x0bSingleTuple\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xad\x02\n\x0cOptionsTuple\x12)\n\x06single\x18\x01 \x03(\x0b\x32\x19.OptionsTuple.SingleEntry\x12)\n\x06\x64ouble\x18\x02 \x03(\x0b\x32\x19.OptionsTuple.DoubleEntry\x12*\n\ntuple_type\x18\x03 \x01(\x0e\x32\x16.OptionsTuple.tup_type\x1a-\n\x0bSingleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a;\n\x0b\x44oubleEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x1b\n\x05value\x18\x02 \x01(\x0b\x32\x0c.DoubleTuple:\x02\x38\x01\"/\n\x08tup_type\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06SINGLE\x10\x01\x12\n\n\x06\x44OUBLE\x10\x02\"R\n\x0cValueOutcome\x12\x0b\n\x03\x65st\x18\x01 \x01(\x01\x12\x0b\n\x03low\x18\x02 \x01(\x01\x12\x0c\n\x04high\x18\x03 \x01(\x01\x12\x0c\n\x04\x63ost\x18\x04 \x01(\x01\x12\x0c\n\x04\x63onf\x18\x05 \x01(\x01\";\n\rStringOutcome\x12\x0e\n\x06option\x18\x01 \x01(\t\x12\x0c\n\x04\x63ost\x18\x02 \x01(\x01\x12\x0c\n\x04\x63onf\x18\x03 \x01(\x01\"\xc6\x02\n\x12\x41\x64\x61pterCredentials\x12\x33\n\nadptr_type\x18\x01 \x01(\x0e\x32\x1f.AdapterCredentials.AdapterType\x12\x11\n\taccess_id\x18\x02 \x01(\t\x12\x12\n\naccess_key\x18\x03 \x01(\t\x12@\n\x0f\x61\x64\x61pter_options\x18\x04 \x03(\x0b\x32\'.AdapterCredentials.AdapterOptionsEntry\x12\x11\n\tlog_level\x18\x05 \x01(\x05\x12\x0f\n\x07logging\x18\x06 \x01(\x05\x1a\x35\n\x13\x41\x64\x61pterOptionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"7\n\x0b\x41\x64\x61pterType\x12\x13\n\x0fUNKNOWN_ADAPTER\x10\x00\x12\t\n\x05MTURK\x10\x01\x12\x08\n\x04MOCK\x10\x02\"#\n\x0c\x45stimateTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"(\n\x11MultiestimateTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"#\n\x0c\x46reetextTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"\'\n\x10\x46reetextDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\" \n\tRadioTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"$\n\rRadioDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"#\n\x0c\x43heckboxTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"\'\n\x10\x43heckboxDistTask\x12\x13\n\x04task\x18\x01 \x01(\x0b\x32\x05.Task\"p\n\x0f\x45stimateOutcome\x12\x1d\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\r.ValueOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x14MultiestimateOutcome\x12\x1d\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\r.ValueOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"q\n\x0f\x46reetextOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x13\x46reetextDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"q\n\x0f\x43heckboxOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"u\n\x13\x43heckboxDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x03(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"n\n\x0cRadioOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01\"r\n\x10RadioDistOutcome\x12\x1e\n\x06\x61nswer\x18\x01 \x01(\x0b\x32\x0e.StringOutcome\x12\"\n\x0coutcome_type\x18\x02 \x01(\x0e\x32\x0c.OutcomeType\x12\x0c\n\x04need\x18\x03 \x01(\x01\x12\x0c\n\x04have\x18\x04 \x01(\x01*U\n\x0bOutcomeType\x12\x13\n\x0fUNKNOWN_OUTCOME\x10\x00\x12\r\n\tCONFIDENT\x10\x01\x12\x12\n\x0eLOW_CONFIDENCE\x10\x02\x12\x0e\n\nOVERBUDGET\x10\x03\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'automanpy.core.grpc_classes.automanlib_classes_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _OPTIONSTUPLE_SINGLEENTRY._options = None
+  _OPTIONSTUPLE_SINGLEENTRY._serialized_options = b'8\001'
+  _OPTIONSTUPLE_DOUBLEENTRY._options = None
+  _OPTIONSTUPLE_DOUBLEENTRY._serialized_options = b'8\001'
+  _ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY._options = None
+  _ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY._serialized_options = b'8\001'
+  _globals['_OUTCOMETYPE']._serialized_start=2787
+  _globals['_OUTCOMETYPE']._serialized_end=2872
+  _globals['_DIMENSION']._serialized_start=56
+  _globals['_DIMENSION']._serialized_end=79
+  _globals['_TASK']._serialized_start=82
+  _globals['_TASK']._serialized_end=590
+  _globals['_UNCONSTRAINEDCONINT']._serialized_start=592
+  _globals['_UNCONSTRAINEDCONINT']._serialized_end=613
+  _globals['_SYMMETRICCONINT']._serialized_start=615
+  _globals['_SYMMETRICCONINT']._serialized_end=645
+  _globals['_ASYMMETRICCONINT']._serialized_start=647
+  _globals['_ASYMMETRICCONINT']._serialized_end=700
+  _globals['_DOUBLETUPLE']._serialized_start=702
+  _globals['_DOUBLETUPLE']._serialized_end=742
+  _globals['_SINGLETUPLE']._serialized_start=744
+  _globals['_SINGLETUPLE']._serialized_end=771
+  _globals['_OPTIONSTUPLE']._serialized_start=774
+  _globals['_OPTIONSTUPLE']._serialized_end=1075
+  _globals['_OPTIONSTUPLE_SINGLEENTRY']._serialized_start=920
+  _globals['_OPTIONSTUPLE_SINGLEENTRY']._serialized_end=965
+  _globals['_OPTIONSTUPLE_DOUBLEENTRY']._serialized_start=967
+  _globals['_OPTIONSTUPLE_DOUBLEENTRY']._serialized_end=1026
+  _globals['_OPTIONSTUPLE_TUP_TYPE']._serialized_start=1028
+  _globals['_OPTIONSTUPLE_TUP_TYPE']._serialized_end=1075
+  _globals['_VALUEOUTCOME']._serialized_start=1077
+  _globals['_VALUEOUTCOME']._serialized_end=1159
+  _globals['_STRINGOUTCOME']._serialized_start=1161
+  _globals['_STRINGOUTCOME']._serialized_end=1220
+  _globals['_ADAPTERCREDENTIALS']._serialized_start=1223
+  _globals['_ADAPTERCREDENTIALS']._serialized_end=1549
+  _globals['_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY']._serialized_start=1439
+  _globals['_ADAPTERCREDENTIALS_ADAPTEROPTIONSENTRY']._serialized_end=1492
+  _globals['_ADAPTERCREDENTIALS_ADAPTERTYPE']._serialized_start=1494
+  _globals['_ADAPTERCREDENTIALS_ADAPTERTYPE']._serialized_end=1549
+  _globals['_ESTIMATETASK']._serialized_start=1551
+  _globals['_ESTIMATETASK']._serialized_end=1586
+  _globals['_MULTIESTIMATETASK']._serialized_start=1588
+  _globals['_MULTIESTIMATETASK']._serialized_end=1628
+  _globals['_FREETEXTTASK']._serialized_start=1630
+  _globals['_FREETEXTTASK']._serialized_end=1665
+  _globals['_FREETEXTDISTTASK']._serialized_start=1667
+  _globals['_FREETEXTDISTTASK']._serialized_end=1706
+  _globals['_RADIOTASK']._serialized_start=1708
+  _globals['_RADIOTASK']._serialized_end=1740
+  _globals['_RADIODISTTASK']._serialized_start=1742
+  _globals['_RADIODISTTASK']._serialized_end=1778
+  _globals['_CHECKBOXTASK']._serialized_start=1780
+  _globals['_CHECKBOXTASK']._serialized_end=1815
+  _globals['_CHECKBOXDISTTASK']._serialized_start=1817
+  _globals['_CHECKBOXDISTTASK']._serialized_end=1856
+  _globals['_ESTIMATEOUTCOME']._serialized_start=1858
+  _globals['_ESTIMATEOUTCOME']._serialized_end=1970
+  _globals['_MULTIESTIMATEOUTCOME']._serialized_start=1972
+  _globals['_MULTIESTIMATEOUTCOME']._serialized_end=2089
+  _globals['_FREETEXTOUTCOME']._serialized_start=2091
+  _globals['_FREETEXTOUTCOME']._serialized_end=2204
+  _globals['_FREETEXTDISTOUTCOME']._serialized_start=2206
+  _globals['_FREETEXTDISTOUTCOME']._serialized_end=2323
+  _globals['_CHECKBOXOUTCOME']._serialized_start=2325
+  _globals['_CHECKBOXOUTCOME']._serialized_end=2438
+  _globals['_CHECKBOXDISTOUTCOME']._serialized_start=2440
+  _globals['_CHECKBOXDISTOUTCOME']._serialized_end=2557
+  _globals['_RADIOOUTCOME']._serialized_start=2559
+  _globals['_RADIOOUTCOME']._serialized_end=2669
+  _globals['_RADIODISTOUTCOME']._serialized_start=2671
+  _globals['_RADIODISTOUTCOME']._serialized_end=2785
 # @@protoc_insertion_point(module_scope)
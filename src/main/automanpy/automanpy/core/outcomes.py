@@ -1,3 +1,4 @@
+import asyncio
 from concurrent import futures
 
 from grpc import FutureTimeoutError, FutureCancelledError
@@ -9,16 +10,55 @@ from automanpy.core.grpc_classes.automanlib_classes_pb2 import *
 
 #from automanlib import *
 
+#shared default of the numeric fields of an outcome that are not set
+_NAN = float('nan')
+
+def _wrap_future(future):
+	"""
+	Internal function. Wraps a blocking (gRPC or concurrent.futures) future in an asyncio future on the
+	running event loop, so that it can be awaited without tying up a thread
+
+	Parameters
+	----------
+	future : Future
+		A future that supports add_done_callback, result and exception
+
+	Returns
+	-------
+	asyncio.Future
+		An asyncio future that resolves to the same result as future
+	"""
+	loop = asyncio.get_event_loop()
+	aio_future = loop.create_future()
+
+	def _copy_state(done_future):
+		if aio_future.cancelled():
+			return
+		try:
+			exc = done_future.exception()
+		except Exception as cancelled:
+			exc = cancelled
+		if exc is not None:
+			aio_future.set_exception(exc)
+		else:
+			aio_future.set_result(done_future.result())
+
+	future.add_done_callback(lambda done_future: loop.call_soon_threadsafe(_copy_state, done_future))
+	return aio_future
+
 
 class Outcome():
 	"""
-	The Outcome Class. This class holds the result of an Automan computation
+	The Outcome Class. This class holds the result of an Automan computation. Outcomes are slotted, and an outcome
+	drops its future, and with it the response message, as soon as the future resolves to a valid response, so
+	that a batch of many outcomes costs little more than their fields once it has resolved
 
 	Attributes
 	----------
 	_future_task_resp : TaskResponse
 		A private variable, stores the future representing the response from the server for the estimation task. 
-		The future will be resolved by calling isConfident, isLowConfidence, or isOverBudget.
+		None once the outcome has been evaluated from it, unless the response was an error, so that waiting on the
+		outcome raises it.
 	_evaluated : boolean
 		A private variable indicating whether the object's stored future has been resolved (True) or not (False)
 	_outcome_type_val : str
@@ -33,6 +73,10 @@ class Outcome():
 		The amount previously budget. Only set if the outcome is "OVERBUDGET"
 	"""
 
+	__slots__ = ('_future_task_resp', '_evaluated', '_outcome_type_val', 'cost', 'conf', 'need', 'have')
+
+	types_outcome = {'CONFIDENT':1, 'LOW_CONFIDENCE':2, 'OVERBUDGET':3}
+
 	def __init__(self, future_tr):
 		"""
 		Initialize the fields for an  outcome
@@ -46,11 +90,32 @@ class Outcome():
 		self._future_task_resp = future_tr
 		self._evaluated = False
 		self._outcome_type_val = None
-		self.cost = float('nan')
-		self.conf = float('nan')
-		self.need = float('nan')
-		self.have = float('nan')
-		self.types_outcome = {'CONFIDENT':1, 'LOW_CONFIDENCE':2, 'OVERBUDGET':3}
+		self.cost = _NAN
+		self.conf = _NAN
+		self.need = _NAN
+		self.have = _NAN
+		# a grpc.aio call is resolved by awaiting it, see __await__
+		if not hasattr(future_tr, '__await__'):
+			future_tr.add_done_callback(self._on_done)
+
+	def _on_done(self, future):
+		"""
+		Internal method. Evaluates the outcome as soon as its future resolves, on the thread that resolves it, and
+		drops the future. A future that failed, or resolved to an error response, is kept so that waiting on the
+		outcome raises the error
+
+		Parameters
+		----------
+		future : Future
+			The resolved future
+		"""
+		if future.cancelled() or future.exception() is not None:
+			return
+		try:
+			self._setOutcome(future.result())
+		except RPCServerError:
+			return
+		self._future_task_resp = None
 
 	def _evalOutcome(self,response):
 		"""
@@ -91,6 +156,41 @@ class Outcome():
 		"""
 		raise NotImplementedError("Must implement this method in subclass")
 
+	def _setOutcome(self, response):
+		"""
+		Internal method. Initializes the fields of the outcome from a resolved response. Used by both
+		the blocking and the asyncio resolution paths
+
+		Parameters
+		----------
+		response : TaskResponse
+			The response from the server
+		"""
+		raise NotImplementedError("Must implement this method in subclass")
+
+	def __await__(self):
+		"""
+		Allows an outcome to be awaited from a coroutine. Resolves the outcome without blocking the event
+		loop, and returns the outcome itself. Works both for outcomes holding a grpc.aio call and for outcomes
+		holding a blocking gRPC future, the latter being bridged into the event loop through a done callback
+
+		Returns
+		-------
+		Outcome
+			This outcome, with its fields initialized
+		"""
+		# the future is read before _evaluated, as _on_done sets _evaluated and then drops the future
+		call = self._future_task_resp
+		if self._evaluated or call is None:
+			return self
+		if hasattr(call, '__await__'):
+			response = yield from call.__await__()
+		else:
+			response = yield from _wrap_future(call).__await__()
+		self._setOutcome(response)
+		self._future_task_resp = None
+		return self
+
 	def printOutcome(self, timeout = None):
 		"""
 		Convenient function for printing the output of an outcome
@@ -125,6 +225,23 @@ class Outcome():
 		"""
 		self._resolveResponse(waitTime = timeout)
 
+	def add_done_callback(self, fn):
+		"""
+		Registers fn to be called, with this outcome as its only argument, once the outcome's future
+		completes. If the future has already completed, fn is called immediately. fn runs on the thread
+		that completes the future, so it should return quickly and must not block
+
+		Parameters
+		----------
+		fn : callable
+			A function taking a single Outcome argument
+		"""
+		future = self._future_task_resp
+		if future is None:
+			fn(self)
+		else:
+			future.add_done_callback(lambda _future: fn(self))
+
 	def isDone(self):
 		"""
 		Returns a boolean indicating whether the outcome's future is resolved or not as yet
@@ -144,13 +261,13 @@ class Outcome():
 		Returns
 		-------
 		bool
-			True if outcome is an estimate
+			True if outcome is a confident estimate
 			False otherwise
 		"""
 		
 		if not self._evaluated:
 			self._resolveResponse(waitTime = timeout)
-		return 'ESTIMATE' == self._outcome_type_val
+		return 'CONFIDENT' == self._outcome_type_val
 
 	def isLowConfidence(self, timeout = None):
 		"""
@@ -197,6 +314,9 @@ class RadioOutcome(Outcome):
 	high : float
 		The highest valued worker response. Only set if the outcome is "CONFIDENT" or "LOW_CONFIDENCE"
 	"""
+
+	__slots__ = ('answer',)
+
 	def __init__(self, future_tr):
 		"""
 		Initialize the fields for an estimation outcome, and general outcome fields of superclass
@@ -207,8 +327,9 @@ class RadioOutcome(Outcome):
 			A future representing the response from the server for the estimation task. The future will be resolved
 			by calling isConfident, isLowConfidence, or isOverBudget.
 		"""
-		Outcome.__init__(self,future_tr)
+		# set before Outcome.__init__, which evaluates an outcome whose future has already resolved
 		self.answer = None
+		Outcome.__init__(self,future_tr)
 
 	def _evalOutcome(self,response):
 		ret_string = None
@@ -224,18 +345,24 @@ class RadioOutcome(Outcome):
 		raise RPCServerError(ret_string)
 
 	def _resolveResponse(self, waitTime = None):
+		future_tr = self._future_task_resp
+		if self._evaluated or future_tr is None:
+			return
 		try:
-			future = self._future_task_resp.result(timeout = waitTime)
-		except FutureTimeoutError:
+			future = future_tr.result(timeout = waitTime)
+		except (FutureTimeoutError, futures.TimeoutError):
 			print("TimeoutError: This outcome timed out before its future resolved.")
 			raise
-		except FutureCancelledError:
+		except (FutureCancelledError, futures.CancelledError):
 			print("CancelledError: This gRPC call has been cancelled")
 			raise
 		except Exception: 
 			raise
 
-		outcome = self._evalOutcome(future)
+		self._setOutcome(future)
+
+	def _setOutcome(self, response):
+		outcome = self._evalOutcome(response)
 		if self.types_outcome['OVERBUDGET'] ==  outcome.outcome_type:
 			self.need= outcome.need
 			self.have = outcome.have
@@ -279,6 +406,9 @@ class EstimateOutcome(Outcome):
 	high : float
 		The highest valued worker response. Only set if the outcome is "CONFIDENT" or "LOW_CONFIDENCE"
 	"""
+
+	__slots__ = ('low', 'high', 'est')
+
 	def __init__(self, future_tr):
 		"""
 		Initialize the fields for an estimation outcome, and general outcome fields of superclass
@@ -289,10 +419,11 @@ class EstimateOutcome(Outcome):
 			A future representing the response from the server for the estimation task. The future will be resolved
 			by calling isConfident, isLowConfidence, or isOverBudget.
 		"""
+		# set before Outcome.__init__, which evaluates an outcome whose future has already resolved
+		self.low = _NAN
+		self.high = _NAN
+		self.est = _NAN
 		Outcome.__init__(self,future_tr)
-		self.low = float('nan')
-		self.high = float('nan')
-		self.est = float('nan')
 
 	def _evalOutcome(self,response):
 		ret_string = None
@@ -308,18 +439,24 @@ class EstimateOutcome(Outcome):
 		raise RPCServerError(ret_string)
 
 	def _resolveResponse(self, waitTime = None):
+		future_tr = self._future_task_resp
+		if self._evaluated or future_tr is None:
+			return
 		try:
-			future = self._future_task_resp.result(timeout = waitTime)
-		except FutureTimeoutError:
+			future = future_tr.result(timeout = waitTime)
+		except (FutureTimeoutError, futures.TimeoutError):
 			print("TimeoutError: This outcome timed out before its future resolved.")
 			raise
-		except FutureCancelledError:
+		except (FutureCancelledError, futures.CancelledError):
 			print("CancelledError: This gRPC call has been cancelled")
 			raise
 		except Exception: 
 			raise
 
-		outcome = self._evalOutcome(future)
+		self._setOutcome(future)
+
+	def _setOutcome(self, response):
+		outcome = self._evalOutcome(response)
 		if self.types_outcome['OVERBUDGET'] ==  outcome.outcome_type:
 			self.need= outcome.need
 			self.have = outcome.have
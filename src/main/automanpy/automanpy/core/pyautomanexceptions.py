@@ -7,9 +7,11 @@ class ArgumentError(Error):
 
 	Attributes:
 		msg  -- explanation of the error
+		errors  -- for an error of Schema.validate_many, the invalid rows of each invalid column, None otherwise
 	"""
-	def __init__(self, msg):
+	def __init__(self, msg, errors = None):
 		self.msg = "ArgumentError: "+msg
+		self.errors = errors
 
 class AdapterError(Error):
 	"""Exception raised for failures relating to the adapter dictionary provided to Automan constructor
@@ -21,13 +23,14 @@ class AdapterError(Error):
 		self.msg = "AdapterError: "+msg
 
 class UnsupportedServerError(Error):
-	"""Exception raised for using non-local servers, currently package only supports 'localhost' as valid arg
+	"""Exception raised for asking a non-local server for what only a server on localhost supports: being started 
+	by the client, shared between client processes, or reached over a Unix domain socket
 
 	Attributes:
 		msg  -- explanation of the error
 	"""
-	def __init__(self):
-		self.msg = 'UnsupportedServerError: Currently, PyAutoman only supports locally hosted servers at localhost'
+	def __init__(self, msg = 'Currently, PyAutoman only starts servers at localhost'):
+		self.msg = 'UnsupportedServerError: '+msg
 
 class RPCServerError(Error):
 	"""Exception raised for various server errors:
@@ -0,0 +1,287 @@
+from automanpy.core.pyautomanexceptions import ArgumentError
+
+#the number of bad rows of a column named in the message of the ArgumentError of validate_many, the rest are counted
+MAX_ROWS_SHOWN = 10
+
+class Param():
+	"""
+	The Param class. One check of one parameter of a task type, see Schema. A parameter can have several checks,
+	run in order, each with its own message
+
+	Attributes
+	----------
+	name : str
+		The name of the parameter, as taken by Automan.estimate or Automan.radio
+	test : callable
+		Returns True if a value of the parameter is valid. Takes the value, and the dict of every argument by name
+	message : str
+		The message of the ArgumentError raised for an invalid value
+	required : bool
+		True if the parameter cannot be None
+	unset : object
+		A value that stands for the back-end's default, and is not checked, None if there is none
+	column : callable
+		Returns the mask of the valid rows of a numpy array of values, in one pass, or None if the array has a dtype
+		it cannot check, which is then checked a value at a time. Takes the array and the numpy module. None if the
+		values are always checked one at a time
+	per_task : bool
+		True if the parameter can be given one value per task, see Schema.validate_many
+	"""
+
+	def __init__(self, name, test, message, required = False, unset = None, column = None, per_task = True):
+		self.name = name
+		self.test = test
+		self.message = message
+		self.required = required
+		self.unset = unset
+		self.column = column
+		self.per_task = per_task
+
+	def valid(self, value, args):
+		"""
+		Returns True if value is valid, args being every argument by name. None is valid unless the parameter is 
+		required, and unset always is
+
+		"""
+		if value is None:
+			return not self.required
+		return (self.unset is not None and value == self.unset) or self.test(value, args)
+
+class Schema():
+	"""
+	The Schema class. The parameters of a task type, declared as a list of Params, and checked in their order:
+	validate checks the arguments of one task, validate_many whole columns of arguments at once
+
+	Attributes
+	----------
+	kind : str
+		The task type, 'estimate' or 'radio'
+	params : tuple of Param
+		The checks of the parameters of the task type, in the order they are run
+	names : frozenset of str
+		The names of the parameters
+	"""
+
+	def __init__(self, kind, params):
+		"""
+		Parameters
+		----------
+		kind : str
+			The task type, 'estimate' or 'radio'
+		params : list of Param
+			The checks of the parameters of the task type, in the order they are run
+		"""
+		self.kind = kind
+		self.params = tuple(params)
+		self.names = frozenset(param.name for param in self.params)
+
+	def subset(self, names):
+		"""
+		Returns the Schema of only the parameters named in names, with their checks in the same order
+
+		"""
+		return Schema(self.kind, [param for param in self.params if param.name in names])
+
+	def validate(self, **args):
+		"""
+		Checks the arguments of one task, given by name. Arguments that are None, or not given, are only checked if 
+		required
+
+		Raises
+		------
+		ArgumentError: Indicates the first invalid argument, in the order of params
+		"""
+		for param in self.params:
+			if not param.valid(args.get(param.name), args):
+				raise ArgumentError(param.message)
+
+	def validate_many(self, columns, shared = None):
+		"""
+		Checks columns of arguments, for many tasks at once. Each column is either a single value, shared by every task,
+		or a sequence (list, tuple or 1-D numpy array) of one value per task. A numpy array of a numeric or string dtype
+		is checked in one vectorized pass, other sequences a value at a time. Every invalid row of every column is
+		reported at once
+
+		Parameters
+		----------
+		columns : dict
+			The columns, by name
+		shared : dict
+			Other arguments, by name, each a single value shared by every task, even if it is a sequence
+
+		Returns
+		-------
+		int
+			The number of tasks, the length of the sequences. None if every column is a single value
+
+		Raises
+		------
+		ArgumentError: Indicates one or more columns had invalid values, or the sequences differ in length. Its errors
+			attribute maps the name of each invalid column to the list of its invalid rows, or to None for an invalid
+			single value
+		"""
+		shared = shared or dict()
+		args = dict(shared, **columns)
+		n_tasks = None
+		errors = dict()
+		messages = list()
+		for param in self.params:
+			# the later checks of a parameter assume the earlier ones passed
+			if param.name in errors:
+				continue
+			values = args.get(param.name)
+			if (param.name in columns and param.per_task and
+					(isinstance(values, (list, tuple)) or hasattr(values, 'tolist') and getattr(values, 'ndim', 0) == 1)):
+				if n_tasks is not None and len(values) != n_tasks:
+					raise ArgumentError("every per-task sequence must have the same length, %s has %d values rather than %d"%(param.name, len(values), n_tasks))
+				n_tasks = len(values)
+				bad = Schema._bad_rows(param, values, args)
+				if bad:
+					errors[param.name] = bad
+					shown = ", ".join(str(row) for row in bad[:MAX_ROWS_SHOWN])
+					more = " and %d more"%(len(bad) - MAX_ROWS_SHOWN) if len(bad) > MAX_ROWS_SHOWN else ""
+					messages.append("%s (%s %s%s)"%(param.message, "row" if len(bad) == 1 else "rows", shown, more))
+				continue
+			if not param.valid(values, args):
+				errors[param.name] = None
+				messages.append(param.message)
+		if messages:
+			raise ArgumentError("; ".join(messages), errors)
+		return n_tasks
+
+	@staticmethod
+	def _bad_rows(param, values, args):
+		"""
+		Private method. Returns the list of the invalid rows of a sequence of values of param, args being every argument
+
+		"""
+		if hasattr(values, 'tolist'):
+			import numpy
+			mask = param.column(values, numpy) if param.column is not None else None
+			if mask is not None:
+				if param.unset is not None:
+					mask = mask | (values == param.unset)
+				return numpy.flatnonzero(~mask).tolist()
+			values = values.tolist()
+		return [row for row, value in enumerate(values) if not param.valid(value, args)]
+
+def _is_options_format(value, args):
+	singles = [isinstance(entry, str) for entry in value.values()]
+	doubles = [isinstance(entry, tuple) and isinstance(entry[0], str) and isinstance(entry[1], str) for entry in value.values()]
+	return (all(singles) and not any(doubles)) or (all(doubles) and not any(singles))
+
+# a confidence is given either as a fraction or as a percentage
+def _confidence(value, args):
+	return isinstance(value, (int, float)) and (0.5 <= value <= 1.0 or 50 <= value <= 100)
+
+def _number(value, args):
+	return isinstance(value, (int, float))
+
+def _positive(value, args):
+	return isinstance(value, (int, float)) and value > 0
+
+def _positive_int(value, args):
+	return isinstance(value, int) and value > 0
+
+def _bool(value, args):
+	return isinstance(value, bool)
+
+def _str(value, args):
+	return isinstance(value, str)
+
+def _text(value, args):
+	return isinstance(value, str) and bool(value.strip())
+
+def _sequence(value, args):
+	return isinstance(value, (list, tuple))
+
+def _dict(value, args):
+	return isinstance(value, dict)
+
+def _number_answers(value, args):
+	return all(isinstance(answer, (int, float)) and not isinstance(answer, bool) for answer in value)
+
+def _option_answers(value, args):
+	return isinstance(args.get('options'), dict) and all(isinstance(answer, str) and answer in args['options'] for answer in value)
+
+def _number_column(array, numpy):
+	return numpy.ones(len(array), dtype = bool) if array.dtype.kind in 'biuf' else None
+
+def _positive_column(array, numpy):
+	return array > 0 if array.dtype.kind in 'biuf' else None
+
+def _positive_int_column(array, numpy):
+	return array > 0 if array.dtype.kind in 'biu' else None
+
+def _confidence_column(array, numpy):
+	if array.dtype.kind not in 'biuf':
+		return None
+	return ((array >= 0.5) & (array <= 1.0)) | ((array >= 50) & (array <= 100))
+
+def _str_column(array, numpy):
+	return numpy.ones(len(array), dtype = bool) if array.dtype.kind == 'U' else None
+
+def _text_column(array, numpy):
+	return numpy.char.strip(array) != '' if array.dtype.kind == 'U' else None
+
+_CONFIDENCE = Param('confidence', _confidence, "confidence must be of type float, must be between 0.5 and 1, or between 50 and 100", 
+					column = _confidence_column)
+_DRY_RUN = Param('dry_run', _bool, "dry_run must be of type bool")
+_DONT_REJECT = Param('dont_reject', _bool, "dont_reject must be of type bool")
+_INITIAL_WORKER_TIMEOUT = Param('initial_worker_timeout_in_s', _positive_int, "initial_worker_timeout_in_s must be of type int, must be strictly greater than 0",
+								column = _positive_int_column)
+_IMAGE_URL = Param('image_url', _str, "image_url must be of type str", column = _str_column)
+_IMG_ALT_TXT = Param('img_alt_txt', _str, "img_alt_txt must be of type str", column = _str_column)
+_PAY_ALL_ON_FAILURE = Param('pay_all_on_failure', _bool, "pay_all_on_failure must be of type bool")
+_QUESTION_TIMEOUT_MULTIPLIER = Param('question_timeout_multiplier', _positive_int, "question_timeout_multiplier must be of type int, must be strictly greater than 0",
+										column = _positive_int_column)
+_TEXT = Param('text', _text, "(required argument) text must be of type str, cannot be empty", required = True,
+				column = _text_column)
+_TITLE = Param('title', _str, "title must be of type str", column = _str_column)
+_WAGE = Param('wage', _positive, "wage must be of type float, must be strictly greater than 0", column = _positive_column)
+_BUDGET = Param('budget', _positive, "(required argument) budget must be of type float, must be strictly greater than 0", required = True,
+				column = _positive_column)
+_MOCK_ANSWERS = Param('mock_answers', _sequence, "mock_answers must be of type list", per_task = False)
+
+ESTIMATE = Schema('estimate', [
+	_BUDGET,
+	_CONFIDENCE,
+	Param('confidence_int', _positive, "confidence_int must be of type float, must be strictly greater than 0", unset = -1, column = _positive_column),
+	_DRY_RUN,
+	_DONT_REJECT,
+	_INITIAL_WORKER_TIMEOUT,
+	_IMAGE_URL,
+	_IMG_ALT_TXT,
+	Param('max_value', _number, "max_value must be of type float", column = _number_column),
+	Param('min_value', _number, "min_value must be of type float", column = _number_column),
+	_PAY_ALL_ON_FAILURE,
+	_QUESTION_TIMEOUT_MULTIPLIER,
+	Param('sample_size', _positive_int, "sample_size must be of type int, must be strictly greater than 0", unset = -1, column = _positive_int_column),
+	_TEXT,
+	_TITLE,
+	_WAGE,
+	_MOCK_ANSWERS,
+	Param('mock_answers', _number_answers, "mock_answers must be a list of type float", per_task = False),
+])
+
+RADIO = Schema('radio', [
+	Param('options', _dict, "(required argument) options must be a dictionary, where dict key is type string and entries are tuples of type "
+									"(string[name]), (string[name],string[url])", required = True, per_task = False),
+	Param('options', _is_options_format, "entries of options dict must be tuples of type (string[name]), (string[name],string[url]). Note: cannot mix "
+											"the two formats", per_task = False),
+	_BUDGET,
+	_CONFIDENCE,
+	_DRY_RUN,
+	_DONT_REJECT,
+	_INITIAL_WORKER_TIMEOUT,
+	_IMAGE_URL,
+	_IMG_ALT_TXT,
+	_PAY_ALL_ON_FAILURE,
+	_QUESTION_TIMEOUT_MULTIPLIER,
+	_TEXT,
+	_TITLE,
+	_WAGE,
+	_MOCK_ANSWERS,
+	# options is only checked before mock_answers by validate, validate_many checks every column
+	Param('mock_answers', _option_answers, "mock_answers must be a list of keys of the options dict", per_task = False),
+])
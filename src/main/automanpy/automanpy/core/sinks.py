@@ -0,0 +1,169 @@
+import csv
+import json
+import math
+import sqlite3
+
+from automanpy.core.outcomes import RadioOutcome
+from automanpy.core.pyautomanexceptions import ArgumentError
+
+#the fields of the record of an outcome, in the order of the columns of CsvSink and SqliteSink
+FIELDS = ('position', 'key', 'task_type', 'outcome_type', 'est', 'low', 'high', 'conf', 'cost', 'need', 'have', 'answer', 'error')
+
+def outcome_record(position, key, outcome):
+	"""
+	Returns the record of a resolved outcome, as handed to a sink: a dict keyed by FIELDS. Numeric fields that are
+	not set are None rather than NaN, answer is None for estimate outcomes, and an outcome that resolved to an
+	error has the outcome_type "ERROR" and the error message in error
+
+	Parameters
+	----------
+	position : int
+		The position of the task among the tasks submitted
+	key : str
+		The key of the task, see dedupe.task_key
+	outcome : Outcome
+		The outcome, resolved
+	"""
+	error = None
+	try:
+		# the future is already complete, this only raises the error it resolved to, if any
+		outcome.done()
+	except Exception as exc:
+		error = getattr(exc, 'msg', None) or str(exc) or type(exc).__name__
+	record = {'position' : position, 'key' : key, 'task_type' : 'radio' if isinstance(outcome, RadioOutcome) else 'estimate',
+				'outcome_type' : 'ERROR' if error is not None else outcome.outcomeType()}
+	for name in ('est', 'low', 'high', 'conf', 'cost', 'need', 'have'):
+		value = getattr(outcome, name, None)
+		record[name] = None if value is None or math.isnan(value) else value
+	record['answer'] = getattr(outcome, 'answer', None)
+	record['error'] = error
+	return record
+
+class Sink():
+	"""
+	The Sink class. Where a StreamingBatch writes the record of each outcome once it resolves, see outcome_record.
+	write is only called from the StreamingBatch's writer thread, a list of records at a time
+	"""
+
+	def write(self, records):
+		"""
+		Writes records, a list of the records of resolved outcomes
+
+		"""
+		raise NotImplementedError("Must implement this method in subclass")
+
+	def close(self):
+		"""
+		Flushes whatever is buffered and releases the sink. write is not called after this
+
+		"""
+		pass
+
+class JsonlSink(Sink):
+	"""
+	The JsonlSink class. Writes one JSON object per line, per outcome
+	"""
+
+	def __init__(self, path, append = False):
+		"""
+		Parameters
+		----------
+		path : str
+			The path of the file
+		append : bool
+			True appends to the file, False overwrites it
+		"""
+		if not isinstance(path, str) or not path.strip():
+			raise ArgumentError("sink path must be of type str, cannot be empty")
+		self.path = path
+		self._file = open(path, 'a' if append else 'w')
+
+	def write(self, records):
+		self._file.write("".join(json.dumps(record) + "\n" for record in records))
+		self._file.flush()
+
+	def close(self):
+		self._file.close()
+
+class CsvSink(Sink):
+	"""
+	The CsvSink class. Writes one row per outcome, with a header row of FIELDS. Fields that are None are left empty
+	"""
+
+	def __init__(self, path, append = False):
+		"""
+		Parameters
+		----------
+		path : str
+			The path of the file
+		append : bool
+			True appends to the file, False overwrites it. The header is only written to an empty file
+		"""
+		if not isinstance(path, str) or not path.strip():
+			raise ArgumentError("sink path must be of type str, cannot be empty")
+		self.path = path
+		self._file = open(path, 'a' if append else 'w', newline = '')
+		self._writer = csv.DictWriter(self._file, fieldnames = FIELDS)
+		if self._file.tell() == 0:
+			self._writer.writeheader()
+
+	def write(self, records):
+		self._writer.writerows(records)
+		self._file.flush()
+
+	def close(self):
+		self._file.close()
+
+class SqliteSink(Sink):
+	"""
+	The SqliteSink class. Writes one row per outcome to a table of an SQLite database, with a column per field of
+	FIELDS and position as its primary key, so that rerunning the same tasks replaces their rows. Each write is
+	one transaction
+	"""
+
+	def __init__(self, path, table = "outcomes"):
+		"""
+		Parameters
+		----------
+		path : str
+			The path of the database file, created if needed
+		table : str
+			The name of the table, created if needed
+		"""
+		if not isinstance(path, str) or not path.strip():
+			raise ArgumentError("sink path must be of type str, cannot be empty")
+		if not isinstance(table, str) or not table.isidentifier():
+			raise ArgumentError("sink table must be of type str, must be a valid identifier")
+		self.path = path
+		self.table = table
+		# records are written from the StreamingBatch's writer thread
+		self._db = sqlite3.connect(path, check_same_thread = False)
+		self._db.execute("PRAGMA journal_mode=WAL")
+		self._db.execute("CREATE TABLE IF NOT EXISTS %s (position INTEGER PRIMARY KEY, key TEXT, task_type TEXT, outcome_type TEXT, "
+							"est REAL, low REAL, high REAL, conf REAL, cost REAL, need REAL, have REAL, answer TEXT, error TEXT)"%table)
+		self._insert = "INSERT OR REPLACE INTO %s (%s) VALUES (%s)"%(table, ", ".join(FIELDS), ", ".join("?" * len(FIELDS)))
+
+	def write(self, records):
+		with self._db:
+			self._db.executemany(self._insert, [tuple(record[name] for name in FIELDS) for record in records])
+
+	def close(self):
+		self._db.close()
+
+class CallbackSink(Sink):
+	"""
+	The CallbackSink class. Calls a function with the record of each outcome, on the StreamingBatch's writer thread
+	"""
+
+	def __init__(self, fn):
+		"""
+		Parameters
+		----------
+		fn : callable
+			A function taking the record of an outcome
+		"""
+		self.fn = fn
+
+	def write(self, records):
+		for record in records:
+			self.fn(record)
@@ -0,0 +1,139 @@
+import threading
+from concurrent.futures import Future
+from time import monotonic
+
+import grpc
+
+from automanpy.core.automanlib import submit_tasks
+from automanpy.core.automanlib_rpc_pb2 import AutomanTask, TaskResponse
+from automanpy.core.pyautomanexceptions import RPCServerError
+from automanpy.core.window import congestion_code
+
+class TaskStream():
+	"""
+	The TaskStream class. Submits many tasks over a single SubmitTasks stream, and routes the responses
+	sent back down the stream to one future per task. The futures resolve to the TaskResponse of their
+	task, and can be wrapped in EstimateOutcomes or RadioOutcomes like the futures returned by submit_task.
+
+	Attributes
+	----------
+	futures : list
+		A list of futures, one per task, in the order the tasks were given
+	acknowledged : int
+		The number of tasks the server has acknowledged queueing so far
+	"""
+
+	def __init__(self, channel, automan_tasks, chunk_size = 500, window = None):
+		"""
+		Starts the stream, sending a copy of each task with its task_id set to its position. The tasks are written 
+		to the stream, and the responses read from it, on a background thread; this call does not block
+
+		Parameters
+		----------
+		channel : Channel or ChannelPool
+			A gRPC channel
+		automan_tasks : list of AutomanTask
+			The tasks to submit. They are not modified, so the same task can be given more than once, or to several 
+			streams at once
+		chunk_size : int
+			The number of tasks sent in each message on the stream
+		window : SubmissionWindow
+			If not None, each message waits for a slot per task before it is sent, and the tasks give their slots
+			back as they resolve. Messages are then no larger than a quarter of the window, so that the next
+			message can be sent as soon as some of the tasks in flight resolve, rather than all of them. An 
+			adaptive window is told how long the server takes to acknowledge each task, and whether the stream 
+			failed for lack of capacity
+		"""
+		self.futures = list()
+		self.acknowledged = 0
+		self._pending = dict()
+		self._window = window if window is not None and window.adaptive else None
+		# task_id -> when the message holding the task was sent, for an adaptive window
+		self._sent = dict()
+		self._all_acked = threading.Event()
+		sent_tasks = list()
+		for i, automan_task in enumerate(automan_tasks):
+			sent_task = AutomanTask()
+			sent_task.CopyFrom(automan_task)
+			sent_task.task_id = str(i)
+			sent_tasks.append(sent_task)
+			future = Future()
+			future.set_running_or_notify_cancel()
+			self.futures.append(future)
+			self._pending[sent_task.task_id] = future
+		if not self.futures:
+			self._all_acked.set()
+			return
+
+		before_send = None
+		if window is not None:
+			chunk_size = window.chunk_size(chunk_size)
+			before_send = lambda tasks: self._take_slots(window, tasks)
+		self._responses = submit_tasks(channel, sent_tasks, chunk_size, before_send)
+		reader = threading.Thread(target = self._read_responses, name = "automanpy-task-stream")
+		reader.daemon = True
+		reader.start()
+
+	def _take_slots(self, window, automan_tasks):
+		"""
+		Private method. Runs on the thread writing the stream, before a message is sent: waits for a slot per task
+		of the message, and gives each back once its task resolves
+
+		"""
+		window.acquire(len(automan_tasks))
+		for automan_task in automan_tasks:
+			window.release_when_done(self.futures[int(automan_task.task_id)])
+		if self._window is not None:
+			sent = monotonic()
+			for automan_task in automan_tasks:
+				self._sent[automan_task.task_id] = sent
+
+	def _read_responses(self):
+		"""
+		Private method. Runs on the reader thread, resolving the future of each task as its response arrives
+
+		"""
+		try:
+			for response_batch in self._responses:
+				for response in response_batch.responses:
+					if response.return_code == TaskResponse.ACCEPTED:
+						self.acknowledged += 1
+						if self._window is not None:
+							sent = self._sent.pop(response.task_id, None)
+							if sent is not None:
+								self._window.acked(monotonic() - sent)
+						if self.acknowledged == len(self.futures):
+							self._all_acked.set()
+					else:
+						future = self._pending.pop(response.task_id, None)
+						if future is not None:
+							future.set_result(response)
+			error = RPCServerError("SubmitTasks stream closed before every task was resolved")
+		except grpc.RpcError as rpc_err:
+			error = rpc_err
+			code = congestion_code(rpc_err)
+			if self._window is not None and code is not None:
+				self._window.congested("SubmitTasks failed with " + code.name)
+
+		# fail whatever the stream did not resolve
+		for future in self._pending.values():
+			future.set_exception(error)
+		self._pending.clear()
+		self._all_acked.set()
+
+	def wait_acknowledged(self, timeout = None):
+		"""
+		Blocks until the server has acknowledged queueing every task, or the stream ended
+
+		Parameters
+		----------
+		timeout : float
+			The maximum number of seconds to wait. If None, waits indefinitely
+
+		Returns
+		-------
+		bool
+			True if every task was acknowledged, False otherwise
+		"""
+		self._all_acked.wait(timeout)
+		return self.acknowledged == len(self.futures)
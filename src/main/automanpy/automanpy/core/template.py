@@ -0,0 +1,145 @@
+from automanpy.core.automanlib_rpc_pb2 import AutomanTask
+from automanpy.core.batchjob import Batch
+from automanpy.core.outcomes import EstimateOutcome, RadioOutcome
+from automanpy.core.pyautomanexceptions import ArgumentError
+from automanpy.core.schema import ESTIMATE, RADIO
+
+class TaskTemplate():
+	"""
+	The TaskTemplate class. Tasks of one type that share every parameter but their item fields: text, budget,
+	image_url and title. The shared parameters are checked and built into a prototype AutomanTask once, and each
+	task is a copy of the prototype with its item fields set, and only those checked. Returned by Automan.template
+
+	Example
+	-------
+		template = a.template("estimate", budget = 1.50, title = "Car Counting", confidence = 0.9)
+		outcomes = [template.submit(text = "How many cars are in this parking lot?", image_url = url) for url in photo_urls]
+
+	Attributes
+	----------
+	kind : str
+		The task type, 'estimate' or 'radio'
+	prototype : AutomanTask
+		The task every task is copied from. Its text and budget are stand-ins if the template was not given them
+	defaults : dict
+		The item fields given to the template, by name, used for the items that do not set them
+	"""
+
+	#the fields set per task, the other parameters are shared by every task
+	ITEM_FIELDS = ('text', 'budget', 'image_url', 'title')
+
+	def __init__(self, automan, kind, shared):
+		"""
+		Parameters
+		----------
+		automan : Automan
+			The client the tasks are submitted with
+		kind : str
+			'estimate' or 'radio'
+		shared : dict
+			The keyword arguments of estimate or radio shared by every task, item fields included
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		if kind not in ('estimate', 'radio'):
+			raise ArgumentError("template kind must be 'estimate' or 'radio'")
+		unknown = set(shared) - set(automan.SharedArgs[kind]) - set(TaskTemplate.ITEM_FIELDS)
+		if unknown:
+			raise ArgumentError("unknown argument(s) for %s template: %s"%(kind, ", ".join(sorted(unknown))))
+		self.automan = automan
+		self.kind = kind
+		self.defaults = dict((name, shared[name]) for name in TaskTemplate.ITEM_FIELDS if shared.get(name) is not None)
+		self._outcome_cls = EstimateOutcome if kind == 'estimate' else RadioOutcome
+		self._check = (ESTIMATE if kind == 'estimate' else RADIO).subset(TaskTemplate.ITEM_FIELDS).validate
+
+		# text and budget are required to build a task, and stand in for those the items set
+		args = dict(shared)
+		if args.get('text') is None:
+			args['text'] = kind
+		if args.get('budget') is None:
+			args['budget'] = 1.0
+		make = automan._make_estimate_task if kind == 'estimate' else automan._make_radio_task
+		self.prototype = make(**args)
+
+	def build(self, text = None, budget = None, image_url = None, title = None):
+		"""
+		Checks the item fields of a task and builds it, a copy of the prototype. Fields that are None are taken
+		from the template
+
+		Parameters
+		----------
+		text, budget, image_url, title
+			The item fields of the task, see estimate or radio
+
+		Returns
+		-------
+		AutomanTask
+			The task to submit to the server
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		defaults = self.defaults
+		self._check(text = defaults.get('text') if text is None else text, budget = defaults.get('budget') if budget is None else budget,
+					image_url = image_url, title = title)
+		automan_task = AutomanTask()
+		automan_task.CopyFrom(self.prototype)
+		task = getattr(automan_task, self.kind).task
+		if text is not None:
+			task.text = text
+		if budget is not None:
+			task.budget = float(budget)
+		if image_url is not None:
+			task.image_url = image_url
+		if title is not None:
+			task.title = title
+		return automan_task
+
+	def submit(self, text = None, budget = None, image_url = None, title = None):
+		"""
+		Builds a task, see build, and submits it as estimate or radio would
+
+		Returns
+		-------
+		EstimateOutcome or RadioOutcome
+			The outcome of the task
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		return self.automan._submit(self.build(text = text, budget = budget, image_url = image_url, title = title), self._outcome_cls)
+
+	def submit_many(self, items, chunk_size = 500):
+		"""
+		Builds a task per item, see build, and submits them as submit_many would
+
+		Parameters
+		----------
+		items : iterable
+			The item fields of each task, as a dict of keyword arguments for build
+		chunk_size : int
+			The number of tasks sent in each message on the stream
+
+		Returns
+		-------
+		Batch
+			A Batch holding one outcome and one key per task, in the order of items
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied items
+		RPCServerError: Indicates the stream ended before the server acknowledged every task
+		"""
+		if not isinstance(chunk_size, int) or chunk_size <= 0:
+			raise ArgumentError("chunk_size must be of type int, must be strictly greater than 0")
+		automan_tasks = list()
+		for item in items:
+			if not isinstance(item, dict):
+				raise ArgumentError("each item must be a dict of the item fields of a task")
+			automan_tasks.append(self.build(**item))
+		outcomes, keys = self.automan._submit_outcomes(automan_tasks, chunk_size)
+		return Batch(outcomes, keys)
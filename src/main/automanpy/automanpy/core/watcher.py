@@ -0,0 +1,172 @@
+import threading
+from concurrent.futures import Future
+from queue import Queue
+from time import sleep
+
+import grpc
+
+from automanpy.core.automanlib import watch_outcomes
+from automanpy.core.automanlib_rpc_pb2 import TaskTicket
+from automanpy.core.pyautomanexceptions import RPCServerError
+
+# a broken stream is reopened and the unresolved tasks watched again on these errors, as the tasks are 
+# still posted on the server. Failing their futures would lose outcomes that were already paid for
+_RETRYABLE = (grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.CANCELLED)
+# the number of times in a row a stream is reopened without a response arriving, and the seconds waited 
+# before the first reopen, doubled on each of the next ones
+_MAX_REWATCHES = 5
+_REWATCH_DELAY = 0.2
+
+class OutcomeWatcher():
+	"""
+	The OutcomeWatcher class. Holds a single WatchOutcomes stream open to the server, and resolves one
+	future per watched task from the responses the server pushes down it. The stream is opened on the first
+	call to watch. If it breaks with UNAVAILABLE or CANCELLED, it is reopened and the unresolved tasks are 
+	watched again on it, and on any other error their futures are failed.
+
+	Attributes
+	----------
+	channel : Channel
+		The gRPC channel the stream is opened on
+	"""
+
+	def __init__(self, channel):
+		"""
+		Parameters
+		----------
+		channel : Channel
+			A gRPC channel
+		"""
+		self.channel = channel
+		# the tickets queue feeding the open stream, and the futures of the tasks watched on it
+		self._tickets = None
+		self._pending = None
+		self._lock = threading.Lock()
+
+	def watch(self, ticket):
+		"""
+		Starts watching a posted task. Does not block
+
+		Parameters
+		----------
+		ticket : TaskTicket or Future
+			The ticket returned when the task was posted, or a future that resolves to it, as returned 
+			by post_task. In the latter case the task is watched once the ticket arrives
+
+		Returns
+		-------
+		Future
+			A future that resolves to the TaskResponse of the task. If posting the task failed, the 
+			future is failed with the same error
+		"""
+		future = Future()
+		future.set_running_or_notify_cancel()
+		if isinstance(ticket, TaskTicket):
+			self._watch(ticket.task_id, future)
+			return future
+
+		def posted(ticket_future):
+			try:
+				task_id = ticket_future.result().task_id
+			except Exception as post_err:
+				future.set_exception(post_err)
+				return
+			self._watch(task_id, future)
+		ticket.add_done_callback(posted)
+		return future
+
+	def _watch(self, task_id, future):
+		"""
+		Private method. Sends the ticket of a task up the stream, opening the stream if needed
+
+		"""
+		with self._lock:
+			if self._tickets is None:
+				self._open()
+			self._pending[task_id] = future
+			self._tickets.put(TaskTicket(task_id = task_id))
+
+	def close(self):
+		"""
+		Closes the client side of the stream. Tasks already watched are still resolved
+
+		"""
+		with self._lock:
+			if self._tickets is not None:
+				self._tickets.put(None)
+				self._tickets = None
+				self._pending = None
+
+	def _open(self, pending = None, rewatches = 0):
+		"""
+		Private method. Opens the WatchOutcomes stream, and starts the thread that reads it. Called with the lock held
+
+		"""
+		tickets = Queue()
+		pending = dict() if pending is None else pending
+		responses = watch_outcomes(self.channel, iter(tickets.get, None))
+		self._tickets = tickets
+		self._pending = pending
+		reader = threading.Thread(target = self._read_responses, args = (tickets, pending, responses, rewatches), name = "automanpy-outcome-watcher")
+		reader.daemon = True
+		reader.start()
+
+	def _read_responses(self, tickets, pending, responses, rewatches):
+		"""
+		Private method. Runs on the reader thread, resolving the future of each task as its response arrives
+
+		"""
+		try:
+			for response in responses:
+				rewatches = 0
+				with self._lock:
+					future = pending.pop(response.task_id, None)
+				if future is not None:
+					future.set_result(response)
+			error = RPCServerError("WatchOutcomes stream closed before every watched task was resolved")
+		except grpc.RpcError as rpc_err:
+			error = rpc_err
+
+		with self._lock:
+			current = self._tickets is tickets
+			if current:
+				self._tickets = None
+				self._pending = None
+			retry = bool(pending) and isinstance(error, grpc.RpcError) and error.code() in _RETRYABLE and rewatches < _MAX_REWATCHES
+		if retry:
+			sleep(_REWATCH_DELAY * 2 ** rewatches)
+			if self._rewatch(pending, rewatches + 1, current):
+				return
+
+		# fail whatever the stream did not resolve, the next watch opens a new stream
+		with self._lock:
+			unresolved = list(pending.values())
+			pending.clear()
+		for future in unresolved:
+			future.set_exception(error)
+
+	def _rewatch(self, pending, rewatches, current):
+		"""
+		Private method. Watches the unresolved tasks of a broken stream again on a new stream. The new stream 
+		takes over from the broken one unless the watcher was closed or opened another stream meanwhile, in 
+		which case its client side is closed once the tickets are sent
+
+		Returns
+		-------
+		bool
+			False if the new stream could not be opened, e.g because the channel was closed
+		"""
+		with self._lock:
+			opened, opened_pending = self._tickets, self._pending
+			try:
+				self._open(pending, rewatches)
+			except ValueError:
+				self._tickets, self._pending = opened, opened_pending
+				return False
+			tickets = self._tickets
+			for task_id in list(pending):
+				tickets.put(TaskTicket(task_id = task_id))
+			if not current or opened is not None:
+				self._tickets, self._pending = opened, opened_pending
+				tickets.put(None)
+		return True
@@ -0,0 +1,510 @@
+import asyncio
+import logging
+import math
+import threading
+from collections import deque
+from time import monotonic
+
+import grpc
+
+from automanpy.core.pyautomanexceptions import ArgumentError
+
+logger = logging.getLogger(__name__)
+
+#the status codes of a call the server turned away for lack of capacity, rather than failed
+CONGESTION_CODES = frozenset([grpc.StatusCode.RESOURCE_EXHAUSTED, grpc.StatusCode.UNAVAILABLE])
+
+class SubmissionWindow():
+	"""
+	The SubmissionWindow class. Bounds the tasks a client has posted to the server and not yet seen resolve, and,
+	optionally, the rate tasks are posted at, with a token bucket. A task takes a slot, and a token, before it is
+	posted, waiting for them if needed, and gives its slot back once its outcome resolves. See Automan(max_in_flight,
+	max_rate)
+
+	Attributes
+	----------
+	max_in_flight : int
+		The most tasks in flight at once, None if unbounded
+	max_rate : float
+		The most tasks posted per second, on average, None if unbounded
+	burst : int
+		The most tasks posted at once, the size of the token bucket. None if max_rate is None
+	in_flight : int
+		The tasks posted and not yet resolved
+	queued : int
+		The tasks waiting for a slot or a token, the depth of the client-side queue
+	"""
+
+	#True if the window adjusts max_in_flight itself, see AdaptiveWindow
+	adaptive = False
+
+	def __init__(self, max_in_flight = None, max_rate = None, burst = None):
+		"""
+		Parameters
+		----------
+		max_in_flight : int
+			The most tasks in flight at once. None (default) does not bound them
+		max_rate : float
+			The most tasks posted per second. None (default) does not bound it
+		burst : int
+			The most tasks posted at once, before max_rate holds them back. Defaults to max_rate, rounded up,
+			and at least 1
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		if max_in_flight is not None and (not isinstance(max_in_flight, int) or isinstance(max_in_flight, bool) or max_in_flight <= 0):
+			raise ArgumentError("max_in_flight must be of type int, must be strictly greater than 0")
+		if max_rate is not None and (not isinstance(max_rate, (int, float)) or isinstance(max_rate, bool) or not max_rate > 0):
+			raise ArgumentError("max_rate must be of type float, must be strictly greater than 0")
+		if burst is not None and (max_rate is None or not isinstance(burst, int) or isinstance(burst, bool) or burst <= 0):
+			raise ArgumentError("burst must be of type int, must be strictly greater than 0, and needs max_rate")
+		self.max_in_flight = max_in_flight
+		self.max_rate = max_rate
+		if max_rate is not None and burst is None:
+			burst = max(1, int(math.ceil(max_rate)))
+		self.burst = burst
+		self.in_flight = 0
+		self.queued = 0
+		self._tokens = float(burst) if burst is not None else None
+		self._stamp = monotonic()
+		self._lock = threading.Condition()
+		# the futures of the coroutines waiting in acquire_async, with their event loops
+		self._async_waiters = list()
+		self._posted = 0
+		self._resolved = 0
+		self._peak = 0
+		self._waits = 0
+		self._wait_s = 0.0
+		self._max_wait_s = 0.0
+
+	def largest(self):
+		"""
+		Returns the most tasks a single acquire can take, None if unbounded
+
+		"""
+		bounds = [bound for bound in (self.max_in_flight, self.burst) if bound is not None]
+		return min(bounds) if bounds else None
+
+	def chunk_size(self, chunk_size):
+		"""
+		Returns the number of tasks a stream posting through the window sends in each message, at most chunk_size. 
+		Messages are no larger than a quarter of the window, so that the next message can be sent as soon as some 
+		of the tasks in flight resolve, rather than all of them
+
+		"""
+		bounds = [bound for bound in (self.max_in_flight, self.burst) if bound is not None]
+		return chunk_size if not bounds else min(chunk_size, max(1, min(bounds) // 4))
+
+	def _take(self, n):
+		"""
+		Private method. Takes n slots and n tokens if there are enough, and returns 0. Otherwise takes nothing, and
+		returns the seconds until enough tokens are back, or None if the wait is for slots. n slots are always enough
+		when none are taken, for an AdaptiveWindow whose limit shrank below n. The lock must be held
+
+		"""
+		if self.max_in_flight is not None and self.in_flight > 0 and self.in_flight + n > self.max_in_flight:
+			return None
+		if self._tokens is not None:
+			now = monotonic()
+			self._tokens = min(float(self.burst), self._tokens + (now - self._stamp) * self.max_rate)
+			self._stamp = now
+			if self._tokens < n:
+				return (n - self._tokens) / self.max_rate
+			self._tokens -= n
+		self.in_flight += n
+		self._posted += n
+		self._peak = max(self._peak, self.in_flight)
+		return 0
+
+	def _check(self, n):
+		"""
+		Private method. Raises if n slots can never be taken at once
+
+		"""
+		largest = self.largest()
+		if not isinstance(n, int) or n <= 0 or (largest is not None and n > largest):
+			raise ArgumentError("cannot take %r slots of a submission window of at most %s"%(n, largest))
+
+	def _waited(self, seconds):
+		"""
+		Private method. Records a wait. The lock must be held
+
+		"""
+		self._waits += 1
+		self._wait_s += seconds
+		self._max_wait_s = max(self._max_wait_s, seconds)
+
+	def acquire(self, n = 1, timeout = None):
+		"""
+		Takes n slots, and n tokens, blocking until there are enough
+
+		Parameters
+		----------
+		n : int
+			The number of tasks about to be posted, at most largest()
+		timeout : float
+			The maximum number of seconds to wait. If None, waits indefinitely
+
+		Returns
+		-------
+		bool
+			True once the slots are taken, False if the timeout ran out first
+		"""
+		self._check(n)
+		start = monotonic()
+		with self._lock:
+			delay = self._take(n)
+			if delay == 0:
+				return True
+			self.queued += n
+			try:
+				while delay != 0:
+					if timeout is not None:
+						remaining = start + timeout - monotonic()
+						if remaining <= 0:
+							return False
+						delay = remaining if delay is None else min(delay, remaining)
+					self._lock.wait(delay)
+					delay = self._take(n)
+			finally:
+				self.queued -= n
+			self._waited(monotonic() - start)
+		return True
+
+	async def acquire_async(self, n = 1):
+		"""
+		Coroutine. Takes n slots, and n tokens, as acquire does, waiting for them without blocking the event loop
+
+		"""
+		self._check(n)
+		loop = asyncio.get_running_loop()
+		start = monotonic()
+		with self._lock:
+			if self._take(n) == 0:
+				return
+			self.queued += n
+		try:
+			while True:
+				waiter = loop.create_future()
+				with self._lock:
+					delay = self._take(n)
+					if delay == 0:
+						self._waited(monotonic() - start)
+						return
+					self._async_waiters.append((loop, waiter))
+				try:
+					await asyncio.wait_for(waiter, delay)
+				except asyncio.TimeoutError:
+					pass
+				finally:
+					with self._lock:
+						if (loop, waiter) in self._async_waiters:
+							self._async_waiters.remove((loop, waiter))
+		finally:
+			with self._lock:
+				self.queued -= n
+
+	def release(self, n = 1, posted = True):
+		"""
+		Gives back n slots, and wakes the waiting callers
+
+		Parameters
+		----------
+		n : int
+			The number of slots
+		posted : bool
+			True if the tasks were posted and resolved, False if they were not posted after all
+		"""
+		with self._lock:
+			self.in_flight -= n
+			if posted:
+				self._resolved += n
+			else:
+				self._posted -= n
+			self._notify()
+
+	def _notify(self):
+		"""
+		Private method. Wakes the callers waiting in acquire and acquire_async. The lock must be held
+
+		"""
+		self._lock.notify_all()
+		waiters, self._async_waiters = self._async_waiters, list()
+		for loop, waiter in waiters:
+			loop.call_soon_threadsafe(SubmissionWindow._wake, waiter)
+
+	def release_when_done(self, future):
+		"""
+		Gives back the slot of a posted task once its future is done, however it resolves
+
+		"""
+		future.add_done_callback(self._release_one)
+
+	def _release_one(self, future):
+		self.release(1)
+
+	def track_ack(self, ticket):
+		"""
+		Times the acknowledgement of a task just posted, given the future of its TaskTicket. Does nothing, the limits 
+		of the window are fixed, see AdaptiveWindow.track_ack
+
+		"""
+
+	@staticmethod
+	def _wake(waiter):
+		if not waiter.done():
+			waiter.set_result(None)
+
+	def metrics(self):
+		"""
+		Returns the current state of the window and the waits so far, as a dict:
+			in_flight 		- the tasks posted and not yet resolved
+			max_in_flight 	- the bound on in_flight, None if unbounded
+			peak_in_flight 	- the most tasks in flight at once so far
+			max_rate 		- the bound on the tasks posted per second, None if unbounded
+			queued 			- the tasks waiting for a slot or a token
+			posted 			- the tasks posted through the window so far
+			resolved 		- the tasks resolved so far
+			waits 			- the number of acquires that had to wait
+			wait_s_total 	- the seconds spent waiting, over every acquire
+			wait_s_mean 	- the mean seconds spent waiting, over the acquires that had to wait
+			wait_s_max 		- the longest wait, in seconds
+
+		"""
+		with self._lock:
+			return {'in_flight' : self.in_flight, 'max_in_flight' : self.max_in_flight, 'peak_in_flight' : self._peak, 
+					'max_rate' : self.max_rate, 'queued' : self.queued, 'posted' : self._posted, 'resolved' : self._resolved, 'waits' : self._waits,
+					'wait_s_total' : self._wait_s, 'wait_s_mean' : self._wait_s / self._waits if self._waits else 0.0,
+					'wait_s_max' : self._max_wait_s}
+
+class AdaptiveWindow(SubmissionWindow):
+	"""
+	The AdaptiveWindow class. A SubmissionWindow whose bound on the tasks in flight adjusts itself to the server, 
+	by additive increase and multiplicative decrease (AIMD), as TCP adjusts its congestion window. The limit grows 
+	by one slot per window of tasks acknowledged while the moving average of the seconds between posting a task and 
+	the server acknowledging it is within target_latency, and while the window holds tasks back. Until it first shrinks, it grows by one slot per task, doubling every window of tasks 
+	(TCP's slow start), so that it reaches the server's capacity quickly from initial. The moving average ack_latency 
+	rising over target_latency, or a post the server turns away with RESOURCE_EXHAUSTED or UNAVAILABLE, multiplies 
+	it by decrease; then not again until as many tasks were acknowledged as were in flight, as the tasks posted before 
+	the limit shrank are acknowledged slowly too. Every change is counted, kept in history and logged to the 
+	automanpy.core.window logger, increases at DEBUG level and decreases at INFO. See Automan(max_in_flight)
+
+	Attributes
+	----------
+	max_in_flight : int
+		The current limit on the tasks in flight, between min_limit and max_limit
+	min_limit : int
+		The smallest the limit gets
+	max_limit : int
+		The largest the limit gets
+	target_latency : float
+		The most seconds between posting a task and the server acknowledging it, on average, that does not shrink the limit
+	decrease : float
+		The factor the limit is multiplied by when it shrinks
+	ack_latency : float
+		The moving average of the seconds between posting a task and the server acknowledging it, None until the 
+		first acknowledgement
+	increases : int
+		The number of times the limit grew
+	decreases : int
+		The number of times the limit shrank
+	history : deque
+		The most recent changes of the limit, oldest first, as (monotonic time, old limit, new limit, reason) 
+		tuples
+	"""
+
+	adaptive = True
+
+	#the number of changes of the limit kept in history
+	HISTORY_SIZE = 256
+
+	#the weight of the latest acknowledgement in the moving average ack_latency
+	LATENCY_WEIGHT = 0.1
+
+	def __init__(self, initial = 16, min_limit = 1, max_limit = 10000, target_latency = 0.25, decrease = 0.5, max_rate = None, burst = None):
+		"""
+		Parameters
+		----------
+		initial : int
+			The limit on the tasks in flight to start from
+		min_limit : int
+			The smallest the limit gets
+		max_limit : int
+			The largest the limit gets
+		target_latency : float
+			The most seconds between posting a task and the server acknowledging it, on average, that does not shrink the limit
+		decrease : float
+			The factor the limit is multiplied by when it shrinks, strictly between 0 and 1
+		max_rate, burst
+			See SubmissionWindow
+
+		Raises
+		------
+		ArgumentError: Indicates there was an error with one of the supplied arguments
+		"""
+		for name, value in (('initial', initial), ('min_limit', min_limit), ('max_limit', max_limit)):
+			if not isinstance(value, int) or isinstance(value, bool) or value <= 0:
+				raise ArgumentError("%s must be of type int, must be strictly greater than 0"%name)
+		if not min_limit <= initial <= max_limit:
+			raise ArgumentError("initial must be between min_limit and max_limit")
+		if not isinstance(target_latency, (int, float)) or isinstance(target_latency, bool) or not target_latency > 0:
+			raise ArgumentError("target_latency must be of type float, must be strictly greater than 0")
+		if not isinstance(decrease, float) or not 0 < decrease < 1:
+			raise ArgumentError("decrease must be of type float, must be strictly between 0 and 1")
+		SubmissionWindow.__init__(self, initial, max_rate, burst)
+		self.min_limit = min_limit
+		self.max_limit = max_limit
+		self.target_latency = target_latency
+		self.decrease = decrease
+		self.ack_latency = None
+		self.increases = 0
+		self.decreases = 0
+		self.history = deque(maxlen = AdaptiveWindow.HISTORY_SIZE)
+		# the limit with its fraction, grown by 1/limit per acknowledgement
+		self._limit = float(initial)
+		# the acknowledgements since the limit last shrank, and the tasks in flight when it did: it shrinks again 
+		# once the one reaches the other
+		self._since_decrease = 0
+		self._stale = 0
+		# True until the limit first shrinks, see slow start
+		self._slow_start = True
+		self._acks = 0
+		self._slow_acks = 0
+		self._congestion = 0
+
+	def largest(self):
+		"""
+		Returns the most tasks a single acquire can take, max_limit or the burst of the token bucket
+
+		"""
+		return self.max_limit if self.burst is None else min(self.max_limit, self.burst)
+
+	def acked(self, latency):
+		"""
+		Records the server acknowledging a task, latency seconds after it was posted, and adjusts the limit
+
+		"""
+		with self._lock:
+			self._acks += 1
+			self._since_decrease += 1
+			self.ack_latency = latency if self.ack_latency is None else self.ack_latency + AdaptiveWindow.LATENCY_WEIGHT * (latency - self.ack_latency)
+			if latency > self.target_latency:
+				self._slow_acks += 1
+			# decides on the moving average, so that a single slow acknowledgement does not halve the limit
+			if self.ack_latency > self.target_latency:
+				change = self._shrink("acknowledged in %.3fs on average, over the target of %.3fs"%(self.ack_latency, self.target_latency))
+			elif self.in_flight + self.queued >= self.max_in_flight and self._limit < self.max_limit:
+				# only grows while the limit holds tasks back, or it would grow past what is ever posted
+				self._limit = min(float(self.max_limit), self._limit + (1.0 if self._slow_start else 1.0 / self._limit))
+				change = self._change(int(self._limit), "acknowledged within the target latency")
+			else:
+				change = None
+		self._log(change)
+
+	def congested(self, reason):
+		"""
+		Records the server turning a task away for lack of capacity, and shrinks the limit
+
+		Parameters
+		----------
+		reason : str
+			What the server did, for the history and the log
+		"""
+		with self._lock:
+			self._congestion += 1
+			self._since_decrease += 1
+			change = self._shrink(reason)
+		self._log(change)
+
+	def _shrink(self, reason):
+		"""
+		Private method. Multiplies the limit by decrease, unless the tasks in flight when it last shrank are not all 
+		acknowledged yet. Returns the change, see _change. The lock must be held
+
+		"""
+		if self._since_decrease < self._stale:
+			return None
+		self._since_decrease = 0
+		self._stale = self.in_flight
+		self._slow_start = False
+		self._limit = float(max(self.min_limit, int(self.max_in_flight * self.decrease)))
+		return self._change(int(self._limit), reason)
+
+	def _change(self, limit, reason):
+		"""
+		Private method. Sets the limit, counts and records the change, and wakes the waiting callers if it grew. 
+		Returns the change as a history tuple, None if the limit is unchanged. The lock must be held
+
+		"""
+		old = self.max_in_flight
+		if limit == old:
+			return None
+		self.max_in_flight = limit
+		if limit > old:
+			self.increases += 1
+			self._notify()
+		else:
+			self.decreases += 1
+		change = (monotonic(), old, limit, reason)
+		self.history.append(change)
+		return change
+
+	def _log(self, change):
+		# the limit grows a slot at a time, and shrinks seldom
+		if change is not None:
+			_, old, limit, reason = change
+			logger.log(logging.DEBUG if limit > old else logging.INFO, "submission window limit %d -> %d: %s", old, limit, reason)
+
+	def track_ack(self, ticket):
+		"""
+		Times the acknowledgement of a task just posted, given the future of its TaskTicket: the ticket arriving is 
+		recorded with acked, the post failing with RESOURCE_EXHAUSTED or UNAVAILABLE with congested
+
+		"""
+		start = monotonic()
+		ticket.add_done_callback(lambda done: self._ticket_done(done, start))
+
+	def _ticket_done(self, ticket, start):
+		if ticket.cancelled():
+			return
+		error = ticket.exception()
+		if error is None:
+			self.acked(monotonic() - start)
+		else:
+			code = congestion_code(error)
+			if code is not None:
+				self.congested("PostTask failed with " + code.name)
+
+	def metrics(self):
+		"""
+		Returns the metrics of SubmissionWindow.metrics, max_in_flight being the current limit, and:
+			min_limit 			- the smallest the limit gets
+			max_limit 			- the largest the limit gets
+			target_latency 		- the acknowledgement latency over which the limit shrinks, in seconds
+			ack_latency_s 		- the moving average of the acknowledgement latency, in seconds
+			acks 				- the tasks acknowledged so far
+			slow_acks 			- the tasks acknowledged later than target_latency
+			congestion_events 	- the posts turned away with RESOURCE_EXHAUSTED or UNAVAILABLE
+			limit_increases 	- the number of times the limit grew
+			limit_decreases 	- the number of times the limit shrank
+
+		"""
+		with self._lock:
+			metrics = SubmissionWindow.metrics(self)
+			metrics.update({'min_limit' : self.min_limit, 'max_limit' : self.max_limit, 'target_latency' : self.target_latency,
+							'ack_latency_s' : self.ack_latency, 'acks' : self._acks, 'slow_acks' : self._slow_acks, 
+							'congestion_events' : self._congestion, 'limit_increases' : self.increases, 'limit_decreases' : self.decreases})
+			return metrics
+
+def congestion_code(error):
+	"""
+	Returns the status code of error if it is a gRPC error in CONGESTION_CODES, None otherwise
+
+	"""
+	code = getattr(error, 'code', None)
+	if not callable(code):
+		return None
+	code = code()
+	return code if code in CONGESTION_CODES else None
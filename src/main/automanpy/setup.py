@@ -33,16 +33,19 @@ setup(name = 'automanpy',
 	long_description = ld,
 	long_description_content_type="text/markdown",
 	include_package_data=True,
-	python_requires = '>=2.7.15, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*',
+	python_requires = '>=3.7',
 	install_requires = ['googleapis-common-protos>=1.5.3',
-						'grpcio>=1.13.0',
-						'grpcio-tools>=1.13.0'],
+						'grpcio>=1.32.0',
+						'grpcio-tools>=1.48.0',
+						'protobuf>=4.21.0'],
+	extras_require = {'numpy': ['numpy>=1.17']},
 	classifiers=(
 		"Development Status :: 3 - Alpha",
-		"Programming Language :: Python :: 2.7",
-		"Programming Language :: Python :: 3.4",
-		"Programming Language :: Python :: 3.5",
-		"Programming Language :: Python :: 3.6",
+		"Programming Language :: Python :: 3.7",
+		"Programming Language :: Python :: 3.8",
+		"Programming Language :: Python :: 3.9",
+		"Programming Language :: Python :: 3.10",
+		"Programming Language :: Python :: 3.11",
 		"License :: OSI Approved :: GNU General Public License v2 (GPLv2)",
 		"Operating System :: OS Independent",
 	),
@@ -1,5 +1,7 @@
 package pyautomanlib;
 import edu.umass.cs.automan.adapters.mturk.DSL._;
+import edu.umass.cs.automan.adapters.mturk.mock.MockSetup;
+import edu.umass.cs.automan.core.mock.MockAnswer;
 import edu.umass.cs.automan.core.question.confidence.ConfidenceInterval;
 import edu.umass.cs.automan.core.logging.{LogLevel, LogLevelFatal, LogLevelInfo, LogLevelWarn, LogLevelDebug}
 import edu.umass.cs.automan.core.logging.LogConfig.LogConfig
@@ -7,19 +9,21 @@ import edu.umass.cs.automan.core.MagicNumbers;
 import automanlib_rpc.AutomanTask.TaskType;
 import automanlib_rpc._;
 import automanlib_classes._;
-import scala.concurrent.{ ExecutionContext, Future };
+import scala.concurrent.{ ExecutionContext, Future, Promise };
 import java.util.concurrent.atomic.AtomicBoolean;
-import java.util.concurrent.ConcurrentLinkedQueue;
-import java.util.AbstractQueue;
+import java.util.concurrent.BlockingQueue;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ConcurrentMap;
+import java.util.UUID;
+import scala.util.Random;
 
-class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: AbstractQueue[(String, AutomanTask.TaskType)], 
-					resultMap: ConcurrentMap[String, AnyRef], stopWorker: AtomicBoolean) extends Runnable{
+class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: BlockingQueue[(String, AutomanTask.TaskType)], 
+					resultMap: ConcurrentMap[String, Promise[AnyRef]], stopWorker: AtomicBoolean) extends TaskQueueConsumer{
 	val workerID: String = worker_id;
 	val adapter: AdapterCredentials = adptr;
-	val queue: AbstractQueue[(String, AutomanTask.TaskType)] = workQueue;
-	val map: ConcurrentMap[String, AnyRef] = resultMap;
+	val queue: BlockingQueue[(String, AutomanTask.TaskType)] = workQueue;
+	val stopFlag: AtomicBoolean = stopWorker;
+	val map: ConcurrentMap[String, Promise[AnyRef]] = resultMap;
 
 	var ll = adptr.logLevel;
 	var loglevel : LogLevel = LogLevelInfo()
@@ -44,25 +48,91 @@ class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: Abs
 
 	}
 
-	implicit val mt = mturk (access_key_id = adptr.accessId,
-							secret_access_key = adptr.accessKey,
-							log_verbosity = loglevel,
-							logging = log,
-							sandbox_mode = adptr.adapterOptions("sandbox_mode").toBoolean)
+	// a MOCK adapter runs tasks against AutoMan's mock back-end, whose workers give the answers made by mockAnswers
+	val useMock: Boolean = adptr.adptrType == AdapterCredentials.AdapterType.MOCK;
+	val mockOptions: Map[String, String] = adptr.adapterOptions;
+	val mockRandom: Random = mockOptions.get("seed").map(seed => new Random(seed.toLong)).getOrElse(new Random());
+
+	implicit val mt = if (useMock) {
+							mturk (access_key_id = adptr.accessId,
+									secret_access_key = adptr.accessKey,
+									log_verbosity = loglevel,
+									logging = log,
+									use_mock = MockSetup(budget = BigDecimal(mockOption("budget", 1000.0))))
+						} else {
+							mturk (access_key_id = adptr.accessId,
+									secret_access_key = adptr.accessKey,
+									log_verbosity = loglevel,
+									logging = log,
+									sandbox_mode = adptr.adapterOptions("sandbox_mode").toBoolean)
+						}
 
 	Thread.currentThread().setName("RPC-AutoMan-Worker");
 
-	/** check if there is another job
+	/** Reads a numeric option of the mock adapter
+	*
+	*  	@param name - the option name
+	*	@param default - the value used if the option was not given
+	*	@return the option value
+	*
+	*/
+	def mockOption(name: String, default: Double) : Double = {
+		mockOptions.get(name).map(_.toDouble).getOrElse(default);
+	}
+
+	/** Makes the answers the mock back-end's workers give to a task. The task's own mock_answers 
+	*	are used if it has any, otherwise answers_per_task answers are drawn. Each mock worker drops 
+	*	out (never answers) with probability dropout, and answers latency_s plus up to 
+	*	latency_jitter_s seconds after the task is launched. Returns no answers unless the adapter is a mock
+	*
+	*  	@param task - the task being launched
+	*	@param draw - draws one answer from the configured distribution
+	*	@param parse - parses one of the task's mock_answers
+	*	@return the mock answers for the task
+	*					
+	*/
+	def mockAnswers[T](task: Task, draw: () => T, parse: String => T) : List[MockAnswer[T]] = {
+		if (!useMock) return List();
+		val answers: List[T] = if (task.mockAnswers.nonEmpty) task.mockAnswers.map(parse).toList
+								else List.fill(mockOption("answers_per_task", 30).toInt)(draw());
+		val dropout = mockOption("dropout", 0.0);
+		val latency = mockOption("latency_s", 0.0);
+		val jitter = mockOption("latency_jitter_s", 0.0);
+		answers.filter(_ => mockRandom.nextDouble() >= dropout)
+				.map(answer => MockAnswer(answer, (latency + mockRandom.nextDouble() * jitter).toInt, UUID.randomUUID()));
+	}
+
+	/** Draws a mock answer to an estimate task from a normal distribution
+	*
+	*	@return the estimate a mock worker gives
 	*
-	*  @return Boolean,return true if there is a new task submitted, else return false
-	*							
 	*/
-	def newTaskAvail() : Boolean = {
-		// check if there 
-		if (workQueue.peek() == null){
-			return false;
-		}	
-		return true;
+	def drawEstimate() : Double = {
+		mockOption("estimate_mean", 42.0) + mockOption("estimate_stddev", 1.0) * mockRandom.nextGaussian();
+	}
+
+	/** Draws a mock answer to a task with options, from the weights given in radio_weights. Without 
+	*	weights for any of the task's options, the first option key in sorted order is chosen
+	*
+	*  	@param options - the options of the task
+	*	@return the option a mock worker chooses
+	*
+	*/
+	def drawOption(options: Option[OptionsTuple]) : Symbol = {
+		val keys = options.map(opts => (opts.single.keys ++ opts.double.keys).toList.sorted).getOrElse(List("n/a"));
+		val weights: Map[String, Double] = mockOptions.get("radio_weights").map(_.split(",").filter(_.nonEmpty).map { entry =>
+			val split = entry.lastIndexOf(':');
+			(entry.substring(0, split), entry.substring(split + 1).toDouble)
+		}.toMap).getOrElse(Map());
+		val weighted = keys.filter(key => weights.getOrElse(key, 0.0) > 0);
+		if (weighted.isEmpty) return Symbol(keys.head);
+
+		var pick = mockRandom.nextDouble() * weighted.map(weights(_)).sum;
+		for (key <- weighted) {
+			pick -= weights(key);
+			if (pick < 0) return Symbol(key);
+		}
+		Symbol(weighted.last);
 	}
 
 	/** Launches an AutoMan task and returns the future outcome
@@ -87,17 +157,29 @@ class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: Abs
 		}
 	}
 
-	/** Adds the future outcome to the map so that the thread that submitted task can 
-	*	access the result. If a duplicate key was randomly generated and somehow was not 
-	*	regenerated, this method should throw an exception
+	/** Completes the promise the server registered for the task with the future outcome, 
+	*	so that the rpc call waiting on the task is resolved. The promise is removed from 
+	*	the map, a task is completed once
 	*
-	*  	@param resultKey - the key associated with this outcome
+	*  	@param taskID - the ID of the task this outcome belongs to
 	*  	@param outcome - the future outcome
 	*							
 	*/
 	def addToResultMap(taskID: String, outcome: AnyRef) : Unit = {
-		// add future to map
-		resultMap.put(taskID, outcome);
+		val promise = resultMap.remove(taskID);
+		if (promise != null) promise.trySuccess(outcome);
+	}
+
+	/** Fails the promise the server registered for the task, so that only the rpc call 
+	*	waiting on this task fails
+	*
+	*  	@param taskID - the ID of the task that failed
+	*  	@param cause - why the task failed
+	*							
+	*/
+	def failTask(taskID: String, cause: Throwable) : Unit = {
+		val promise = resultMap.remove(taskID);
+		if (promise != null) promise.tryFailure(cause);
 	}
 
 	/** Makes options from OptionsTuple for tasks that require option choices 
@@ -121,25 +203,21 @@ class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: Abs
 
 	}
 
-	/** Main loops of worker thread. Until server stops worker, 
-	*	fetch task (or wait for one), then launch task
-	*	and add the future outcome to the outcome map
+	/** Launches a task taken off the queue and completes the task's 
+	*	promise with the future outcome. A task that fails to launch, 
+	*	or whose type is not supported yet, fails its own promise and 
+	*	the worker carries on
 	*
+	*	@param taskID - ID of the task
+	*	@param task - the task
 	*							
 	*/
-	def run(){
-		while(!stopWorker.get){
-			if(newTaskAvail()){
-				val taskTuple = workQueue.poll();
-				val taskID: String = taskTuple._1;
-				val task: AutomanTask.TaskType = taskTuple._2;
-				launchTask(taskID, task);
-			}
-			else
-			{
-				Thread.sleep(5000);
-			}
-			
+	def consumeTask(taskID: String, task: AutomanTask.TaskType) : Unit = {
+		try {
+			launchTask(taskID, task);
+			failTask(taskID, new UnsupportedOperationException("task type is not supported by the RPC AutoMan worker yet"));
+		} catch {
+			case e: Exception => failTask(taskID, e);
 		}
 	}
 
@@ -171,7 +249,8 @@ class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: Abs
 								max_value = task.maxValue,
 								min_value = task.minValue,
 								initial_worker_timeout_in_s = task.initialWorkerTimeoutInS,
-								question_timeout_multiplier = task.questionTimeoutMultiplier);
+								question_timeout_multiplier = task.questionTimeoutMultiplier,
+								mock_answers = mockAnswers[Double](task, () => drawEstimate(), _.toDouble));
 		addToResultMap(taskID,outcome);
 	}
 
@@ -235,7 +314,8 @@ class AutomanWorker(worker_id: String, adptr: AdapterCredentials, workQueue: Abs
 								wage = task.wage,
 								confidence = task.confidence, 
 								initial_worker_timeout_in_s = task.initialWorkerTimeoutInS,
-								question_timeout_multiplier = task.questionTimeoutMultiplier);
+								question_timeout_multiplier = task.questionTimeoutMultiplier,
+								mock_answers = mockAnswers[Symbol](task, () => drawOption(task.options), Symbol(_)));
 		addToResultMap(taskID,outcome);
 	}
 
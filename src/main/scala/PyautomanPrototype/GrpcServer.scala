@@ -16,12 +16,14 @@
 package pyautomanlib;
 
 import io.grpc.{ Server, ServerBuilder, ServerServiceDefinition }
+import io.grpc.netty.NettyServerBuilder
+import io.netty.channel.epoll.{ EpollEventLoopGroup, EpollServerDomainSocketChannel }
+import io.netty.channel.unix.DomainSocketAddress
 
 trait GrpcServer {
 	private[this] var server :Server = null;
   private[this] var status :Int = 0;
   private[this] var running_status: Boolean = false;
-  private[this] val poolSize: Int = 1;
 
   def start_server(): Unit = {
     server.start()
@@ -36,12 +38,31 @@ trait GrpcServer {
     running_status = false;
   	server.shutdown()
   }
-  def runServer(ssd: ServerServiceDefinition, port: Int): Unit = {
-    server = ServerBuilder
-      .forPort(port)
-      .addService(ssd)
-      .build
-      .start
+  /** runs the server until it is stopped
+  *
+  *  @param ssd - the service to serve
+  *  @param port - the TCP port to listen on, if socketPath is not set
+  *  @param socketPath - if set, the path of a Unix domain socket to listen on instead of a TCP port. Needs
+  *           Netty's native epoll transport, so Linux only, and x86_64 only as built, see build.sbt
+  */
+  def runServer(ssd: ServerServiceDefinition, port: Int, socketPath: Option[String] = None): Unit = {
+    server = socketPath match {
+      case Some(path) =>
+        NettyServerBuilder
+          .forAddress(new DomainSocketAddress(path))
+          .channelType(classOf[EpollServerDomainSocketChannel])
+          .bossEventLoopGroup(new EpollEventLoopGroup(1))
+          .workerEventLoopGroup(new EpollEventLoopGroup())
+          .addService(ssd)
+          .build
+          .start
+      case None =>
+        ServerBuilder
+          .forPort(port)
+          .addService(ssd)
+          .build
+          .start
+    }
 
     // make sure our server is stopped when jvm is shut down
     Runtime.getRuntime.addShutdownHook(new Thread() {
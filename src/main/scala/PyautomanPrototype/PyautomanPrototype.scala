@@ -4,72 +4,226 @@ import automanlib_rpc._;
 import automanlib_rpc.AutomanTask.TaskType;
 import automanlib_rpc.AutomanOutcome;
 import automanlib_classes._;
-import scala.concurrent.{ ExecutionContext, Future };
-import java.util.concurrent.{Executors, ExecutorService, ConcurrentLinkedQueue, ConcurrentHashMap, ConcurrentMap}
-import java.util.concurrent.atomic.AtomicBoolean;
-import java.util.{AbstractQueue, UUID};
+import scala.concurrent.{ ExecutionContext, Future, Promise, blocking };
+import io.grpc.{ Status, StatusRuntimeException };
+import io.grpc.stub.StreamObserver;
+import java.util.concurrent.{Executors, ExecutorService, ScheduledExecutorService, TimeUnit, BlockingQueue, LinkedBlockingQueue, ConcurrentHashMap, ConcurrentMap}
+import java.util.concurrent.atomic.{AtomicBoolean, AtomicLong, AtomicReference};
+import java.util.UUID;
 
 object PyautomanPrototypeServicer extends GrpcServer{ self => 
 	Thread.currentThread().setName("RPC-AutoMan-Server");
-	private class PyautomanServicer extends PyautomanPrototypeGrpc.PyautomanPrototype {	
-		val taskQueue: AbstractQueue[(String, AutomanTask.TaskType)] = new ConcurrentLinkedQueue;
-		val answerMap: ConcurrentMap[String, AnyRef] = new ConcurrentHashMap;
-		val workerPool: ExecutorService = Executors.newSingleThreadExecutor();
+	/** the rpc service
+	*
+	*  @param poolSize - the number of Automan workers launching tasks from the shared task queue
+	*  @param idleTtl - if non-negative, the server runs as a daemon shared by client sessions, and shuts down
+	*					once it has had no open session for idleTtl ms
+	*/
+	private class PyautomanServicer(poolSize: Int, idleTtl: Long) extends PyautomanPrototypeGrpc.PyautomanPrototype {	
+		// the Automan workers block on this queue, and the first idle one wakes as soon as a task is added
+		val taskQueue: BlockingQueue[(String, AutomanTask.TaskType)] = new LinkedBlockingQueue;
+		// one promise per queued task, completed by the Automan worker when it launches the task
+		val promiseMap: ConcurrentMap[String, Promise[AnyRef]] = new ConcurrentHashMap;
+		val workerPool: ExecutorService = Executors.newFixedThreadPool(poolSize);
 		var stopWorkers: AtomicBoolean = new AtomicBoolean(false);
-		val pollFrequency: Int = 6000;
+		// the adapter the workers were started with, null until the first one is registered
+		val workersAdapter: AtomicReference[AdapterCredentials] = new AtomicReference;
+		// a task's deadline is (timeout * 6 + 10) periods of deadlinePeriod ms, the bound the server used to poll for
+		val deadlinePeriod: Long = 6000;
+		val deadlineTimer: ScheduledExecutorService = Executors.newSingleThreadScheduledExecutor();
+		// responses of tasks queued with postTask whose outcome is not delivered yet
+		val postedTasks: ConcurrentMap[String, Future[TaskResponse]] = new ConcurrentHashMap;
+		// the ms a resolved posted task is kept for a client to watch it, after which the client is taken to have gone away
+		val postedTtl: Long = 600000;
+		// turns launched tasks into responses. Reading an AutoMan answer blocks until the task is resolved
+		val taskContext: ExecutionContext = ExecutionContext.fromExecutorService(Executors.newCachedThreadPool());
+		// open client sessions, and the time in ms each one expires unless it is renewed
+		val sessions: ConcurrentMap[String, java.lang.Long] = new ConcurrentHashMap;
+		val sessionLease: Long = 30000;
+		// the last time in ms the server had an open session
+		val lastSession: AtomicLong = new AtomicLong(System.currentTimeMillis());
+		val shuttingDown: AtomicBoolean = new AtomicBoolean(false);
+
+		if (idleTtl >= 0) {
+			deadlineTimer.scheduleAtFixedRate(new Runnable {
+				def run() : Unit = expireSessions();
+			}, 1, 1, TimeUnit.SECONDS);
+		}
 
 
 		Thread.currentThread().setName("RPC-AutoMan-Server-Thread");
 
-		/** rpc method used by client to submit a task to Automan.
+		/** rpc method used by client to submit a task to Automan. No thread waits on the task, the call 
+		*	completes when the task's promise does
 		*
 		*  @param automanTask - submitted task
 		*  @return a new future TaskRespone instance with the outcome of the task. Check for any errors
 		*				set in "return_code" field. If field is valid then outcome is valid, else
-		*				an error occured
+		*				an error occured. If the task is not resolved before its deadline, the call 
+		*				fails with status DEADLINE_EXCEEDED
 		*							
 		*/
 		def submitTask(automanTask: AutomanTask) : Future[TaskResponse] = {
 			val task_id : String = java.util.UUID.randomUUID.toString;
-			val response = executeTask(taskId = task_id, task=automanTask);
-			Future.successful(response);
+			enqueueTask(task_id, automanTask).recover { 
+				case e: Throwable if !e.isInstanceOf[StatusRuntimeException] => exceptionResponse(e);
+			}(taskContext)
 		}
 
-		/** waits on the result specified by ID. This method calculates the max number of checks (plus a few extra) to make
-		*	based on the specified question timeout for the task. For example, if the user made a task with a question timeout
-		*	multiplier of 5 (minutes), and our pollFrequency is 6000 (6 seconds), then we should perform a max of 
-		*	(5*60*1000/6000) + 10 = 60 checks. If we don't see a response, we need to send back an error (worker probably crashed)
+		/** rpc method used by client to submit many tasks over one bidirectional stream. Each chunk of tasks is 
+		*	acknowledged as soon as it is queued, and each task's response is sent down the stream as soon as 
+		*	it is resolved. The stream is completed once the client has closed its side and every task is resolved
 		*
-		*  @param task - submitted task
-		*  @return the Future outcome returned by AutoMan for this task ID
+		*  @param responseObserver - the stream to send TaskResponseBatches down
+		*  @return the stream observer that receives the TaskBatches sent by the client
 		*							
 		*/
-		def waitOnResult(id: String, timeout_seconds: Int) : AnyRef = {
-			var wait_count : Int = 0;
-			val max_checks = (timeout_seconds * pollFrequency/1000) + 10;
-			while(answerMap.get(id) == null)
-			{
-				Thread.sleep(pollFrequency);
-				wait_count = wait_count + 1;
-				if (wait_count > max_checks){
-					println("ERROR: Server timed out waiting for response to task. Worker Thread may have crashed. Server terminating.. ");
-					System.exit(1);
+		def submitTasks(responseObserver: StreamObserver[TaskResponseBatch]) : StreamObserver[TaskBatch] = {
+			val responses = new ResponseStream(responseObserver);
+			new StreamObserver[TaskBatch] {
+				def onNext(batch: TaskBatch) : Unit = {
+					responses.expect(batch.tasks.size);
+					responses.send(TaskResponseBatch(responses = batch.tasks.map(task => TaskResponse().withTaskId(task.taskId)
+																							.withReturnCode(TaskResponse.TaskReturnCode.ACCEPTED))));
+					batch.tasks.foreach { task =>
+						val task_id : String = java.util.UUID.randomUUID.toString;
+						resolveTask(enqueueTask(task_id, task)).foreach { response =>
+							responses.answer(TaskResponseBatch(responses = Seq(response.withTaskId(task.taskId))));
+						}(taskContext)
+					}
 				}
+
+				// the client went away, its tasks are left to run but their responses are dropped
+				def onError(t: Throwable) : Unit = responses.cancel();
+
+				def onCompleted() : Unit = responses.inputCompleted();
 			}
-			
-			return answerMap.remove(id);
 		}
 
-		/** submits an estimate task to Automan worker
+		/** rpc method used by client to queue a task without waiting on its outcome. The outcome is 
+		*	collected with watchOutcomes. A task whose outcome is not delivered within postedTtl ms of 
+		*	it being resolved is dropped, so tasks posted by a client that went away do not pile up
 		*
+		*  @param automanTask - submitted task
+		*  @return a TaskTicket holding the ID assigned to the task
+		*							
+		*/
+		def postTask(automanTask: AutomanTask) : Future[TaskTicket] = {
+			val task_id : String = java.util.UUID.randomUUID.toString;
+			val response = enqueueTask(task_id, automanTask);
+			postedTasks.put(task_id, response);
+			// a watched task is delivered when it is resolved, one still posted after postedTtl was not watched 
+			// on any open stream
+			response.onComplete { _ =>
+				if (!shuttingDown.get) {
+					deadlineTimer.schedule(new Runnable {
+						def run() : Unit = postedTasks.remove(task_id, response);
+					}, postedTtl, TimeUnit.MILLISECONDS);
+				}
+			}(taskContext);
+			Future.successful(TaskTicket(taskId = task_id));
+		}
+
+		/** rpc method used by client to watch the outcomes of tasks queued with postTask. The response of each 
+		*	watched task is pushed down the stream the moment the task is resolved. The stream is completed once 
+		*	the client has closed its side and every watched task is resolved. A task stays posted until its 
+		*	response is sent, so a client whose stream broke can watch it again on a new stream
+		*
+		*  @param responseObserver - the stream to send TaskResponses down
+		*  @return the stream observer that receives the TaskTickets sent by the client
+		*							
+		*/
+		def watchOutcomes(responseObserver: StreamObserver[TaskResponse]) : StreamObserver[TaskTicket] = {
+			val responses = new ResponseStream(responseObserver);
+			new StreamObserver[TaskTicket] {
+				def onNext(ticket: TaskTicket) : Unit = {
+					responses.expect(1);
+					val response = postedTasks.get(ticket.taskId);
+					if (response == null) {
+						responses.answer(TaskResponse().withTaskId(ticket.taskId)
+													.withReturnCode(TaskResponse.TaskReturnCode.ERROR)
+													.withErrCode(TaskResponse.ErrorCode.UNKNOWN_TASK_ID)
+													.withErrMsg("no task was posted with ID "+ticket.taskId+", or its outcome is already delivered"));
+					} else {
+						resolveTask(response).foreach { resolved =>
+							if (responses.answer(resolved.withTaskId(ticket.taskId))) postedTasks.remove(ticket.taskId, response);
+						}(taskContext)
+					}
+				}
+
+				// the client went away, its tasks are left to run but their responses are dropped
+				def onError(t: Throwable) : Unit = responses.cancel();
+
+				def onCompleted() : Unit = responses.inputCompleted();
+			}
+		}
+
+		/** turns the failure of a queued task into a response, for streaming calls which answer every task 
+		*	with a TaskResponse rather than a status
+		*
+		*  @param response - the future TaskResponse of a queued task
+		*  @return the future TaskResponse, with an ERROR response if the task timed out and an EXCEPTION 
+		*				response if it failed
+		*							
+		*/
+		def resolveTask(response: Future[TaskResponse]) : Future[TaskResponse] = {
+			response.recover { 
+				case e: StatusRuntimeException if e.getStatus.getCode == Status.Code.DEADLINE_EXCEEDED =>
+					TaskResponse().withReturnCode(TaskResponse.TaskReturnCode.ERROR)
+								.withErrCode(TaskResponse.ErrorCode.TASK_TIMED_OUT)
+								.withErrMsg(String.valueOf(e.getStatus.getDescription));
+				case e: Throwable => exceptionResponse(e);
+			}(taskContext)
+		}
+
+		/** makes the EXCEPTION response for a task that failed
+		*
+		*  @param e - why the task failed
+		*  @return a new TaskResponse with the exception message set
+		*							
+		*/
+		def exceptionResponse(e: Throwable) : TaskResponse = {
+			TaskResponse().withReturnCode(TaskResponse.TaskReturnCode.EXCEPTION).withExcepMsg(String.valueOf(e.getMessage));
+		}
+
+		/** queues a task for the Automan worker to launch. The task gets its own promise, which the worker 
+		*	completes with the AutoMan outcome (or fails if launching the task failed), and its own deadline. 
+		*	A task that misses its deadline fails only its own future, with status DEADLINE_EXCEEDED
+		*
+		*  @param taskId - the ID of the task
 		*  @param task - submitted task
+		*  @return the future TaskResponse of the task. Does not block
+		*							
+		*/
+		def enqueueTask(taskId: String, task : AutomanTask) : Future[TaskResponse] = {
+			val launched = Promise[AnyRef]();
+			promiseMap.put(taskId, launched);
+			taskQueue.add((taskId, task.taskType));
+
+			val response = Promise[TaskResponse]();
+			val deadline = (task.timeout.toLong * 6 + 10) * deadlinePeriod;
+			val timer = deadlineTimer.schedule(new Runnable {
+				def run() : Unit = {
+					// the worker may still launch the task later, its outcome is then dropped
+					promiseMap.remove(taskId);
+					response.tryFailure(Status.DEADLINE_EXCEEDED.withDescription("task "+taskId+" was not resolved within "+deadline/1000+" seconds")
+														.asRuntimeException());
+				}
+			}, deadline, TimeUnit.MILLISECONDS);
+			response.tryCompleteWith(launched.future.map { automan_outcome => blocking { makeResponse(task, automan_outcome) } }(taskContext));
+			response.future.onComplete { _ => timer.cancel(false) }(taskContext);
+			response.future;
+		}
+
+		/** makes the response to a task from the outcome AutoMan returned for it. This method blocks until 
+		*	AutoMan resolves the task
+		*
+		*  @param task - the launched task
+		*  @param automan_outcome - the outcome returned by AutoMan when the task was launched
 		*  @return a new TaskResponse representing the outcome of the task. 
 		*							
 		*/
-		def executeTask(taskId: String, task : AutomanTask) : TaskResponse = {	
-			val timeout = task.timeout;
-			taskQueue.add((taskId, task.taskType))
-			val automan_outcome = waitOnResult(taskId, timeout)
+		def makeResponse(task : AutomanTask, automan_outcome : AnyRef) : TaskResponse = {
 			val outcome = task.taskType match{
 				case TaskType.Estimate(etask)		=> 	makeEstimateOutcome(automan_outcome.asInstanceOf[EstimationOutcome]);
 				case TaskType.Multiestimate(metask) => 	makeMultiEstimateOutcome(automan_outcome.asInstanceOf[MultiEstimationOutcome]);
@@ -230,18 +384,25 @@ object PyautomanPrototypeServicer extends GrpcServer{ self =>
 			//TODO
 			return AutomanOutcome()
 		}
-		/** rpc method used by client to register an adapter with one of the worker threads.
+		/** rpc method used by client to register an adapter with the worker threads. The first adapter 
+		*	registered starts poolSize Automan workers, each with its own instance of the adapter, which 
+		*	take tasks from the shared task queue. Later registrations of the same adapter reuse the running 
+		*	workers, and a different adapter is refused, as its tasks would be posted with the first one's account
 		*
 		*  @param automanTask - submitted AdapterCredentials
-		*  @return a new ServerStatusResponse indicating whether the credentials were added successfully or not
+		*  @return a new ServerStatusResponse, SUCCESS if the workers run the adapter, FAILED if they run another one
 		*							
 		*/
 		def registerAdapter(adapter: AdapterCredentials) : Future[ServerStatusResponse] = {
 			// add error checking for execute
-			workerPool.execute(new AutomanWorker(worker_id= "wrkr-1", adptr= adapter,stopWorker= stopWorkers,
-												 workQueue= taskQueue, resultMap= answerMap));
-			var ssr: ServerStatusResponse = ServerStatusResponse().withReturnCode(ServerStatusResponse.StatReturnCode.SUCCESS)
-			Future.successful(ssr);
+			if (workersAdapter.compareAndSet(null, adapter)) {
+				for (i <- 1 to poolSize) {
+					workerPool.execute(new AutomanWorker(worker_id= "wrkr-"+i, adptr= adapter,stopWorker= stopWorkers,
+														 workQueue= taskQueue, resultMap= promiseMap));
+				}
+			}
+			val code = if (workersAdapter.get == adapter) ServerStatusResponse.StatReturnCode.SUCCESS else ServerStatusResponse.StatReturnCode.FAILED;
+			Future.successful(ServerStatusResponse().withReturnCode(code));
 		}
 
 		/** Report the status of the server
@@ -265,24 +426,93 @@ object PyautomanPrototypeServicer extends GrpcServer{ self =>
 		*							
 		*/
 		def killServer(e: Empty) : Future[ServerStatusResponse] = {
-			println("Server Shutting Down..")
-			stopWorkers.set(true);
-			workerPool.shutdown();
-			self.stop_server();
+			shutdown();
 			Future.successful(ServerStatusResponse().withReturnCode(ServerStatusResponse.StatReturnCode.KILLED));
 		}
 
+		/** rpc method used by a client to open a session on the server, or renew it. A session lasts 
+		*	sessionLease ms unless it is renewed
+		*
+		*  @param session - the session to open
+		*  @return a new SessionResponse, KILLED if the server is shutting down
+		*							
+		*/
+		def openSession(session: Session) : Future[SessionResponse] = sessions.synchronized {
+			if (shuttingDown.get) {
+				Future.successful(sessionResponse(ServerStatusResponse.StatReturnCode.KILLED));
+			} else {
+				sessions.put(session.sessionId, System.currentTimeMillis() + sessionLease);
+				lastSession.set(System.currentTimeMillis());
+				Future.successful(sessionResponse(ServerStatusResponse.StatReturnCode.SUCCESS));
+			}
+		}
+
+		/** rpc method used by a client to close its session
+		*
+		*  @param session - the session to close
+		*  @return a new SessionResponse
+		*							
+		*/
+		def closeSession(session: Session) : Future[SessionResponse] = sessions.synchronized {
+			sessions.remove(session.sessionId);
+			lastSession.set(System.currentTimeMillis());
+			Future.successful(sessionResponse(ServerStatusResponse.StatReturnCode.SUCCESS));
+		}
+
+		def sessionResponse(code: ServerStatusResponse.StatReturnCode) : SessionResponse = {
+			SessionResponse(returnCode = code, sessions = sessions.size, leaseSeconds = (sessionLease / 1000).toInt);
+		}
+
+		/** Runs every second on a daemon server. Drops the sessions whose lease ran out, and shuts the 
+		*	server down once it has had no open session for idleTtl ms
+		*
+		*/
+		def expireSessions() : Unit = sessions.synchronized {
+			val now = System.currentTimeMillis();
+			val it = sessions.entrySet().iterator();
+			while (it.hasNext) {
+				if (it.next().getValue < now) it.remove();
+			}
+			if (!sessions.isEmpty) {
+				lastSession.set(now);
+			} else if (now - lastSession.get >= idleTtl) {
+				println("No client sessions for "+idleTtl/1000+" seconds");
+				shutdown();
+			}
+		}
+
+		/** Stop the workers and the gRPC server
+		*
+		*/
+		def shutdown() : Unit = {
+			if (shuttingDown.compareAndSet(false, true)) {
+				println("Server Shutting Down..")
+				stopWorkers.set(true);
+				workerPool.shutdown();
+				deadlineTimer.shutdownNow();
+				self.stop_server();
+			}
+		}
+
 	}
 
-	def main(args: Array[String]) : Unit = {
+	def main(allArgs: Array[String]) : Unit = {
 		// add argument parsing
+		// "--socket PATH" listens on a Unix domain socket instead of the port
+		val socketAt = allArgs.indexOf("--socket");
+		val socketPath = if (socketAt >= 0 && socketAt + 1 < allArgs.length) Some(allArgs(socketAt + 1)) else None;
+		val args = if (socketAt >= 0) allArgs.patch(socketAt, Nil, 2) else allArgs;
 		var localport = 50051;
 		var poolSize = 1;
+		// in seconds, negative unless the server runs as a daemon
+		var idleTtl = -1L;
 		if(args.length >= 1) localport = args(0).toInt;
-		if(args.length >= 2) poolSize = args(1).toInt;
-		val ssdef = PyautomanPrototypeGrpc.bindService(new PyautomanServicer(), ExecutionContext.global);
-		println("Server Started on port "+localport+" ...");
+		if(args.length >= 2) poolSize = math.max(1, args(1).toInt);
+		if(args.length >= 3) idleTtl = math.max(0L, args(2).toLong);
+		val ssdef = PyautomanPrototypeGrpc.bindService(new PyautomanServicer(poolSize, if (idleTtl >= 0) idleTtl * 1000 else -1L), ExecutionContext.global);
+		println("Server Started on "+socketPath.map("socket "+_).getOrElse("port "+localport)+" ...");
 		println("Worker poolsize: "+poolSize);
-		runServer(ssd = ssdef, port = localport);
+		if(idleTtl >= 0) println("Daemon, shuts down after "+idleTtl+" seconds without client sessions");
+		runServer(ssd = ssdef, port = localport, socketPath = socketPath);
 	}
 }
\ No newline at end of file
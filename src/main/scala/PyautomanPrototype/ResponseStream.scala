@@ -0,0 +1,71 @@
+package pyautomanlib;
+import io.grpc.StatusRuntimeException;
+import io.grpc.stub.StreamObserver;
+import java.util.concurrent.atomic.{AtomicBoolean, AtomicInteger};
+
+/** Serializes the responses of a streaming rpc call onto its response observer, which is not thread safe, 
+*	and completes the observer once the client has closed its side and every expected response was sent.
+*
+*  @param observer - the response observer of the call
+*/
+class ResponseStream[T](observer: StreamObserver[T]) {
+	private[this] val outstanding: AtomicInteger = new AtomicInteger(0);
+	private[this] val inputDone: AtomicBoolean = new AtomicBoolean(false);
+	private[this] val completed: AtomicBoolean = new AtomicBoolean(false);
+
+	/** registers that n more responses will be sent before the stream can be completed
+	*
+	*  @param n - the number of responses
+	*/
+	def expect(n: Int) : Unit = {
+		outstanding.addAndGet(n);
+	}
+
+	/** sends a message that does not answer an expected response, e.g an acknowledgement
+	*
+	*  @param message - the message to send
+	*  @return true if the message was handed to the stream, false if the client went away
+	*/
+	def send(message: T) : Boolean = synchronized {
+		if (completed.get) {
+			false;
+		} else {
+			try {
+				observer.onNext(message);
+				true;
+			} catch {
+				// the call was cancelled before onError reached the request observer
+				case e: StatusRuntimeException => completed.set(true); false;
+			}
+		}
+	}
+
+	/** sends one of the expected responses, and completes the stream if it was the last one
+	*
+	*  @param message - the response to send
+	*  @return true if the response was handed to the stream, false if the client went away
+	*/
+	def answer(message: T) : Boolean = {
+		val sent = send(message);
+		outstanding.decrementAndGet();
+		completeIfDone();
+		sent;
+	}
+
+	/** called when the client closed its side of the stream
+	*/
+	def inputCompleted() : Unit = {
+		inputDone.set(true);
+		completeIfDone();
+	}
+
+	/** called when the client went away, any responses still to be sent are dropped
+	*/
+	def cancel() : Unit = {
+		completed.set(true);
+	}
+
+	private[this] def completeIfDone() : Unit = synchronized {
+		if (inputDone.get && outstanding.get == 0 && completed.compareAndSet(false, true)) observer.onCompleted();
+	}
+}
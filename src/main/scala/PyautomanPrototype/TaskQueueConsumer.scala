@@ -0,0 +1,43 @@
+package pyautomanlib;
+import automanlib_rpc.AutomanTask;
+import java.util.concurrent.{BlockingQueue, TimeUnit};
+import java.util.concurrent.atomic.AtomicBoolean;
+
+/** The loop of a worker thread that takes tasks off the server's task queue. The thread blocks on the
+*	queue while it is empty, and wakes the moment a task is enqueued. While idle it wakes every
+*	idleCheckMillis to check whether the server stopped the worker, so it exits within that time once
+*	stopFlag is set, or right away if its thread is interrupted.
+*/
+trait TaskQueueConsumer extends Runnable {
+	/** the queue of (task ID, task) tuples the server adds submitted tasks to */
+	val queue: BlockingQueue[(String, AutomanTask.TaskType)];
+	/** set by the server to stop the worker */
+	val stopFlag: AtomicBoolean;
+	/** the longest an idle worker goes without checking stopFlag */
+	val idleCheckMillis: Long = 500;
+
+	/** handles a task taken off the queue. Runs on the worker thread
+	*
+	*	@param taskID - ID of the task
+	*	@param task - the task
+	*
+	*/
+	def consumeTask(taskID: String, task: AutomanTask.TaskType) : Unit;
+
+	/** Main loop of worker thread. Until server stops worker,
+	*	wait for a task, then hand it to consumeTask
+	*
+	*
+	*/
+	def run() : Unit = {
+		try {
+			while(!stopFlag.get){
+				val taskTuple = queue.poll(idleCheckMillis, TimeUnit.MILLISECONDS);
+				if (taskTuple != null) consumeTask(taskTuple._1, taskTuple._2);
+			}
+		} catch {
+			// the worker pool was shut down now, exit quietly
+			case e: InterruptedException => Thread.currentThread().interrupt();
+		}
+	}
+}